@@ -112,6 +112,16 @@ class AnalysisEngine:
         )
     }
     
+    # Region statistics are reduced at REDUCE_SCALE metres over at most
+    # REDUCE_MAX_PIXELS pixels; bestEffort coarsens the scale beyond that, and
+    # tileScale splits the server-side work into smaller tiles. A reduction
+    # still failing (typically out of memory) is retried once at
+    # REDUCE_RETRY_TILE_SCALE
+    REDUCE_SCALE = 1000
+    REDUCE_MAX_PIXELS = int(1e10)
+    REDUCE_TILE_SCALE = 4
+    REDUCE_RETRY_TILE_SCALE = 8
+    
     def __init__(self, data_manager: DataManager):
         """
         Initialize AnalysisEngine
@@ -190,12 +200,7 @@ class AnalysisEngine:
                     final_result = result
                 
                 # Calculate mean value for year
-                mean_val = result.reduceRegion(
-                    reducer=ee.Reducer.mean(),
-                    geometry=geometry,
-                    scale=1000,
-                    maxPixels=1e9
-                ).getInfo()
+                mean_val = self._reduce_region(result, ee.Reducer.mean(), geometry)
                 
                 # Get the first value (there should only be one)
                 value = next(iter(mean_val.values()), None)
@@ -215,12 +220,7 @@ class AnalysisEngine:
             # Try to calculate better min/max values from the data
             try:
                 # Use percentile stretch for better visualization
-                stats = final_result.reduceRegion(
-                    reducer=ee.Reducer.percentile([2, 98]),
-                    geometry=geometry,
-                    scale=1000,
-                    maxPixels=1e9
-                ).getInfo()
+                stats = self._reduce_region(final_result, ee.Reducer.percentile([2, 98]), geometry)
                 
                 # Extract percentile values
                 band_keys = list(stats.keys())
@@ -239,8 +239,37 @@ class AnalysisEngine:
         
         return results
     
+    def _reduce_region(self, image: ee.Image, reducer: ee.Reducer,
+                       geometry: ee.Geometry) -> Dict[str, Any]:
+        """
+        Reduce an image over a region and fetch the result
+        
+        Args:
+            image: Earth Engine image
+            reducer: Reducer to apply
+            geometry: Region to reduce over
+            
+        Returns:
+            Dictionary of reduced values by output name
+        """
+        def reduce(tile_scale):
+            return image.reduceRegion(
+                reducer=reducer,
+                geometry=geometry,
+                scale=self.REDUCE_SCALE,
+                maxPixels=self.REDUCE_MAX_PIXELS,
+                bestEffort=True,
+                tileScale=tile_scale
+            ).getInfo()
+        
+        try:
+            return reduce(self.REDUCE_TILE_SCALE)
+        except ee.EEException:
+            return reduce(self.REDUCE_RETRY_TILE_SCALE)
+    
     def _calculate_index(self, geometry: ee.Geometry, start_date: str, 
-                       end_date: str, dataset: str, index: str) -> ee.Image:
+                       end_date: str, dataset: str, index: str,
+                       check_empty: bool = True) -> ee.Image:
         """
         Calculate climate index for a specific date range
         
@@ -250,6 +279,7 @@ class AnalysisEngine:
             end_date: End date in YYYY-MM-DD format
             dataset: Dataset name
             index: Index name
+            check_empty: Verify the date range has data (one Earth Engine round trip)
             
         Returns:
             Earth Engine image with calculated index
@@ -262,7 +292,8 @@ class AnalysisEngine:
             dataset_name=dataset,
             start_date=start_date,
             end_date=end_date,
-            geometry=geometry
+            geometry=geometry,
+            check_empty=check_empty
         )
         
         # Calculate index based on category
@@ -273,6 +304,47 @@ class AnalysisEngine:
         else:
             raise ValueError(f"Unknown index category: {index_info.category}")
     
+    def _calculate_yearly_index_collection(self, geometry: ee.Geometry, years: List[int],
+                                           dataset: str, index: str) -> ee.ImageCollection:
+        """
+        Calculate a climate index for several years in one server-side expression
+        
+        The years are mapped with ee.List.sequence-style server-side iteration
+        instead of a Python loop, so the whole range is a single computation
+        graph regardless of how many years it covers.
+        
+        Args:
+            geometry: Earth Engine geometry defining the region
+            years: Years to calculate, in ascending order
+            dataset: Dataset name
+            index: Index name
+            
+        Returns:
+            ImageCollection with one clipped image per year (property 'year')
+        """
+        index_info = self.AVAILABLE_INDICES[index]
+        if index_info.category == IndexCategory.PRECIPITATION:
+            calculate = self._calculate_precipitation_index
+        elif index_info.category == IndexCategory.TEMPERATURE:
+            calculate = self._calculate_temperature_index
+        else:
+            raise ValueError(f"Unknown index category: {index_info.category}")
+        
+        # One collection for the whole range, split into years on the server
+        collection = self.data_manager.get_ee_collection(
+            dataset_name=dataset,
+            start_date=f"{min(years)}-01-01",
+            end_date=f"{max(years) + 1}-01-01",
+            geometry=geometry,
+            check_empty=False
+        )
+        
+        def year_image(year):
+            year_collection = collection.filter(ee.Filter.calendarRange(year, year, 'year'))
+            return calculate(year_collection, dataset, index).clip(geometry).set('year', year)
+        
+        return ee.ImageCollection(ee.List(years).map(year_image))
+    
     def _calculate_precipitation_index(self, collection: ee.ImageCollection, 
                                     dataset: str, index: str) -> ee.Image:
         """
@@ -13,6 +13,10 @@ from IPython.display import display, clear_output
 class AuthenticationManager:
     """Manages Earth Engine authentication for climate analysis tool"""
     
+    # Earth Engine endpoint for high volumes of programmatic requests (many
+    # reduceRegion/getInfo calls); it trades response caching for throughput
+    HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+    
     def __init__(self):
         """Initialize authentication manager"""
         self.project_id = None
@@ -51,16 +55,25 @@ class AuthenticationManager:
             print(f"Error saving credentials: {str(e)}")
             return False
     
-    def initialize_ee(self, project_id=None):
-        """Initialize Earth Engine with project ID"""
+    def initialize_ee(self, project_id=None, high_volume=False):
+        """
+        Initialize Earth Engine with project ID
+        
+        Args:
+            project_id: Optional Earth Engine project ID
+            high_volume: Send requests to the high-volume endpoint
+                (HIGH_VOLUME_URL) instead of the default one
+        """
         if project_id:
             self.project_id = project_id
-            
+        
+        kwargs = {'opt_url': self.HIGH_VOLUME_URL} if high_volume else {}
+        
         try:
             if self.project_id:
-                ee.Initialize(project=self.project_id)
+                ee.Initialize(project=self.project_id, **kwargs)
             else:
-                ee.Initialize()
+                ee.Initialize(**kwargs)
             self.auth_status = "Authenticated"
             self.save_credentials()
             return True
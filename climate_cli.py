@@ -96,7 +96,7 @@ class CliTool:
         
         # Export command
         export_parser = subparsers.add_parser("export", help="Export analysis results")
-        export_parser.add_argument("format", choices=["GeoTIFF", "CSV", "NetCDF"], help="Export format")
+        export_parser.add_argument("format", choices=["GeoTIFF", "CSV", "NetCDF", "Parquet", "Feather"], help="Export format")
         export_parser.add_argument("type", choices=["current", "all"], help="Export current view or all data")
         export_parser.add_argument("--input", help="Path to input JSON file with analysis results")
         
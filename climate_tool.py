@@ -519,11 +519,11 @@ class ClimateAnalysisTool:
                     right_widgets["step5"].children[0].value = left_widgets["step5"].children[0].value
                 
                 # Update status with success message and details
-                has_bounds = "left_bounds" in self.geometry_manager.geometries
-                bounds_info = ""
-                if has_bounds:
-                    bounds = self.geometry_manager.geometries["left_bounds"]
+                try:
+                    bounds = self.geometry_manager.get_bounds("left")
                     bounds_info = f"<br>Bounds copied: [{bounds.min_lon:.2f}, {bounds.min_lat:.2f}, {bounds.max_lon:.2f}, {bounds.max_lat:.2f}]"
+                except ValueError:
+                    bounds_info = ""
                     
                 status_display.value = f"<p><em style='color: green'>Settings copied from left to right!{bounds_info}</em></p>"
                 
@@ -564,11 +564,11 @@ class ClimateAnalysisTool:
                     left_widgets["step5"].children[0].value = right_widgets["step5"].children[0].value
                 
                 # Update status with success message and details
-                has_bounds = "right_bounds" in self.geometry_manager.geometries
-                bounds_info = ""
-                if has_bounds:
-                    bounds = self.geometry_manager.geometries["right_bounds"]
+                try:
+                    bounds = self.geometry_manager.get_bounds("right")
                     bounds_info = f"<br>Bounds copied: [{bounds.min_lon:.2f}, {bounds.min_lat:.2f}, {bounds.max_lon:.2f}, {bounds.max_lat:.2f}]"
+                except ValueError:
+                    bounds_info = ""
                     
                 status_display.value = f"<p><em style='color: green'>Settings copied from right to left!{bounds_info}</em></p>"
                 
@@ -612,7 +612,7 @@ class ClimateAnalysisTool:
         
         # Format selection
         format_dropdown = widgets.Dropdown(
-            options=['GeoTIFF', 'CSV', 'NetCDF'],
+            options=['GeoTIFF', 'CSV', 'NetCDF', 'Parquet', 'Feather'],
             value='GeoTIFF',
             description='Format:',
             style={'description_width': 'initial'},
@@ -1003,8 +1003,17 @@ class ClimateAnalysisTool:
             ),
             "dataset": widgets_dict["step3"].children[0].value,
             "parameter": widgets_dict["step4"].value,
-            "index": widgets_dict["step5"].children[0].value
+            "index": widgets_dict["step5"].children[0].value,
+            # Export region and CRS, so exports don't have to query Earth Engine for them
+            "crs": "EPSG:4326"
         }
+        
+        try:
+            self.current_session[f"{panel_id}_panel"]["state"]["aoi_coords"] = (
+                self.geometry_manager.get_bounds(panel_id).to_coordinates()
+            )
+        except ValueError:
+            pass
     
     def _run_analysis(self, panel_id, results_container):
         """Run analysis and update results container with proper year toggling"""
@@ -1064,12 +1073,17 @@ class ClimateAnalysisTool:
                 year_callback=get_image_for_year  # Pass the callback
             )
             
-            # Create temporal plot
-            plot_widget = self.visualizer.create_temporal_plot(
-                results["temporal_data"],
-                f"Temporal Trend of {panel_state['index']}",
-                results["units"]
-            )
+            # Create temporal plot, or show the new data on the panel's previous one
+            plot_title = f"Temporal Trend of {panel_state['index']}"
+            plot_widget = self.current_session[f"{panel_id}_panel"].get("plot_widget")
+            if plot_widget is None or not self.visualizer.update_temporal_plot(
+                    plot_widget, results["temporal_data"], plot_title, results["units"]):
+                plot_widget = self.visualizer.create_temporal_plot(
+                    results["temporal_data"],
+                    plot_title,
+                    results["units"]
+                )
+                self.current_session[f"{panel_id}_panel"]["plot_widget"] = plot_widget
             
             # Update results container
             results_container.children = [
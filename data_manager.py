@@ -210,7 +210,8 @@ class DataManager:
         }
     
     def get_ee_collection(self, dataset_name: str, start_date: str, 
-                        end_date: str, geometry: ee.Geometry) -> ee.ImageCollection:
+                        end_date: str, geometry: ee.Geometry,
+                        check_empty: bool = True) -> ee.ImageCollection:
         """
         Get Earth Engine ImageCollection for a dataset
         
@@ -219,6 +220,8 @@ class DataManager:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
             geometry: Earth Engine geometry defining the region of interest
+            check_empty: Raise if the collection is empty (costs one Earth Engine
+                round trip; skip when availability is already known)
             
         Returns:
             Filtered Earth Engine ImageCollection
@@ -231,7 +234,7 @@ class DataManager:
             .filterBounds(geometry)
         
         # Check if collection has images
-        if collection.size().getInfo() == 0:
+        if check_empty and collection.size().getInfo() == 0:
             raise ValueError(f"No data available for {dataset_name} in the specified date range")
         
         return collection
@@ -5,26 +5,265 @@ Enhanced exporter for climate analysis results with local export priority, chunk
 
 import ee
 import os
+import re
 import pandas as pd
 import numpy as np
-import geemap
 import rasterio
+from rasterio.io import MemoryFile
 import xarray as xr
+import requests
+from requests.adapters import HTTPAdapter
 import geopandas as gpd
 import math
+import functools
+import json
+import hashlib
+import csv
 import time
+import asyncio
+import multiprocessing
+import threading
 import tempfile
 import shutil
 from pathlib import Path
+from contextlib import contextmanager
+from types import MappingProxyType
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple, Union
 from ipywidgets import widgets, VBox, HBox, Layout, HTML
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to plain pandas construction
+    pa = None
+    pq = None
+    pacsv = None
+
+# xarray only accepts the 'compression', 'significant_digits' and
+# 'quantize_mode' encodings from 2022.06 (older versions reject every write
+# using them as unexpected encoding parameters)
+XARRAY_HAS_NC4_CODECS = tuple(
+    int(part) for part in re.findall(r'\d+', xr.__version__)[:2]
+) >= (2022, 6)
+
+try:
+    import netCDF4
+    # Zstandard and quantization need netCDF4 >= 1.6 built against a capable
+    # netcdf-c, and an xarray that passes them through
+    NETCDF_HAS_ZSTD = XARRAY_HAS_NC4_CODECS and bool(getattr(netCDF4, '__has_zstandard_support__', False))
+    NETCDF_HAS_QUANTIZE = XARRAY_HAS_NC4_CODECS and bool(getattr(netCDF4, '__has_quantization_support__', False))
+except ImportError:
+    netCDF4 = None
+    NETCDF_HAS_ZSTD = False
+    NETCDF_HAS_QUANTIZE = False
+
+try:
+    import dask  # noqa: F401 - enables lazy multi-file merging in xarray
+    HAS_DASK = True
+except ImportError:
+    HAS_DASK = False
+
+try:
+    import zarr
+except ImportError:
+    zarr = None
+
+# Status message keywords and the message type they signal
+STATUS_KEYWORD_TYPES = {
+    'error': 'error', 'failed': 'error', 'cannot': 'error', 'could not': 'error',
+    'warning': 'warning', 'caution': 'warning', 'partial': 'warning',
+    'success': 'success', 'complete': 'success', 'saved': 'success'
+}
+STATUS_KEYWORD_RE = re.compile('|'.join(re.escape(word) for word in STATUS_KEYWORD_TYPES), re.IGNORECASE)
+
+# Schema of the local catalog of downloaded GeoTIFFs (requires pyarrow)
+CATALOG_SCHEMA = pa.schema([
+    ('product', pa.string()),
+    ('year', pa.int64()),
+    ('image', pa.string()),
+    ('region', pa.string()),
+    ('crs', pa.string()),
+    ('scale', pa.float64()),
+    ('file_path', pa.string()),
+    ('file_size', pa.int64()),
+    ('mtime_ns', pa.int64())
+]) if pa is not None else None
+
+def _convert_year_geotiff_to_netcdf(geotiff_source: Union[str, bytes], netcdf_path: str, year: int,
+                                    panel_meta: Dict[str, Any]) -> Tuple[int, str]:
+    """
+    Convert one year's downloaded GeoTIFF to a compressed NetCDF file
+    
+    Module-level so it can run in a worker process. The GeoTIFF can be given
+    as raw bytes (opened in memory, never written to disk) or as a file path,
+    which is removed after a successful conversion.
+    
+    Args:
+        geotiff_source: GeoTIFF bytes or path of the downloaded GeoTIFF
+        netcdf_path: Path of the NetCDF file to write
+        year: Year of the data
+        panel_meta: Metadata with 'title', 'units', 'dataset', 'parameter' and 'index'
+        
+    Returns:
+        Tuple of (year, netcdf_path)
+    """
+    with _open_geotiff(geotiff_source) as src:
+        # Dataset with the year in its name
+        ds = _geotiff_to_dataset(
+            src,
+            title=f"{panel_meta['title']} {year}",
+            units=panel_meta['units'],
+            var_attrs={'year': year},
+            global_attrs={
+                'year': year,
+                'dataset': panel_meta['dataset'],
+                'parameter': panel_meta['parameter'],
+                'index': panel_meta['index']
+            }
+        )
+        
+        # Save as NetCDF with compression
+        encoding = {'data': Exporter._netcdf_var_encoding(ds['data'])}
+        ds.to_netcdf(netcdf_path, encoding=encoding)
+    
+    # Clean up temp file
+    if isinstance(geotiff_source, str):
+        try:
+            os.remove(geotiff_source)
+        except OSError:
+            pass
+    
+    return year, netcdf_path
+
+def _geotiff_to_dataset(src: rasterio.io.DatasetReader, title: str, units: str,
+                        data: Optional[np.ndarray] = None,
+                        var_attrs: Optional[Dict[str, Any]] = None,
+                        global_attrs: Optional[Dict[str, Any]] = None) -> xr.Dataset:
+    """
+    Build a (lat, lon) dataset from the first band of an open GeoTIFF
+    
+    Args:
+        src: Open rasterio dataset
+        title: Dataset title, also the variable's long name
+        units: Units of the data
+        data: First band, if already read (e.g. memory-mapped); read from src otherwise
+        var_attrs: Extra attributes of the 'data' variable
+        global_attrs: Extra global attributes
+        
+    Returns:
+        Dataset with variable 'data' on pixel-center lat/lon coordinates
+    """
+    if data is None:
+        data = src.read(1)
+    
+    # Climate indices do not need double precision; float32 halves the file
+    if data.dtype == np.float64:
+        data = data.astype(np.float32, copy=False)
+    
+    # Create lon/lat coordinates of the pixel centers
+    height, width = data.shape
+    lons, lats = Exporter._pixel_center_coords(src.transform, width, height)
+    
+    da = xr.DataArray(
+        data,
+        dims=('lat', 'lon'),
+        coords={'lat': lats, 'lon': lons},
+        attrs={
+            'long_name': title,
+            'units': units,
+            'missing_value': src.nodata if src.nodata is not None else -9999,
+            **(var_attrs or {})
+        }
+    )
+    
+    return xr.Dataset({
+        'data': da
+    }, attrs={
+        'title': title,
+        'source': 'Climate Analysis Tool',
+        'creation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        **(global_attrs or {})
+    })
+
+@contextmanager
+def _open_geotiff(geotiff_source: Union[str, bytes]):
+    """
+    Open a GeoTIFF from a file path or from in-memory bytes
+    
+    Bytes are served through GDAL's in-memory file system, so no
+    intermediate file touches the disk.
+    
+    Args:
+        geotiff_source: GeoTIFF bytes or file path
+        
+    Yields:
+        Open rasterio dataset
+    """
+    if isinstance(geotiff_source, (bytes, bytearray)):
+        with MemoryFile(geotiff_source) as memfile:
+            with memfile.open() as src:
+                yield src
+    else:
+        with rasterio.open(geotiff_source) as src:
+            yield src
+
 class Exporter:
     """
     Enhanced exporter for climate analysis results with improved local export, chunking, and GDrive fallback
     """
     
+    # Shared parameters for Earth Engine Drive export tasks (read-only)
+    DEFAULT_EXPORT_KWARGS = MappingProxyType({
+        'crs': 'EPSG:4326',
+        'scale': 500,
+        'maxPixels': int(1e9)
+    })
+    
+    # Earth Engine formatOptions per Drive file format. Cloud-optimized
+    # GeoTIFFs are tiled and compressed, so they are much smaller to store
+    # and download than plain GeoTIFFs
+    DEFAULT_FORMAT_OPTIONS = MappingProxyType({
+        'GeoTIFF': MappingProxyType({'cloudOptimized': True})
+    })
+    
+    # Tiling of Drive GeoTIFF exports: computed in 256-pixel shards and split
+    # into files of at most 4096 x 4096 pixels (a multiple of the shard size),
+    # so large rasters never arrive as a single multi-GB file
+    DRIVE_TILING = MappingProxyType({
+        'GeoTIFF': MappingProxyType({'shardSize': 256, 'fileDimensions': (4096, 4096)})
+    })
+    
+    # Attributes of the regional mean series stored in multi-year NetCDF files
+    REGIONAL_MEAN_ATTRS = MappingProxyType({
+        'long_name': 'Mean over the area of interest',
+        'description': 'Yearly regional mean of the index (same values as the CSV temporal export)'
+    })
+    
+    # Column types of temporal records, so DataFrames skip type inference
+    TEMPORAL_DTYPES = MappingProxyType({'year': np.int64, 'value': np.float64})
+    
+    # Cap on concurrently running Drive export tasks, shared by all exporters.
+    # Tasks over the cap wait in a FIFO queue until poll_tasks() sees a running
+    # task finish
+    MAX_ACTIVE_EXPORTS = int(os.environ.get('CLIMATE_TOOL_MAX_EXPORTS', '8'))
+    _task_slots = threading.BoundedSemaphore(MAX_ACTIVE_EXPORTS)
+    _active_tasks = {}  # Task id -> started task holding a slot
+    _pending_tasks = deque()
+    _task_queue_lock = threading.Lock()
+    _task_queue_worker = None
+    
+    # Queue checks (one task list request each) back off exponentially: the
+    # interval starts at task_poll_interval seconds, grows by
+    # task_poll_backoff while no running task finishes, up to
+    # task_poll_max_interval, and resets when one does
+    task_poll_interval = 2.0
+    task_poll_backoff = 1.7
+    task_poll_max_interval = 60.0
+    
     def __init__(self):
         """Initialize Exporter with enhanced folder structure"""
         # Base export directory using normpath to ensure consistent separators
@@ -36,16 +275,67 @@ class Exporter:
         self.max_file_size_mb = 500  # Maximum file size in MB before chunking
         self.max_rows_csv = 1000000  # Maximum rows in CSV before chunking
         
-        # Create enhanced local directory structure
-        self._ensure_export_directories()
+        # formatOptions for Drive exports; override per instance, e.g.
+        # exporter.drive_format_options['GeoTIFF'] = {'cloudOptimized': False}
+        self.drive_format_options = {fmt: dict(options) for fmt, options in self.DEFAULT_FORMAT_OPTIONS.items()}
+        
+        # Data type of rasters written locally (None keeps the source type).
+        # Climate indices fit in float32, which halves files versus float64
+        self.local_raster_dtype = 'float32'
+        
+        # Maximum number of simultaneous Earth Engine downloads
+        self.max_concurrent_downloads = 8
+        
+        # Worker processes for GeoTIFF to NetCDF conversion
+        self.max_conversion_workers = max(1, (os.cpu_count() or 2) // 2)
+        
+        # Writer threads for chunked CSV exports (I/O-bound, so not tied to the
+        # conversion processes)
+        self.max_csv_writers = 4
+        
+        # Shared HTTP session so repeated downloads reuse pooled connections
+        self.download_timeout = 600  # Seconds per download request
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3))
+        
+        # Parquet catalog of downloaded GeoTIFFs, used to skip repeat downloads
+        # (v2 entries also record the image, so v1 catalogs are not reused)
+        self.catalog_path = os.path.join(self.local_export_dir, 'catalog_v2.parquet')
+        self._catalog_lock = threading.Lock()
+        
+        # Serialized-geometry hashes by geometry object id (see _geometry_cache_key)
+        self._geometry_hashes = {}
+        
+        # Export region/CRS looked up from Earth Engine, keyed by (geometry hash, dataset)
+        self._region_crs_cache = {}
+        
+        # Which years have data ({year: bool}), keyed by (geometry hash, dataset)
+        self._year_availability_cache = {}
+        
+        # Drive export tasks already created, keyed by (geometry hash, dataset,
+        # index, start year, end year, format, folder) -> (task, band count).
+        # The task itself is kept: a queued task has no id until it starts
+        self._task_cache = {}
+        
+        # The local directory structure is created by the first local export
+        # (see _ensure_export_directories), not here: many exporters are never
+        # used for local exports, e.g. one per panel or Drive-only ones
+        self._export_dirs_ready = False
+        
+        # Export folders by (format, folder name), created during the current
+        # export (see _ensure_export_dir)
+        self._export_dirs = {}
     
     def _ensure_export_directories(self):
-        """Ensure all necessary export directories exist with proper structure"""
+        """Ensure all necessary export directories exist with proper structure (once per exporter)"""
+        if self._export_dirs_ready:
+            return
+        
         # Create main export directory
         os.makedirs(self.local_export_dir, exist_ok=True)
         
         # Create directories for different export types
-        export_types = ['GeoTIFF', 'CSV', 'NetCDF']
+        export_types = ['GeoTIFF', 'CSV', 'NetCDF', 'Parquet', 'Feather']
         for export_type in export_types:
             os.makedirs(os.path.join(self.local_export_dir, export_type), exist_ok=True)
             
@@ -62,6 +352,18 @@ class Exporter:
         
         # Create temporary directory for processing
         os.makedirs(os.path.join(self.local_export_dir, 'temp'), exist_ok=True)
+        
+        self._export_dirs_ready = True
+    
+    def _forget_export_dirs(self):
+        """
+        Forget which export folders exist, so the next use creates them again
+        
+        Called at the start of every export: the user may have deleted the
+        folders since the previous one (including after a failed write).
+        """
+        self._export_dirs_ready = False
+        self._export_dirs.clear()
     
     def export_current_view(self, format_type: str, panel_data: Dict[str, Any], 
                           status_callback: Optional[callable] = None) -> str:
@@ -69,13 +371,14 @@ class Exporter:
         Export currently displayed data with enhanced local export capabilities
         
         Args:
-            format_type: Export format type ('GeoTIFF', 'CSV', 'NetCDF')
+            format_type: Export format type ('GeoTIFF', 'CSV', 'NetCDF', 'Parquet', 'Feather')
             panel_data: Data for the panel
             status_callback: Optional callback for status updates
             
         Returns:
             Status message
         """
+        self._forget_export_dirs()
         try:
             # Update status
             if status_callback:
@@ -96,12 +399,15 @@ class Exporter:
             folder_name = f"{dataset}/{index}"
             
             # Export based on format
+            catalog_key = (f"{dataset}_{index}", year)
             if format_type == 'GeoTIFF':
-                return self._export_geotiff_enhanced(data, export_name, folder_name, status_callback)
+                return self._export_geotiff_enhanced(data, export_name, folder_name, status_callback, catalog_key)
             elif format_type == 'CSV':
                 return self._export_csv_enhanced(panel_data, export_name, folder_name, status_callback)
             elif format_type == 'NetCDF':
-                return self._export_netcdf_enhanced(data, export_name, folder_name, status_callback)
+                return self._export_netcdf_enhanced(data, export_name, folder_name, status_callback, catalog_key)
+            elif format_type in ('Parquet', 'Feather'):
+                return self._export_columnar_enhanced(panel_data, export_name, folder_name, format_type, status_callback)
             else:
                 return f"Error: Unsupported export format: {format_type}"
                 
@@ -117,13 +423,14 @@ class Exporter:
         Export all data in the selected time range with enhanced capabilities
         
         Args:
-            format_type: Export format type ('GeoTIFF', 'CSV', 'NetCDF')
+            format_type: Export format type ('GeoTIFF', 'CSV', 'NetCDF', 'Parquet', 'Feather')
             panel_data: Data for the panel
             status_callback: Optional callback for status updates
             
         Returns:
             Status message
         """
+        self._forget_export_dirs()
         try:
             # Update status
             if status_callback:
@@ -153,6 +460,9 @@ class Exporter:
                 return self._export_all_csv_enhanced(panel_data, export_name_base, folder_name, status_callback)
             elif format_type == 'NetCDF':
                 return self._export_all_netcdf_enhanced(panel_data, export_name_base, folder_name, status_callback)
+            elif format_type in ('Parquet', 'Feather'):
+                return self._export_columnar_enhanced(panel_data, f"{export_name_base}_temporal", folder_name,
+                                                      format_type, status_callback, add_metadata=True)
             else:
                 return f"Error: Unsupported export format: {format_type}"
                 
@@ -163,7 +473,8 @@ class Exporter:
             return error_msg
     
     def _export_geotiff_enhanced(self, image: ee.Image, export_name: str,
-                            folder_name: str, status_callback: Optional[callable] = None) -> str:
+                            folder_name: str, status_callback: Optional[callable] = None,
+                            catalog_key: Optional[Tuple[str, int]] = None) -> str:
         # Update status
         if status_callback:
             status_callback("Setting up GeoTIFF export, checking image size...")
@@ -173,6 +484,7 @@ class Exporter:
             folder_name = folder_name.replace("unknown", "climate_data")
         
         # Create proper local directory (with consistent path separators)
+        self._ensure_export_directories()
         local_folder = os.path.join(self.local_export_dir, 'GeoTIFF', *folder_name.split('/'))
         os.makedirs(local_folder, exist_ok=True)
         local_file_path = os.path.join(local_folder, f"{export_name}.tif")
@@ -213,7 +525,7 @@ class Exporter:
                 if status_callback:
                     status_callback("Image size acceptable, exporting directly to local file...")
                 
-                # Try direct local export using geemap
+                # Try direct local export
                 try:
                     # Get projection info from the image
                     crs = image.projection().getInfo()['crs']
@@ -222,26 +534,33 @@ class Exporter:
                     # Create bounds for the export
                     region = image.geometry().bounds().getInfo()['coordinates']
                     
-                    # Use geemap to download the image
-                    task = geemap.ee_export_image(
-                        image, 
-                        filename=local_file_path,
-                        scale=scale,
-                        region=region,
-                        crs=crs,
-                        file_per_band=False
-                    )
-                    
-                    # Wait for the task to complete
-                    if status_callback:
-                        status_callback("Downloading GeoTIFF to local file, please wait...")
+                    # Reuse an identical earlier download if the catalog has one
+                    cached_path = None
+                    if catalog_key:
+                        cached_path = self._find_cached_export(*catalog_key, image, region, crs, scale)
                     
-                    # Check if the file was created successfully
-                    if os.path.exists(local_file_path):
-                        file_size_mb = os.path.getsize(local_file_path) / (1024 * 1024)
-                        return f"GeoTIFF export completed successfully. File saved to: {local_file_path} ({file_size_mb:.2f} MB)"
+                    if cached_path:
+                        if status_callback:
+                            status_callback("Found identical earlier download, copying from local catalog...")
+                        shutil.copyfile(cached_path, local_file_path)
                     else:
-                        raise Exception("Export failed, file not created")
+                        if status_callback:
+                            status_callback("Downloading GeoTIFF to local file, please wait...")
+                        
+                        # Download the image (raises if the download fails)
+                        self._download_image(
+                            image,
+                            filename=local_file_path,
+                            scale=scale,
+                            region=region,
+                            crs=crs
+                        )
+                        
+                        if catalog_key:
+                            self._record_cached_export(*catalog_key, image, region, crs, scale, local_file_path)
+                    
+                    file_size_mb = os.path.getsize(local_file_path) / (1024 * 1024)
+                    return f"GeoTIFF export completed successfully. File saved to: {local_file_path} ({file_size_mb:.2f} MB)"
                         
                 except Exception as e:
                     if status_callback:
@@ -323,26 +642,22 @@ class Exporter:
                     
                     # Create filename for this chunk
                     chunk_filename = os.path.join(chunk_dir, f"{export_name}_chunk_{i}_{j}.tif")
-                    chunk_files.append(chunk_filename)
                     
                     if status_callback:
                         status_callback(f"Exporting chunk {chunks_completed+1} of {total_chunks}...")
                     
-                    # Export this chunk using geemap
+                    # Export this chunk (the download returns once the file is
+                    # complete and raises on failure, so no polling is needed)
                     try:
-                        task = geemap.ee_export_image(
-                            chunk_image, 
+                        self._download_image(
+                            chunk_image,
                             filename=chunk_filename,
                             scale=scale,
                             region=chunk_geometry.getInfo()['coordinates'],
-                            crs=crs,
-                            file_per_band=False
+                            crs=crs
                         )
                         
-                        # Wait for completion
-                        while not os.path.exists(chunk_filename):
-                            time.sleep(2)  # Wait for file to appear
-                            
+                        chunk_files.append(chunk_filename)
                         chunks_completed += 1
                         
                     except Exception as e:
@@ -351,7 +666,7 @@ class Exporter:
                         # Continue with other chunks
             
             # If we have at least one chunk, try to merge them
-            if chunk_files and any(os.path.exists(f) for f in chunk_files):
+            if chunk_files:
                 if status_callback:
                     status_callback(f"Successfully exported {chunks_completed} of {total_chunks} chunks. Merging chunks...")
                 
@@ -364,8 +679,8 @@ class Exporter:
                     # This is a simplified version - in production code, would need more robust merging
                     from rasterio.merge import merge
                     
-                    # Open all valid chunk files
-                    src_files_to_mosaic = [rasterio.open(f) for f in chunk_files if os.path.exists(f)]
+                    # Open all downloaded chunk files
+                    src_files_to_mosaic = [rasterio.open(f) for f in chunk_files]
                     
                     if src_files_to_mosaic:
                         # Merge the files
@@ -383,8 +698,7 @@ class Exporter:
                         })
                         
                         # Write the mosaic to disk
-                        with rasterio.open(merged_file, "w", **out_meta) as dest:
-                            dest.write(mosaic)
+                        self._write_local_geotiff(mosaic, merged_file, out_meta, self.local_raster_dtype)
                         
                         # Close the source files
                         for src in src_files_to_mosaic:
@@ -441,26 +755,21 @@ class Exporter:
             status_callback("Setting up GeoTIFF export to Google Drive...")
         
         # Create export task
-        drive_folder = f"{self.export_root}/{folder_name}"
-        export_task = ee.batch.Export.image.toDrive(
+        drive_folder = self._drive_folder(folder_name)
+        export_task = self._drive_export_factory(drive_folder, 'GeoTIFF')(
             image=image,
             description=export_name,
-            folder=drive_folder,
-            fileNamePrefix=export_name,
-            crs='EPSG:4326',
-            scale=500,
-            maxPixels=1e9,
-            fileFormat='GeoTIFF'
+            fileNamePrefix=export_name
         )
         
-        # Start the task
-        export_task.start()
+        # Start the task (or queue it while too many exports are running)
+        start_state = "started" if self._start_drive_task(export_task) else "queued"
         
         # Update status
         if status_callback:
-            status_callback(f"GeoTIFF export to Google Drive started. The file will be saved to '{drive_folder}' folder in your Google Drive.")
+            status_callback(f"GeoTIFF export to Google Drive {start_state}. The file will be saved to '{drive_folder}' folder in your Google Drive.")
         
-        return f"GeoTIFF export to Google Drive started. The file will be saved to '{drive_folder}' folder in your Google Drive."
+        return f"GeoTIFF export to Google Drive {start_state}. The file will be saved to '{drive_folder}' folder in your Google Drive."
     
     def _export_csv_enhanced(self, panel_data: Dict[str, Any], export_name: str,
                         folder_name: str, status_callback: Optional[callable] = None) -> str:
@@ -482,8 +791,15 @@ class Exporter:
         print(f"Exporting CSV to: {local_file_path}")
         
         try:
+            # Small exports of uniform records are written directly, without a DataFrame copy
+            if len(temporal_data) <= self.max_rows_csv and self._write_records_csv(temporal_data, local_file_path):
+                file_size_mb = os.path.getsize(local_file_path) / (1024 * 1024)
+                if status_callback:
+                    status_callback(f"CSV export completed. File saved to: {local_file_path} ({file_size_mb:.2f} MB)")
+                return f"CSV export completed. File saved to: {local_file_path} ({file_size_mb:.2f} MB)"
+            
             # Convert to DataFrame
-            df = pd.DataFrame(temporal_data)
+            df = self._temporal_to_dataframe(temporal_data)
             
             # Check size
             num_rows = len(df)
@@ -502,21 +818,11 @@ class Exporter:
                 os.makedirs(chunk_dir, exist_ok=True)
                 
                 # Export each chunk
-                for i in range(num_chunks):
-                    start_idx = i * chunk_size
-                    end_idx = min((i + 1) * chunk_size, num_rows)
-                    
-                    # Get chunk of data
-                    chunk_df = df.iloc[start_idx:end_idx]
-                    
-                    # Create chunk filename
-                    chunk_filename = os.path.join(chunk_dir, f"{export_name}_part_{i+1}_of_{num_chunks}.csv")
-                    
-                    # Save chunk
-                    chunk_df.to_csv(chunk_filename, index=False)
-                    
-                    if status_callback and i % 5 == 0:  # Update status every 5 chunks
-                        status_callback(f"Exported chunk {i+1} of {num_chunks}...")
+                chunk_files = [
+                    os.path.join(chunk_dir, f"{export_name}_part_{i+1}_of_{num_chunks}.csv")
+                    for i in range(num_chunks)
+                ]
+                self._write_csv_chunks(df, chunk_size, chunk_files, status_callback)
                 
                 # Also save a single file with basic info
                 summary_df = pd.DataFrame({
@@ -531,7 +837,7 @@ class Exporter:
                 return f"CSV export completed with chunking. {num_chunks} files created in {chunk_dir}"
             else:
                 # Save DataFrame for small files
-                df.to_csv(local_file_path, index=False)
+                self._write_csv(df, local_file_path)
                 
                 # Get file size
                 file_size_mb = os.path.getsize(local_file_path) / (1024 * 1024)
@@ -549,7 +855,8 @@ class Exporter:
             return error_msg
     
     def _export_netcdf_enhanced(self, image: ee.Image, export_name: str,
-                            folder_name: str, status_callback: Optional[callable] = None) -> str:
+                            folder_name: str, status_callback: Optional[callable] = None,
+                            catalog_key: Optional[Tuple[str, int]] = None) -> str:
         """Enhanced NetCDF export with local priority and chunking"""
         # Update status
         if status_callback:
@@ -602,7 +909,6 @@ class Exporter:
                 # Check if GeoTIFF export was successful
                 if "export completed successfully" in geotiff_result:
                     # Extract the temporary GeoTIFF path
-                    import re
                     geotiff_path_match = re.search(r"File saved to: (.*?\.(tif|TIF))", geotiff_result)
                     
                     if geotiff_path_match:
@@ -616,50 +922,10 @@ class Exporter:
                             # Use xarray and rasterio to convert
                             # Open the GeoTIFF with rasterio
                             with rasterio.open(temp_geotiff_path) as src:
-                                # Get data and metadata
-                                data = src.read(1)  # Read the first band
-                                transform = src.transform
-                                
-                                # Create coordinates
-                                height, width = data.shape
-                                rows = np.arange(height)
-                                cols = np.arange(width)
-                                
-                                # Create lon/lat coordinates
-                                lons = np.zeros(width)
-                                lats = np.zeros(height)
-                                
-                                for col in range(width):
-                                    x, y = transform * (col + 0.5, 0)  # +0.5 for pixel center
-                                    lons[col] = x
+                                ds = _geotiff_to_dataset(src, export_name.replace('_', ' '), 'unknown')
                                 
-                                for row in range(height):
-                                    x, y = transform * (0, row + 0.5)  # +0.5 for pixel center
-                                    lats[row] = y
-                                
-                                # Create xarray dataset
-                                da = xr.DataArray(
-                                    data,
-                                    dims=('lat', 'lon'),
-                                    coords={'lat': lats, 'lon': lons},
-                                    attrs={
-                                        'long_name': export_name.replace('_', ' '),
-                                        'units': 'unknown',
-                                        'missing_value': src.nodata if src.nodata is not None else -9999
-                                    }
-                                )
-                                
-                                # Create dataset
-                                ds = xr.Dataset({
-                                    'data': da
-                                }, attrs={
-                                    'title': export_name.replace('_', ' '),
-                                    'source': 'Climate Analysis Tool',
-                                    'creation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                                })
-                                
-                                # Save as NetCDF
-                                ds.to_netcdf(local_file_path)
+                                # Save as NetCDF with compression
+                                ds.to_netcdf(local_file_path, encoding={'data': self._netcdf_var_encoding(ds['data'])})
                                 
                                 # Clean up temp file
                                 try:
@@ -688,9 +954,6 @@ class Exporter:
                 # Try direct local export for smaller images
                 # (similar approach but without chunking)
                 try:
-                    # First export as GeoTIFF
-                    temp_geotiff_path = os.path.join(self.local_export_dir, 'temp', f"{export_name}_temp.tif")
-                    
                     # Get projection info from the image
                     crs = image.projection().getInfo()['crs']
                     scale = 500  # Default scale in meters
@@ -698,85 +961,49 @@ class Exporter:
                     # Create bounds for the export
                     region = image.geometry().bounds().getInfo()['coordinates']
                     
-                    # Use geemap to download the image as GeoTIFF
-                    task = geemap.ee_export_image(
-                        image, 
-                        filename=temp_geotiff_path,
-                        scale=scale,
-                        region=region,
-                        crs=crs,
-                        file_per_band=False
-                    )
+                    # Convert straight from an identical earlier GeoTIFF download if available
+                    cached_path = None
+                    if catalog_key:
+                        cached_path = self._find_cached_export(*catalog_key, image, region, crs, scale)
                     
-                    # Wait for the GeoTIFF to be created
-                    if status_callback:
-                        status_callback("Downloading data for NetCDF, please wait...")
+                    if cached_path:
+                        geotiff_source = cached_path
+                    else:
+                        if status_callback:
+                            status_callback("Downloading data for NetCDF, please wait...")
+                        
+                        # Download the GeoTIFF into memory instead of a temp file
+                        geotiff_source = self._download_image_bytes(
+                            image,
+                            scale=scale,
+                            region=region,
+                            crs=crs
+                        )
                     
-                    # Check if the file was created successfully
-                    if os.path.exists(temp_geotiff_path):
+                    # Check if the download produced any data
+                    if geotiff_source:
                         # Convert to NetCDF using the same code as for chunked exports
                         if status_callback:
                             status_callback("Converting to NetCDF format...")
                         
                         # Use xarray and rasterio to convert (same as above)
-                        with rasterio.open(temp_geotiff_path) as src:
-                            # Get data and metadata
-                            data = src.read(1)  # Read the first band
-                            transform = src.transform
-                            
-                            # Create coordinates
-                            height, width = data.shape
-                            rows = np.arange(height)
-                            cols = np.arange(width)
-                            
-                            # Create lon/lat coordinates
-                            lons = np.zeros(width)
-                            lats = np.zeros(height)
-                            
-                            for col in range(width):
-                                x, y = transform * (col + 0.5, 0)  # +0.5 for pixel center
-                                lons[col] = x
+                        with _open_geotiff(geotiff_source) as src:
+                            # Get data and metadata (a cached file is memory-mapped when the layout allows it)
+                            data = self._read_first_band(src, cached_path) if cached_path else None
+                            ds = _geotiff_to_dataset(src, export_name.replace('_', ' '), 'unknown', data=data)
                             
-                            for row in range(height):
-                                x, y = transform * (0, row + 0.5)  # +0.5 for pixel center
-                                lats[row] = y
+                            # Save as NetCDF with compression
+                            ds.to_netcdf(local_file_path, encoding={'data': self._netcdf_var_encoding(ds['data'])})
                             
-                            # Create xarray dataset
-                            da = xr.DataArray(
-                                data,
-                                dims=('lat', 'lon'),
-                                coords={'lat': lats, 'lon': lons},
-                                attrs={
-                                    'long_name': export_name.replace('_', ' '),
-                                    'units': 'unknown',
-                                    'missing_value': src.nodata if src.nodata is not None else -9999
-                                }
-                            )
-                            
-                            # Create dataset
-                            ds = xr.Dataset({
-                                'data': da
-                            }, attrs={
-                                'title': export_name.replace('_', ' '),
-                                'source': 'Climate Analysis Tool',
-                                'creation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            })
-                            
-                            # Save as NetCDF
-                            ds.to_netcdf(local_file_path)
-                            
-                            # Clean up temp file
-                            try:
-                                os.remove(temp_geotiff_path)
-                            except:
-                                pass
+                            # Release any memory map on the cached GeoTIFF
+                            del ds, data
                             
                             # Get file size
                             file_size_mb = os.path.getsize(local_file_path) / (1024 * 1024)
                             
                             return f"NetCDF export completed successfully. File saved to: {local_file_path} ({file_size_mb:.2f} MB)"
                     else:
-                        raise Exception("Export failed, temporary file not created")
+                        raise Exception("Export failed, no data downloaded")
                         
                 except Exception as e:
                     if status_callback:
@@ -792,6 +1019,145 @@ class Exporter:
             
             return self._export_netcdf_to_drive(image, export_name, folder_name, status_callback)
     
+    def _write_local_geotiff(self, data: np.ndarray, path: str, meta: Dict[str, Any],
+                             dtype: Optional[str] = None):
+        """
+        Write a (bands, rows, cols) array to a GeoTIFF, optionally downcasting it
+        
+        Args:
+            data: Raster data
+            path: Output GeoTIFF path
+            meta: rasterio profile for the file (dtype is set from the data)
+            dtype: Floating-point data type to store, e.g. 'float32'
+            
+        Raises:
+            ValueError: If dtype would convert floating-point data to integers
+        """
+        if dtype is not None:
+            target = np.dtype(dtype)
+            if np.issubdtype(data.dtype, np.floating) and not np.issubdtype(target, np.floating):
+                raise ValueError(f"Refusing to convert {data.dtype} raster data to {target}")
+            data = data.astype(target, copy=False)
+        
+        meta = dict(meta, dtype=data.dtype.name)
+        with rasterio.open(path, "w", **meta) as dest:
+            dest.write(data)
+    
+    def _read_first_band(self, src: rasterio.io.DatasetReader, path: str) -> np.ndarray:
+        """
+        Read the first band of a GeoTIFF, memory-mapping it when possible
+        
+        Uncompressed, striped GeoTIFFs whose first band is stored contiguously
+        are mapped directly from disk, so the page cache streams the pixels
+        instead of allocating a full in-memory copy. Any other layout is read
+        normally.
+        
+        Args:
+            src: Open rasterio dataset
+            path: Path of the GeoTIFF file
+            
+        Returns:
+            2D array (height, width) with the first band
+        """
+        try:
+            contiguous_band = src.count == 1 or src.interleaving == rasterio.enums.Interleaving.band
+            if src.compression is None and not src.profile.get('tiled', False) and contiguous_band:
+                dtype = np.dtype(src.dtypes[0])
+                strip_rows = src.block_shapes[0][0]
+                num_strips = math.ceil(src.height / strip_rows)
+                strip_bytes = strip_rows * src.width * dtype.itemsize
+                
+                first_offset = int(src.get_tag_item('BLOCK_OFFSET_0_0', 'TIFF', bidx=1))
+                last_offset = int(src.get_tag_item(f'BLOCK_OFFSET_0_{num_strips - 1}', 'TIFF', bidx=1))
+                
+                if last_offset - first_offset == (num_strips - 1) * strip_bytes:
+                    # TIFF header starts with 'II' (little-endian) or 'MM' (big-endian)
+                    with open(path, 'rb') as f:
+                        byte_order = '<' if f.read(2) == b'II' else '>'
+                    
+                    return np.memmap(
+                        path,
+                        dtype=dtype.newbyteorder(byte_order),
+                        mode='r',
+                        offset=first_offset,
+                        shape=(src.height, src.width)
+                    )
+        except Exception:
+            # Layout metadata unavailable - fall back to a regular read
+            pass
+        
+        return src.read(1)
+    
+    @staticmethod
+    def _netcdf_var_encoding(data_array: xr.DataArray) -> Dict[str, Any]:
+        """
+        Build the compressed NetCDF encoding for a data variable
+        
+        Uses Zstandard with byte shuffling when the netCDF4 library supports it
+        (falling back to zlib), stores floats as float32, rounds them to 4
+        significant digits so the compressor has fewer distinct bits to store,
+        and sets explicit chunk sizes.
+        
+        Args:
+            data_array: Variable to encode
+            
+        Returns:
+            Encoding dictionary for to_netcdf
+        """
+        if NETCDF_HAS_ZSTD:
+            encoding = {'compression': 'zstd', 'complevel': 3, 'shuffle': True}
+        else:
+            encoding = {'zlib': True, 'complevel': 5, 'shuffle': True}
+        
+        if np.issubdtype(data_array.dtype, np.floating):
+            # Climate indices do not need double precision on disk
+            if data_array.dtype.itemsize > 4:
+                encoding['dtype'] = 'float32'
+            if NETCDF_HAS_QUANTIZE:
+                encoding['significant_digits'] = 4
+                encoding['quantize_mode'] = 'GranularBitRound'
+        
+        # One chunk per year with up to 512x512 spatial tiles, matching the
+        # per-year access pattern instead of netCDF4's small default chunks
+        if data_array.ndim >= 2:
+            leading = (1,) * (data_array.ndim - 2)
+            spatial = tuple(min(size, 512) for size in data_array.shape[-2:])
+            encoding['chunksizes'] = leading + spatial
+        
+        return encoding
+    
+    @staticmethod
+    def _pixel_center_coords(transform: rasterio.Affine, width: int,
+                             height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute pixel-center longitudes (first row) and latitudes (first column)
+        
+        Args:
+            transform: Affine transform of the raster
+            width: Number of columns
+            height: Number of rows
+            
+        Returns:
+            Tuple of (lons, lats) arrays
+        """
+        a, b, c, d, e, f = transform[:6]
+        
+        if b == 0 and d == 0:
+            # North-up raster: one vectorized multiply-add per axis, giving exactly
+            # the values of transform * (col + 0.5, row + 0.5) for each pixel
+            lons = a * (np.arange(width, dtype=np.float64) + 0.5) + c
+            lats = e * (np.arange(height, dtype=np.float64) + 0.5) + f
+        else:
+            # Rotated raster: apply the full 3x3 affine matrix to the first row and
+            # first column of pixel centers in one matrix product each
+            matrix = np.array(transform, dtype=np.float64).reshape(3, 3)
+            col_centers = np.arange(width) + 0.5
+            row_centers = np.arange(height) + 0.5
+            lons = (matrix @ np.vstack([col_centers, np.zeros(width), np.ones(width)]))[0]
+            lats = (matrix @ np.vstack([np.zeros(height), row_centers, np.ones(height)]))[1]
+        
+        return lons, lats
+    
     def _export_netcdf_to_drive(self, image: ee.Image, export_name: str,
                              folder_name: str, status_callback: Optional[callable] = None) -> str:
         """
@@ -811,26 +1177,21 @@ class Exporter:
             status_callback("Setting up NetCDF export to Google Drive...")
         
         # Create export task
-        drive_folder = f"{self.export_root}/{folder_name}"
-        export_task = ee.batch.Export.image.toDrive(
+        drive_folder = self._drive_folder(folder_name)
+        export_task = self._drive_export_factory(drive_folder, 'NetCDF')(
             image=image,
             description=export_name,
-            folder=drive_folder,
-            fileNamePrefix=export_name,
-            crs='EPSG:4326',
-            scale=500,
-            maxPixels=1e9,
-            fileFormat='NetCDF'
+            fileNamePrefix=export_name
         )
         
-        # Start the task
-        export_task.start()
+        # Start the task (or queue it while too many exports are running)
+        start_state = "started" if self._start_drive_task(export_task) else "queued"
         
         # Update status
         if status_callback:
-            status_callback(f"NetCDF export to Google Drive started. The file will be saved to '{drive_folder}' folder in your Google Drive.")
+            status_callback(f"NetCDF export to Google Drive {start_state}. The file will be saved to '{drive_folder}' folder in your Google Drive.")
         
-        return f"NetCDF export to Google Drive started. The file will be saved to '{drive_folder}' folder in your Google Drive."
+        return f"NetCDF export to Google Drive {start_state}. The file will be saved to '{drive_folder}' folder in your Google Drive."
     
     def _export_all_geotiff_enhanced(self, panel_data: Dict[str, Any], export_name_base: str,
                                 folder_name: str, status_callback: Optional[callable] = None) -> str:
@@ -876,153 +1237,55 @@ class Exporter:
         failed_exports = 0
         total_years = end_year - start_year + 1
         
-        # Try using multiprocessing for parallel exports
+        self._prefetch_years_with_data(panel_data, start_year, end_year)
+        
+        # Export years concurrently: the work is dominated by blocking Earth Engine
+        # downloads, so threads driven from an asyncio loop avoid the pickling and
+        # process start-up costs of multiprocessing
         try:
-            # Import multiprocessing
-            import multiprocessing as mp
-            from functools import partial
-            
-            # Determine number of processes (use fewer processes than CPUs to avoid overwhelming the system)
-            num_processes = max(1, min(mp.cpu_count() - 1, 4))  # Use at most 4 processes
+            years_to_export = list(range(start_year, end_year + 1))
             
             if status_callback:
-                status_callback(f"Using {num_processes} parallel processes for export...")
-            
-            # Define function to export one year
-            def export_one_year(year, data_source, state_copy, folder):
-                try:
-                    # Get data for year
-                    year_data = self._get_data_for_year(data_source, year)
-                    
-                    if year_data:
-                        # Create export name
-                        year_export_name = f"{export_name_base}_{year}"
-                        
-                        # Create proper file path for this year using helper function
-                        # We'll place it in the time series subfolder
-                        year_filename = f"{year_export_name}"
-                        local_file_path = os.path.join(folder, f"{year_filename}.tif")
-                        
-                        # Get projection info from the image
-                        crs = year_data.projection().getInfo()['crs']
-                        scale = 500  # Default scale in meters
-                        
-                        # Create bounds for the export
-                        region = year_data.geometry().bounds().getInfo()['coordinates']
-                        
-                        # Use geemap to download the image
-                        task = geemap.ee_export_image(
-                            year_data, 
-                            filename=local_file_path,
-                            scale=scale,
-                            region=region,
-                            crs=crs,
-                            file_per_band=False
-                        )
-                        
-                        # Check if the file was created
-                        if os.path.exists(local_file_path):
-                            return (True, year)
-                        else:
-                            return (False, year)
-                    else:
-                        return (False, year)
-                except Exception as e:
-                    print(f"Error exporting year {year}: {str(e)}")
-                    return (False, year)
-            
-            # Create a partial function with fixed arguments
-            export_func = partial(
-                export_one_year, 
-                data_source=panel_data, 
-                state_copy=state.copy(),
-                folder=time_series_folder
-            )
+                status_callback(f"Using up to {self.max_concurrent_downloads} concurrent downloads for export...")
             
-            # Create a pool of processes
-            with mp.Pool(processes=num_processes) as pool:
-                # Export all years in parallel
-                years_to_export = list(range(start_year, end_year + 1))
+            def on_year_done(year, success):
+                nonlocal successful_exports, failed_exports
+                if success:
+                    successful_exports += 1
+                else:
+                    failed_exports += 1
                 
-                # Process years in batches to avoid overwhelming Earth Engine
-                batch_size = 5
-                for i in range(0, len(years_to_export), batch_size):
-                    batch = years_to_export[i:i+batch_size]
-                    
-                    if status_callback:
-                        status_callback(f"Processing years {batch[0]}-{batch[-1]} ({i+1}-{min(i+batch_size, len(years_to_export))} of {len(years_to_export)})...")
-                    
-                    # Process this batch in parallel
-                    results = pool.map(export_func, batch)
-                    
-                    # Count successes and failures
-                    for success, year in results:
-                        if success:
-                            successful_exports += 1
-                        else:
-                            failed_exports += 1
-                    
-                    # Update status
-                    if status_callback:
-                        status_callback(f"Completed {i+len(batch)} of {len(years_to_export)} years. {successful_exports} successful, {failed_exports} failed.")
+                if status_callback:
+                    status_callback(f"Completed {successful_exports + failed_exports} of {total_years} years. {successful_exports} successful, {failed_exports} failed.")
+            
+            self._run_coroutine(self._export_years_geotiff_async(
+                panel_data, years_to_export, export_name_base, time_series_folder, on_year_done
+            ))
             
         except Exception as e:
             # Fall back to sequential processing if parallel fails
             if status_callback:
                 status_callback(f"Parallel processing failed: {str(e)}. Falling back to sequential processing...")
             
+            successful_exports = 0
+            failed_exports = 0
+            
             # Process each year sequentially
             for year in range(start_year, end_year + 1):
+                # Update status
+                if status_callback:
+                    status_callback(f"Exporting year {year} ({year - start_year + 1} of {total_years})...")
+                
                 try:
-                    # Get data for year
-                    year_data = self._get_data_for_year(panel_data, year)
-                    
-                    if year_data:
-                        # Create export name
-                        year_export_name = f"{export_name_base}_{year}"
-                        
-                        # Update status
-                        if status_callback:
-                            status_callback(f"Exporting year {year} ({year - start_year + 1} of {total_years})...")
-                        
-                        # Create proper file path for this year
-                        local_file_path = os.path.join(time_series_folder, f"{year_export_name}.tif")
-                        
-                        try:
-                            # Get projection info from the image
-                            crs = year_data.projection().getInfo()['crs']
-                            scale = 500  # Default scale in meters
-                            
-                            # Create bounds for the export
-                            region = year_data.geometry().bounds().getInfo()['coordinates']
-                            
-                            # Use geemap to download the image
-                            task = geemap.ee_export_image(
-                                year_data, 
-                                filename=local_file_path,
-                                scale=scale,
-                                region=region,
-                                crs=crs,
-                                file_per_band=False
-                            )
-                            
-                            # Check if the file was created
-                            if os.path.exists(local_file_path):
-                                successful_exports += 1
-                            else:
-                                failed_exports += 1
-                                
-                        except Exception as e:
-                            failed_exports += 1
-                            if status_callback:
-                                status_callback(f"Error exporting year {year}: {str(e)}")
+                    if self._export_one_year_geotiff(panel_data, year, export_name_base, time_series_folder):
+                        successful_exports += 1
                     else:
                         failed_exports += 1
                 
                 except Exception as e:
                     failed_exports += 1
                     if status_callback:
-                        status_callback(f"Error processing year {year}: {str(e)}")
+                        status_callback(f"Error exporting year {year}: {str(e)}")
         
         # Final status update
         if successful_exports > 0:
@@ -1045,6 +1308,116 @@ class Exporter:
         
         return status_message
     
+    async def _export_years_geotiff_async(self, panel_data: Dict[str, Any], years: List[int],
+                                          export_name_base: str, folder: str,
+                                          on_year_done: Optional[callable] = None) -> List[Tuple[bool, int]]:
+        """
+        Download the GeoTIFFs for several years concurrently
+        
+        Args:
+            panel_data: Data for the panel
+            years: Years to export
+            export_name_base: Base name for export files
+            folder: Local folder for the year files
+            on_year_done: Optional callback called with (year, success) as each year finishes
+            
+        Returns:
+            List of (success, year) tuples in completion order
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+        results = []
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as pool:
+            async def export_year(year):
+                async with semaphore:
+                    try:
+                        success = await loop.run_in_executor(
+                            pool, self._export_one_year_geotiff, panel_data, year, export_name_base, folder
+                        )
+                    except Exception as e:
+                        print(f"Error exporting year {year}: {str(e)}")
+                        success = False
+                return (success, year)
+            
+            # Handle each year as soon as it finishes, so one slow download
+            # never holds back progress reporting for the others
+            for next_done in asyncio.as_completed([export_year(year) for year in years]):
+                success, year = await next_done
+                results.append((success, year))
+                if on_year_done:
+                    on_year_done(year, success)
+        
+        return results
+    
+    def _run_coroutine(self, coroutine):
+        """
+        Run a coroutine to completion from synchronous code
+        
+        Jupyter already runs an event loop in the main thread, where asyncio.run()
+        is not allowed, so in that case the coroutine gets its own loop in a
+        worker thread.
+        
+        Args:
+            coroutine: Coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, coroutine).result()
+    
+    def _export_one_year_geotiff(self, panel_data: Dict[str, Any], year: int,
+                                 export_name_base: str, folder: str) -> bool:
+        """
+        Download the GeoTIFF for a single year of an all-years export
+        
+        Args:
+            panel_data: Data for the panel
+            year: Year to export
+            export_name_base: Base name for export files
+            folder: Local folder for the year files
+            
+        Returns:
+            True if the year's file was written, False otherwise
+        """
+        # Get data for year
+        year_data = self._get_data_for_year(panel_data, year)
+        if not year_data:
+            return False
+        
+        # Create proper file path for this year
+        local_file_path = os.path.join(folder, f"{export_name_base}_{year}.tif")
+        
+        # Get projection and bounds (from the panel state when available)
+        state = panel_data.get('state', {})
+        region, crs = self._get_export_region_and_crs(year_data, state)
+        scale = 500  # Default scale in meters
+        
+        # Reuse an identical earlier download if the catalog has one
+        product = f"{state.get('dataset')}_{state.get('index')}"
+        cached_path = self._find_cached_export(product, year, year_data, region, crs, scale)
+        if cached_path:
+            shutil.copyfile(cached_path, local_file_path)
+            return True
+        
+        # Download the image (raises if the download fails)
+        self._download_image(
+            year_data,
+            filename=local_file_path,
+            scale=scale,
+            region=region,
+            crs=crs
+        )
+        
+        self._record_cached_export(product, year, year_data, region, crs, scale, local_file_path)
+        return True
+    
     def _export_all_geotiff_to_drive(self, panel_data: Dict[str, Any], export_name_base: str,
                                 folder_name: str, status_callback: Optional[callable] = None) -> str:
         """
@@ -1072,77 +1445,24 @@ class Exporter:
         time_range = state.get('time_range', (2020, 2020))
         start_year, end_year = time_range
         
-        # Fix folder name for consistency
-        parts = folder_name.split('/')
-        
-        # Fix dataset name (first part)
-        if len(parts) > 0:
-            if parts[0].lower() == "unknown":
-                parts[0] = "general"
-            # Make sure it's one of our standard directories or create custom
-            if parts[0] not in ["ERA5", "PRISM", "DAYMET", "general", "Custom"]:
-                # If it's a recognized name with different case, fix it
-                upper_part = parts[0].upper()
-                if upper_part in ["ERA5", "PRISM", "DAYMET"]:
-                    parts[0] = upper_part
-                else:
-                    # Create inside Custom folder
-                    parts = ["Custom", parts[0]]
+        # Create special folder for this export
+        drive_folder = self._drive_folder(folder_name, export_name_base)
         
-        # Ensure we have at least two parts
-        if len(parts) == 0:
-            parts = ["general", "data"]
-        elif len(parts) == 1:
-            parts.append("climate_data")
+        self._prefetch_years_with_data(panel_data, start_year, end_year)
         
-        # Reconstruct folder name
-        folder_name = '/'.join(parts)
+        # Export all years as one multi-band image (one band per year) in a single task
+        task_count, band_count = self._start_yearly_stack_drive_export(
+            panel_data, start_year, end_year, export_name_base, drive_folder, 'GeoTIFF', status_callback
+        )
         
-        # Create special folder for this export
-        drive_folder = f"{self.export_root}/{folder_name}/{export_name_base}"
+        # Final status update
+        status_message = (
+            f"Started {task_count} GeoTIFF export tasks to Google Drive with {band_count} yearly bands. "
+            f"Files will be saved to '{drive_folder}' folder."
+        )
         
-        # Track number of export tasks
-        task_count = 0
-        
-        # Create export tasks for each year
-        for year in range(start_year, end_year + 1):
-            try:
-                # Get data for year
-                year_data = self._get_data_for_year(panel_data, year)
-                
-                if year_data:
-                    # Create export name
-                    export_name = f"{export_name_base}_{year}"
-                    
-                    # Create export task
-                    export_task = ee.batch.Export.image.toDrive(
-                        image=year_data,
-                        description=export_name,
-                        folder=drive_folder,
-                        fileNamePrefix=export_name,
-                        crs='EPSG:4326',
-                        scale=500,
-                        maxPixels=1e9,
-                        fileFormat='GeoTIFF'
-                    )
-                    
-                    # Start the task
-                    export_task.start()
-                    task_count += 1
-                    
-                    # Update status periodically
-                    if status_callback and year % 5 == 0:
-                        status_callback(f"Started export task for year {year}...")
-            
-            except Exception as e:
-                if status_callback:
-                    status_callback(f"Warning: Error exporting year {year}: {str(e)}")
-        
-        # Final status update
-        status_message = f"Started {task_count} GeoTIFF export tasks to Google Drive. Files will be saved to '{drive_folder}' folder."
-        
-        if status_callback:
-            status_callback(status_message)
+        if status_callback:
+            status_callback(status_message)
         
         return status_message
     
@@ -1177,25 +1497,19 @@ class Exporter:
         print(f"Exporting CSV to: {local_file_path}")
         
         try:
+            # Small exports of uniform records are written directly, without a DataFrame copy
+            if len(temporal_data) <= self.max_rows_csv and self._write_records_csv(
+                    temporal_data, local_file_path, self._metadata_columns(panel_data)):
+                file_size_mb = os.path.getsize(local_file_path) / (1024 * 1024)
+                if status_callback:
+                    status_callback(f"CSV export completed. File saved to: {local_file_path} ({file_size_mb:.2f} MB)")
+                return f"CSV export completed. File saved to: {local_file_path} ({file_size_mb:.2f} MB)"
+            
             # Convert to DataFrame
-            df = pd.DataFrame(temporal_data)
+            df = self._temporal_to_dataframe(temporal_data)
             
             # Add metadata
-            state = panel_data.get('state', {})
-            dataset = panel_data.get('dataset', state.get('dataset', 'general'))
-            parameter = panel_data.get('parameter', state.get('parameter', 'climate'))
-            index = panel_data.get('index', state.get('index', 'data'))
-            
-            # Add metadata as columns
-            df['dataset'] = dataset
-            df['parameter'] = parameter
-            df['index'] = index
-            
-            # Reorder columns to put metadata first
-            cols = df.columns.tolist()
-            meta_cols = ['dataset', 'parameter', 'index']
-            data_cols = [col for col in cols if col not in meta_cols]
-            df = df[meta_cols + data_cols]
+            df = self._add_metadata_columns(df, panel_data)
             
             # Check size
             num_rows = len(df)
@@ -1215,18 +1529,11 @@ class Exporter:
                 os.makedirs(chunk_dir, exist_ok=True)
                 
                 # Export each chunk
-                for i in range(num_chunks):
-                    start_idx = i * chunk_size
-                    end_idx = min((i + 1) * chunk_size, num_rows)
-                    
-                    # Get chunk of data
-                    chunk_df = df.iloc[start_idx:end_idx]
-                    
-                    # Create chunk filename
-                    chunk_filename = os.path.join(chunk_dir, f"{export_name_base}_part_{i+1}_of_{num_chunks}.csv")
-                    
-                    # Save chunk
-                    chunk_df.to_csv(chunk_filename, index=False)
+                chunk_files = [
+                    os.path.join(chunk_dir, f"{export_name_base}_part_{i+1}_of_{num_chunks}.csv")
+                    for i in range(num_chunks)
+                ]
+                self._write_csv_chunks(df, chunk_size, chunk_files)
                 
                 # Also save a single file with basic info
                 summary_df = pd.DataFrame({
@@ -1241,7 +1548,7 @@ class Exporter:
                 return f"CSV export completed with chunking. {num_chunks} files created in {chunk_dir}"
             else:
                 # Save DataFrame for small files
-                df.to_csv(local_file_path, index=False)
+                self._write_csv(df, local_file_path)
                 
                 # Get file size
                 file_size_mb = os.path.getsize(local_file_path) / (1024 * 1024)
@@ -1258,6 +1565,149 @@ class Exporter:
                 status_callback(error_msg)
             return error_msg
     
+    def _add_metadata_columns(self, df: pd.DataFrame, panel_data: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Add dataset, parameter and index as leading columns of a temporal DataFrame
+        
+        Args:
+            df: Temporal data
+            panel_data: Data for the panel
+            
+        Returns:
+            DataFrame with the metadata columns first
+        """
+        metadata = self._metadata_columns(panel_data)
+        
+        # Add metadata as leading categorical columns (single category each,
+        # so no per-row string objects and no reorder copy of the frame)
+        existing_meta = [col for col in metadata if col in df.columns]
+        if existing_meta:
+            df = df.drop(columns=existing_meta)
+        
+        codes = np.zeros(len(df), dtype=np.int8)
+        for position, (col, value) in enumerate(metadata.items()):
+            df.insert(position, col, pd.Categorical.from_codes(codes, categories=[value]))
+        
+        return df
+    
+    def _metadata_columns(self, panel_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Dataset, parameter and index values added as columns to all-data exports"""
+        state = panel_data.get('state', {})
+        return {
+            'dataset': panel_data.get('dataset', state.get('dataset', 'general')),
+            'parameter': panel_data.get('parameter', state.get('parameter', 'climate')),
+            'index': panel_data.get('index', state.get('index', 'data'))
+        }
+    
+    def _write_records_csv(self, records: List[Dict[str, Any]], path: str,
+                           leading_columns: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Write a list of uniform dict records straight to CSV, without a DataFrame
+        
+        Uses pyarrow's C CSV writer when available and the csv module
+        otherwise. Records whose keys differ are left to the DataFrame path.
+        
+        Args:
+            records: Temporal data records
+            path: Output CSV path
+            leading_columns: Constant columns (name -> value) written first
+            
+        Returns:
+            True if the file was written, False if the records are not uniform
+        """
+        if not (isinstance(records, list) and records and isinstance(records[0], dict)):
+            return False
+        
+        first_keys = records[0].keys()
+        if any(not isinstance(row, dict) or row.keys() != first_keys for row in records):
+            return False
+        
+        leading_columns = leading_columns or {}
+        keys = [key for key in first_keys if key not in leading_columns]
+        
+        if pacsv is not None:
+            try:
+                table = pa.Table.from_pylist(records).select(keys)
+                for position, (name, value) in enumerate(leading_columns.items()):
+                    table = table.add_column(position, name, pa.array([value] * len(records)))
+                pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(include_header=True))
+                return True
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                # Values pyarrow cannot type or write - use the csv module instead
+                pass
+        
+        prefix = list(leading_columns.values())
+        with open(path, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(list(leading_columns) + keys)
+            writer.writerows(prefix + [row[key] for key in keys] for row in records)
+        
+        return True
+    
+    def _export_columnar_enhanced(self, panel_data: Dict[str, Any], export_name: str, folder_name: str,
+                                  format_type: str, status_callback: Optional[callable] = None,
+                                  add_metadata: bool = False) -> str:
+        """
+        Export temporal data as a Zstandard-compressed Parquet or Feather file
+        
+        Columnar binary files are much faster to write and smaller than CSV,
+        and need no chunking; CSV remains available for compatibility.
+        
+        Args:
+            panel_data: Data for the panel
+            export_name: File name for the export
+            folder_name: Folder name for organization
+            format_type: 'Parquet' or 'Feather'
+            status_callback: Optional callback for status updates
+            add_metadata: Add dataset/parameter/index columns (all-data exports)
+            
+        Returns:
+            Status message
+        """
+        # Update status
+        if status_callback:
+            status_callback(f"Setting up {format_type} export...")
+        
+        if pa is None:
+            return f"Error: {format_type} export requires pyarrow. Use CSV or install pyarrow."
+        
+        # Get temporal data
+        temporal_data = panel_data.get('temporal_data', [])
+        if not temporal_data:
+            return f"Error: No temporal data available for {format_type} export"
+        
+        extension = 'parquet' if format_type == 'Parquet' else 'feather'
+        local_file_path = self._get_export_path(format_type, folder_name, export_name, extension)
+        
+        # Log the export path
+        print(f"Exporting {format_type} to: {local_file_path}")
+        
+        try:
+            # Convert to DataFrame
+            df = self._temporal_to_dataframe(temporal_data)
+            if add_metadata:
+                df = self._add_metadata_columns(df, panel_data)
+            
+            if format_type == 'Parquet':
+                df.to_parquet(local_file_path, engine='pyarrow', compression='zstd', index=False)
+            else:
+                df.to_feather(local_file_path, compression='zstd')
+            
+            # Get file size
+            file_size_mb = os.path.getsize(local_file_path) / (1024 * 1024)
+            status_message = f"{format_type} export completed. File saved to: {local_file_path} ({file_size_mb:.2f} MB)"
+            
+            if status_callback:
+                status_callback(status_message)
+            
+            return status_message
+        
+        except Exception as e:
+            error_msg = f"{format_type} export failed: {str(e)}"
+            if status_callback:
+                status_callback(error_msg)
+            return error_msg
+    
     def _export_all_netcdf_enhanced(self, panel_data: Dict[str, Any], export_name_base: str,
                                 folder_name: str, status_callback: Optional[callable] = None) -> str:
         """
@@ -1299,136 +1749,143 @@ class Exporter:
         
         # First, try to create individual NetCDF files for each year
         individual_files = []
+        
+        # With netCDF4, each converted year is appended to the multi-year file
+        # as soon as it (and every earlier year) is done, so no merge pass is needed
+        merged_file = self._get_export_path('NetCDF', folder_name, f"{export_name_base}_all_years", 'nc')
+        merged_nc = None
+        stream_merge = netCDF4 is not None
         successful_exports = 0
         failed_exports = 0
         total_years = end_year - start_year + 1
         
-        for year in range(start_year, end_year + 1):
-            try:
-                # Get data for year
-                year_data = self._get_data_for_year(panel_data, year)
+        self._prefetch_years_with_data(panel_data, start_year, end_year)
+        
+        # Metadata written into every year file (plain values, so it can be
+        # sent to the conversion worker processes)
+        panel_meta = {
+            'title': panel_data.get('index', 'climate_index'),
+            'units': panel_data.get('results', {}).get('units', 'unknown'),
+            'dataset': panel_data.get('dataset', 'general'),
+            'parameter': panel_data.get('parameter', 'climate'),
+            'index': panel_data.get('index', 'data')
+        }
+        
+        # Global attributes of the multi-year file
+        merged_attrs = {
+            'title': f"{panel_meta['title']} {start_year}-{end_year}",
+            'source': 'Climate Analysis Tool',
+            'creation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'years_included': f"{start_year}-{end_year}",
+            'dataset': panel_meta['dataset'],
+            'parameter': panel_meta['parameter'],
+            'index': panel_meta['index']
+        }
+        
+        def download_year(year):
+            """Download one year's GeoTIFF; returns (GeoTIFF bytes, NetCDF path) or None without data"""
+            year_data = self._get_data_for_year(panel_data, year)
+            if not year_data:
+                return None
+            
+            # Create export name and path for this year
+            year_export_name = f"{export_name_base}_{year}"
+            year_file_path = os.path.join(years_folder, f"{year_export_name}.nc")
+            
+            # Get projection and bounds (from the panel state when available)
+            region, crs = self._get_export_region_and_crs(year_data, state)
+            scale = 500  # Default scale in meters
+            
+            # Download the image into memory; the GeoTIFF never touches the disk
+            geotiff_bytes = self._download_image_bytes(
+                year_data,
+                scale=scale,
+                region=region,
+                crs=crs
+            )
+            
+            return geotiff_bytes, year_file_path
+        
+        # Pipeline: downloads run in threads (network-bound) and each finished
+        # GeoTIFF is handed straight to a worker process for conversion, so
+        # conversion overlaps with the remaining downloads. Workers are spawned,
+        # not forked: forking while the download, HTTP and Earth Engine threads
+        # run can deadlock the child (notably under ipykernel)
+        conversions = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as downloader, \
+                ProcessPoolExecutor(max_workers=self.max_conversion_workers,
+                                    mp_context=multiprocessing.get_context('spawn')) as converter:
+            downloads = {downloader.submit(download_year, year): year for year in range(start_year, end_year + 1)}
+            
+            for downloaded, future in enumerate(as_completed(downloads), start=1):
+                year = downloads[future]
                 
-                if year_data:
-                    # Create export name
-                    year_export_name = f"{export_name_base}_{year}"
-                    
-                    # Update status
+                # Update status (the only progress message per year, to keep callback traffic low)
+                if status_callback:
+                    status_callback(f"Exporting year {year} ({downloaded} of {total_years})...")
+                
+                try:
+                    downloaded_year = future.result()
+                except Exception as e:
+                    failed_exports += 1
                     if status_callback:
-                        status_callback(f"Exporting year {year} ({year - start_year + 1} of {total_years})...")
-                    
-                    # Create proper file path for this year
-                    year_file_path = os.path.join(years_folder, f"{year_export_name}.nc")
-                    
-                    # Export this year to NetCDF
+                        status_callback(f"Error exporting year {year}: {str(e)}")
+                    continue
+                
+                if downloaded_year is None:
+                    failed_exports += 1
+                    continue
+                
+                geotiff_bytes, year_file_path = downloaded_year
+                conversion = converter.submit(
+                    _convert_year_geotiff_to_netcdf,
+                    geotiff_bytes, year_file_path, year, panel_meta
+                )
+                conversions[conversion] = year
+            
+            # Years are appended in order, each read back from its year file;
+            # years that finish early wait in finished_years (as paths only)
+            # until every earlier year has been resolved
+            pending_years = sorted(conversions.values())
+            finished_years = {}
+            
+            # Collect conversions as they finish
+            for future in as_completed(conversions):
+                year = conversions[future]
+                year_file_path = None
+                try:
+                    year, year_file_path = future.result()
+                    individual_files.append((year, year_file_path))
+                    successful_exports += 1
+                except Exception as e:
+                    failed_exports += 1
+                    if status_callback:
+                        status_callback(f"Error converting year {year} to NetCDF: {str(e)}")
+                
+                if not stream_merge:
+                    continue
+                
+                finished_years[year] = year_file_path
+                while stream_merge and pending_years and pending_years[0] in finished_years:
+                    next_year = pending_years.pop(0)
+                    next_path = finished_years.pop(next_year)
+                    if next_path is None:
+                        continue
                     try:
-                        # First export as GeoTIFF
-                        temp_geotiff_path = os.path.join(self.local_export_dir, 'temp', f"{year_export_name}_temp.tif")
-                        
-                        # Get projection info from the image
-                        crs = year_data.projection().getInfo()['crs']
-                        scale = 500  # Default scale in meters
-                        
-                        # Create bounds for the export
-                        region = year_data.geometry().bounds().getInfo()['coordinates']
-                        
-                        # Use geemap to download the image as GeoTIFF
-                        task = geemap.ee_export_image(
-                            year_data, 
-                            filename=temp_geotiff_path,
-                            scale=scale,
-                            region=region,
-                            crs=crs,
-                            file_per_band=False
-                        )
-                        
-                        # Wait for the GeoTIFF to be created
-                        if status_callback:
-                            status_callback(f"Downloading data for year {year}, please wait...")
-                        
-                        # Check if the file was created successfully
-                        if os.path.exists(temp_geotiff_path):
-                            # Convert to NetCDF
-                            if status_callback:
-                                status_callback(f"Converting year {year} to NetCDF format...")
-                            
-                            # Use xarray and rasterio to convert
-                            with rasterio.open(temp_geotiff_path) as src:
-                                # Get data and metadata
-                                data = src.read(1)  # Read the first band
-                                transform = src.transform
-                                
-                                # Create coordinates
-                                height, width = data.shape
-                                rows = np.arange(height)
-                                cols = np.arange(width)
-                                
-                                # Create lon/lat coordinates
-                                lons = np.zeros(width)
-                                lats = np.zeros(height)
-                                
-                                for col in range(width):
-                                    x, y = transform * (col + 0.5, 0)  # +0.5 for pixel center
-                                    lons[col] = x
-                                
-                                for row in range(height):
-                                    x, y = transform * (0, row + 0.5)  # +0.5 for pixel center
-                                    lats[row] = y
-                                
-                                # Create xarray dataset
-                                da = xr.DataArray(
-                                    data,
-                                    dims=('lat', 'lon'),
-                                    coords={'lat': lats, 'lon': lons},
-                                    attrs={
-                                        'long_name': f"{panel_data.get('index', 'climate_index')} {year}",
-                                        'units': panel_data.get('results', {}).get('units', 'unknown'),
-                                        'missing_value': src.nodata if src.nodata is not None else -9999,
-                                        'year': year
-                                    }
-                                )
-                                
-                                # Create dataset with year in the name
-                                ds = xr.Dataset({
-                                    'data': da
-                                }, attrs={
-                                    'title': f"{panel_data.get('index', 'climate_index')} {year}",
-                                    'source': 'Climate Analysis Tool',
-                                    'creation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                                    'year': year,
-                                    'dataset': panel_data.get('dataset', 'general'),
-                                    'parameter': panel_data.get('parameter', 'climate'),
-                                    'index': panel_data.get('index', 'data')
-                                })
-                                
-                                # Save as NetCDF with compression
-                                encoding = {'data': {'zlib': True, 'complevel': 5}}
-                                ds.to_netcdf(year_file_path, encoding=encoding)
-                                
-                                # Clean up temp file
-                                try:
-                                    os.remove(temp_geotiff_path)
-                                except:
-                                    pass
-                                
-                                # Add to list of successful exports
-                                individual_files.append((year, year_file_path))
-                                successful_exports += 1
-                        else:
-                            failed_exports += 1
-                            if status_callback:
-                                status_callback(f"Failed to export year {year}: temporary file not created")
-                    
+                        # Undecoded, so values and attributes match what was written
+                        with xr.open_dataset(next_path, mask_and_scale=False) as next_ds:
+                            if merged_nc is None:
+                                merged_nc = self._create_merged_netcdf(merged_file, next_ds, merged_attrs)
+                            self._append_merged_netcdf_year(merged_nc, next_year, next_ds)
                     except Exception as e:
-                        failed_exports += 1
+                        # Give up on streaming; the year files are merged afterwards instead
                         if status_callback:
-                            status_callback(f"Error exporting year {year}: {str(e)}")
-                else:
-                    failed_exports += 1
-            
-            except Exception as e:
-                failed_exports += 1
-                if status_callback:
-                    status_callback(f"Error processing year {year}: {str(e)}")
+                            status_callback(f"Warning: Could not append year {next_year} to the multi-year file: {str(e)}")
+                        if merged_nc is not None:
+                            merged_nc.close()
+                            merged_nc = None
+                        stream_merge = False
+                        finished_years.clear()
         
         # Now try to merge all individual files into a single NetCDF with time dimension
         if successful_exports > 0:
@@ -1439,43 +1896,64 @@ class Exporter:
                 # Sort files by year
                 individual_files.sort(key=lambda x: x[0])
                 
-                # Create merged file path using our helper
-                merged_file = self._get_export_path('NetCDF', folder_name, f"{export_name_base}_all_years", 'nc')
-                
-                # Use xarray to open and merge files
+                # Use xarray to open and merge files (unless the years were already streamed in)
                 datasets = []
-                for year, file_path in individual_files:
+                combined = None
+                streamed = merged_nc is not None
+                if streamed:
                     try:
-                        ds = xr.open_dataset(file_path)
-                        # Add year as a coordinate if not already present
-                        if 'year' not in ds.coords:
-                            ds = ds.assign_coords(year=year)
-                        # Add year as a dimension to all data variables
-                        if 'year' not in ds.dims:
-                            ds = ds.expand_dims('year')
-                        datasets.append(ds)
-                    except Exception as e:
-                        if status_callback:
-                            status_callback(f"Warning: Could not include year {year}: {str(e)}")
+                        # Regional mean series alongside the grids, so one file holds both
+                        years = np.asarray(merged_nc.variables['year'][:])
+                        regional_mean = self._regional_mean_for_years(panel_data, years)
+                        if regional_mean is not None:
+                            mean_var = merged_nc.createVariable('regional_mean', 'f4', ('year',), fill_value=np.nan)
+                            mean_var[:] = regional_mean
+                            mean_var.setncatts(self.REGIONAL_MEAN_ATTRS)
+                    finally:
+                        merged_nc.close()
+                elif HAS_DASK:
+                    # Lazy, dask-backed merge: years stream chunk by chunk into the
+                    # merged file instead of all being loaded into memory first.
+                    # Every year shares the same grid, so lat/lon are taken from the
+                    # first file instead of being loaded and compared across all of them
+                    combined = xr.open_mfdataset(
+                        [file_path for _, file_path in individual_files],
+                        combine='nested',
+                        concat_dim=pd.Index([year for year, _ in individual_files], name='year'),
+                        parallel=True,
+                        chunks={'lat': 512, 'lon': 512},
+                        coords='minimal',
+                        compat='override',
+                        join='override',
+                        combine_attrs='override'
+                    )
+                    datasets.append(combined)
+                else:
+                    combined = self._stack_year_datasets(individual_files, status_callback)
                 
-                if datasets:
-                    # Merge along the year dimension
-                    combined = xr.concat(datasets, dim='year')
-                    
+                if combined is not None:
                     # Add metadata
-                    combined.attrs.update({
-                        'title': f"{panel_data.get('index', 'climate_index')} {start_year}-{end_year}",
-                        'source': 'Climate Analysis Tool',
-                        'creation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'years_included': f"{start_year}-{end_year}",
-                        'dataset': panel_data.get('dataset', 'general'),
-                        'parameter': panel_data.get('parameter', 'climate'),
-                        'index': panel_data.get('index', 'data')
-                    })
+                    combined.attrs.update(merged_attrs)
+                    
+                    # Regional mean series alongside the grids, so one file holds both
+                    regional_mean = self._regional_mean_for_years(panel_data, combined['year'].values)
+                    if regional_mean is not None:
+                        combined['regional_mean'] = xr.DataArray(
+                            regional_mean, dims=('year',), attrs=dict(self.REGIONAL_MEAN_ATTRS)
+                        )
                     
                     # Save as NetCDF with compression
-                    encoding = {var: {'zlib': True, 'complevel': 5} for var in combined.data_vars}
+                    encoding = {var: self._netcdf_var_encoding(combined[var]) for var in combined.data_vars}
                     combined.to_netcdf(merged_file, encoding=encoding)
+                
+                if streamed or combined is not None:
+                    # Optional companion Zarr store for fast parallel reads downstream
+                    zarr_message = ""
+                    if panel_data.get('export_zarr', False):
+                        if combined is None:
+                            combined = xr.open_dataset(merged_file, chunks={'lat': 512, 'lon': 512} if HAS_DASK else None)
+                            datasets.append(combined)
+                        zarr_message = self._write_zarr_companion(combined, merged_file, status_callback)
                     
                     # Close datasets
                     for ds in datasets:
@@ -1487,7 +1965,7 @@ class Exporter:
                     status_message = (
                         f"NetCDF export completed. {successful_exports} of {total_years} years exported. "
                         f"Multi-year file saved to: {merged_file} ({file_size_mb:.2f} MB). "
-                        f"Individual year files available in {years_folder}."
+                        f"Individual year files available in {years_folder}.{zarr_message}"
                     )
                     
                     if failed_exports > 0:
@@ -1518,6 +1996,198 @@ class Exporter:
         
         return status_message
     
+    def _stack_year_datasets(self, individual_files: List[Tuple[int, str]],
+                             status_callback: Optional[callable] = None) -> Optional[xr.Dataset]:
+        """
+        Stack per-year datasets into one (year, lat, lon) dataset in memory
+        
+        The years are copied into a single preallocated array, so peak memory
+        is one copy of the stack plus one year, rather than every year twice
+        as with xr.concat over a list of expanded datasets.
+        
+        Args:
+            individual_files: (year, NetCDF path) pairs, sorted by year
+            status_callback: Optional callback for status updates
+            
+        Returns:
+            Stacked dataset with variable 'data', or None if no year could be read
+        """
+        stack = None
+        years = []
+        for year, file_path in individual_files:
+            try:
+                with xr.open_dataset(file_path) as ds:
+                    data = ds['data']
+                    if stack is None:
+                        # Same grid every year, so the first year sizes the stack
+                        lats, lons, attrs = data['lat'].values, data['lon'].values, dict(data.attrs)
+                        stack = np.empty((len(individual_files),) + data.shape, dtype=data.dtype)
+                    elif data.shape != stack.shape[1:]:
+                        raise ValueError(f"grid {data.shape} differs from {stack.shape[1:]}")
+                    stack[len(years)] = data.values
+                    years.append(year)
+            except Exception as e:
+                if status_callback:
+                    status_callback(f"Warning: Could not include year {year}: {str(e)}")
+        
+        if not years:
+            return None
+        
+        return xr.Dataset({
+            'data': xr.DataArray(
+                stack[:len(years)],
+                dims=('year', 'lat', 'lon'),
+                coords={'year': years, 'lat': lats, 'lon': lons},
+                attrs=attrs
+            )
+        })
+    
+    def _regional_mean_for_years(self, panel_data: Dict[str, Any], years: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Align the panel's temporal data (regional mean per year) to a year axis
+        
+        Args:
+            panel_data: Data for the panel
+            years: Years of the multi-year file
+            
+        Returns:
+            float32 array with one value per year (NaN where missing), or None
+            without temporal data
+        """
+        temporal_data = panel_data.get('temporal_data') or []
+        values_by_year = {
+            int(row['year']): row['value'] for row in temporal_data
+            if isinstance(row, dict) and row.get('year') is not None and row.get('value') is not None
+        }
+        if not values_by_year:
+            return None
+        
+        return np.array([values_by_year.get(int(year), np.nan) for year in years], dtype=np.float32)
+    
+    def _create_merged_netcdf(self, merged_file: str, first_ds: xr.Dataset,
+                              attrs: Dict[str, Any]) -> 'netCDF4.Dataset':
+        """
+        Create the multi-year NetCDF file with an unlimited 'year' dimension
+        
+        Variables, attributes and the compressed, chunked layout are taken from
+        the first year; years are then added with _append_merged_netcdf_year.
+        
+        Args:
+            merged_file: Path of the multi-year NetCDF file
+            first_ds: Dataset of the first year ('data' on a lat/lon grid)
+            attrs: Global attributes of the multi-year file
+            
+        Returns:
+            Open netCDF4 dataset, to be closed by the caller
+        """
+        data = first_ds['data']
+        nc = netCDF4.Dataset(merged_file, 'w')
+        try:
+            nc.createDimension('year', None)
+            nc.createDimension('lat', data.sizes['lat'])
+            nc.createDimension('lon', data.sizes['lon'])
+            
+            nc.createVariable('year', 'i4', ('year',))
+            for name in ('lat', 'lon'):
+                coord = nc.createVariable(name, 'f8', (name,))
+                coord[:] = first_ds[name].values
+            
+            # Same compression, quantization and chunking as the per-year files
+            encoding = self._netcdf_var_encoding(data.expand_dims('year'))
+            datatype = np.dtype(encoding.pop('dtype', data.dtype))
+            is_float = np.issubdtype(datatype, np.floating)
+            data_var = nc.createVariable(
+                'data', datatype, ('year', 'lat', 'lon'),
+                fill_value=np.nan if is_float else None,
+                **encoding
+            )
+            
+            # The per-year 'year' attribute does not apply to the whole series;
+            # reserved attributes of a year file read back undecoded (_FillValue,
+            # quantization) are set by createVariable itself
+            var_attrs = {key: value for key, value in data.attrs.items()
+                         if key != 'year' and not key.startswith('_')}
+            if 'missing_value' in var_attrs:
+                var_attrs['missing_value'] = np.array(var_attrs['missing_value'], dtype=datatype)
+            data_var.setncatts(var_attrs)
+            
+            global_attrs = {key: value for key, value in first_ds.attrs.items() if key != 'year'}
+            global_attrs.update(attrs)
+            nc.setncatts(global_attrs)
+        except Exception:
+            nc.close()
+            raise
+        
+        return nc
+    
+    def _append_merged_netcdf_year(self, nc: 'netCDF4.Dataset', year: int, ds: xr.Dataset):
+        """
+        Append one year to a multi-year NetCDF file from _create_merged_netcdf
+        
+        Args:
+            nc: Open multi-year netCDF4 dataset
+            year: Year of the data
+            ds: Dataset of the year, on the same grid as the first year
+        """
+        data = ds['data'].values
+        if data.shape != nc.variables['data'].shape[1:]:
+            raise ValueError(f"grid {data.shape} differs from {nc.variables['data'].shape[1:]}")
+        
+        index = len(nc.dimensions['year'])
+        nc.variables['year'][index] = year
+        nc.variables['data'][index, :, :] = data
+    
+    def _write_zarr_companion(self, combined: xr.Dataset, merged_file: str,
+                              status_callback: Optional[callable] = None) -> str:
+        """
+        Write the merged multi-year dataset to a Zarr store next to the NetCDF file
+        
+        Chunks hold one year and up to 512x512 pixels and are Zstandard
+        compressed, so per-year or per-region reads decompress in parallel.
+        
+        Args:
+            combined: Merged dataset with a 'year' dimension
+            merged_file: Path of the merged NetCDF file
+            status_callback: Optional callback for status updates
+            
+        Returns:
+            Sentence to append to the status message ('' if not written)
+        """
+        if zarr is None:
+            if status_callback:
+                status_callback("Warning: zarr is not installed, skipping Zarr export")
+            return ""
+        
+        zarr_path = os.path.splitext(merged_file)[0] + '.zarr'
+        
+        try:
+            if status_callback:
+                status_callback("Writing companion Zarr store...")
+            
+            # zarr 3 takes a list of codecs, zarr 2 a single numcodecs compressor
+            if int(zarr.__version__.split('.')[0]) >= 3:
+                compression = {'compressors': [zarr.codecs.ZstdCodec(level=3)]}
+            else:
+                from numcodecs import Zstd
+                compression = {'compressor': Zstd(level=3)}
+            
+            encoding = {}
+            for var in combined.data_vars:
+                data_array = combined[var]
+                chunks = tuple(
+                    1 if dim == 'year' else min(size, 512)
+                    for dim, size in zip(data_array.dims, data_array.shape)
+                )
+                encoding[var] = {'chunks': chunks, **compression}
+            
+            combined.to_zarr(zarr_path, mode='w', encoding=encoding)
+            return f" Zarr store saved to: {zarr_path}."
+        
+        except Exception as e:
+            if status_callback:
+                status_callback(f"Warning: Could not write Zarr store: {str(e)}")
+            return ""
+    
     def _export_all_netcdf_to_drive(self, panel_data: Dict[str, Any], export_name_base: str,
                                   folder_name: str, status_callback: Optional[callable] = None) -> str:
         """
@@ -1547,71 +2217,471 @@ class Exporter:
         start_year, end_year = time_range
         
         # Create special folder for this export
-        drive_folder = f"{self.export_root}/{folder_name}/{export_name_base}"
+        drive_folder = self._drive_folder(folder_name, export_name_base)
         
-        # Track number of export tasks
-        task_count = 0
+        self._prefetch_years_with_data(panel_data, start_year, end_year)
         
-        # Create export tasks for each year
-        for year in range(start_year, end_year + 1):
-            try:
-                # Get data for year
-                year_data = self._get_data_for_year(panel_data, year)
-                
-                if year_data:
-                    # Create export name
-                    export_name = f"{export_name_base}_{year}"
-                    
-                    # Create export task
-                    export_task = ee.batch.Export.image.toDrive(
-                        image=year_data,
-                        description=export_name,
-                        folder=drive_folder,
-                        fileNamePrefix=export_name,
-                        crs='EPSG:4326',
-                        scale=500,
-                        maxPixels=1e9,
-                        fileFormat='NetCDF'
-                    )
-                    
-                    # Start the task
-                    export_task.start()
-                    task_count += 1
-                    
-                    # Update status periodically
-                    if status_callback and year % 5 == 0:
-                        status_callback(f"Started export task for year {year}...")
-            
-            except Exception as e:
-                if status_callback:
-                    status_callback(f"Warning: Error exporting year {year}: {str(e)}")
+        # Export all years as one multi-band image (one band per year) in a single task
+        task_count, band_count = self._start_yearly_stack_drive_export(
+            panel_data, start_year, end_year, export_name_base, drive_folder, 'NetCDF', status_callback
+        )
         
         # Final status update
-        status_message = f"Started {task_count} NetCDF export tasks to Google Drive. Files will be saved to '{drive_folder}' folder."
+        status_message = (
+            f"Started {task_count} NetCDF export tasks to Google Drive with {band_count} yearly bands. "
+            f"Files will be saved to '{drive_folder}' folder."
+        )
         
         if status_callback:
             status_callback(status_message)
         
         return status_message
     
-    def _get_data_for_year(self, panel_data: Dict[str, Any], year: int) -> Optional[ee.Image]:
+    def _drive_folder(self, folder_name: str, export_name_base: Optional[str] = None) -> str:
         """
-        Get data for a specific year with improved implementation
+        Resolve the Google Drive folder for an export
+        
+        Normalized the same way for every Drive export, so exports of one
+        dataset and index always land in one folder.
         
         Args:
-            panel_data: Data for the panel
-            year: Year to retrieve data for
+            folder_name: Folder structure (e.g. 'ERA5/Temperature')
+            export_name_base: Optional subfolder for a multi-year export
             
         Returns:
-            Earth Engine image for the year or None if not available
+            Drive folder path
         """
-        try:
-            # Get state
-            state = panel_data.get('state', {})
-            if not state:
-                return None
+        return '/'.join((self.export_root,) + self._drive_folder_parts(folder_name, export_name_base))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _drive_folder_parts(folder_name: str, export_name_base: Optional[str] = None) -> Tuple[str, ...]:
+        """
+        Normalize the folder parts of a Drive export (below export_root)
+        
+        Cached, as all exports of a batch resolve the same folder. Keyed on
+        the names only, so no exporter is kept alive by the cache.
+        
+        Args:
+            folder_name: Folder structure (e.g. 'ERA5/Temperature')
+            export_name_base: Optional subfolder for a multi-year export
             
-            # Extract necessary parameters
+        Returns:
+            Tuple of folder names
+        """
+        parts = [part for part in folder_name.split('/') if part]
+        
+        # Fix dataset name (first part)
+        if len(parts) > 0:
+            if parts[0].lower() == "unknown":
+                parts[0] = "general"
+            # Make sure it's one of our standard directories or create custom
+            if parts[0] not in ["ERA5", "PRISM", "DAYMET", "general", "Custom"]:
+                # If it's a recognized name with different case, fix it
+                upper_part = parts[0].upper()
+                if upper_part in ["ERA5", "PRISM", "DAYMET"]:
+                    parts[0] = upper_part
+                else:
+                    # Create inside Custom folder
+                    parts = ["Custom", parts[0]]
+        
+        # Ensure we have at least two parts
+        if len(parts) == 0:
+            parts = ["general", "data"]
+        elif len(parts) == 1:
+            parts.append("climate_data")
+        
+        if export_name_base:
+            parts.append(export_name_base)
+        
+        return tuple(parts)
+    
+    def _drive_export_factory(self, drive_folder: str, file_format: str) -> functools.partial:
+        """
+        Create a Drive export task builder with the folder, format and defaults bound
+        
+        The format's entry in drive_format_options, if any, is passed as
+        formatOptions, and its DRIVE_TILING entry sets shard and file sizes.
+        
+        Args:
+            drive_folder: Google Drive folder
+            file_format: Earth Engine file format ('GeoTIFF' or 'NetCDF')
+            
+        Returns:
+            Callable taking image, description and fileNamePrefix that returns
+            an unstarted export task
+        """
+        format_kwargs = {}
+        if self.drive_format_options.get(file_format):
+            format_kwargs['formatOptions'] = dict(self.drive_format_options[file_format])
+        tiling = self.DRIVE_TILING.get(file_format, {})
+        if 'fileDimensions' in tiling:
+            format_kwargs['fileDimensions'] = list(tiling['fileDimensions'])
+        if 'shardSize' in tiling:
+            format_kwargs['shardSize'] = tiling['shardSize']
+        
+        return functools.partial(
+            ee.batch.Export.image.toDrive,
+            folder=drive_folder,
+            fileFormat=file_format,
+            **self.DEFAULT_EXPORT_KWARGS,
+            **format_kwargs
+        )
+    
+    def _start_drive_task(self, export_task: ee.batch.Task) -> bool:
+        """
+        Start an Earth Engine export task, or queue it if MAX_ACTIVE_EXPORTS are running
+        
+        Queued tasks are started in order by a background worker as running
+        tasks finish.
+        
+        Args:
+            export_task: Export task to start
+            
+        Returns:
+            True if the task was started, False if it was queued
+        """
+        if not Exporter._task_slots.acquire(blocking=False):
+            with Exporter._task_queue_lock:
+                Exporter._pending_tasks.append(export_task)
+                self._ensure_task_queue_worker()
+            return False
+        
+        try:
+            self._start_task_with_backoff(export_task)
+        except Exception:
+            Exporter._task_slots.release()
+            raise
+        
+        with Exporter._task_queue_lock:
+            Exporter._active_tasks[export_task.id] = export_task
+        return True
+    
+    def poll_tasks(self) -> Dict[str, int]:
+        """
+        Check the running export tasks and free the slots of finished ones
+        
+        Uses a single task list request for all tasks.
+        
+        Returns:
+            Dictionary with the number of 'active', 'pending' and newly 'finished' tasks
+        """
+        finished = 0
+        with Exporter._task_queue_lock:
+            has_active = bool(Exporter._active_tasks)
+        
+        if has_active:
+            # The task list request is made without holding the lock
+            states = {task.id: getattr(task, 'state', None) for task in ee.batch.Task.list()}
+            with Exporter._task_queue_lock:
+                for task_id in list(Exporter._active_tasks):
+                    if states.get(task_id) in ('COMPLETED', 'FAILED', 'CANCELLED'):
+                        del Exporter._active_tasks[task_id]
+                        Exporter._task_slots.release()
+                        finished += 1
+        
+        with Exporter._task_queue_lock:
+            return {
+                'active': len(Exporter._active_tasks),
+                'pending': len(Exporter._pending_tasks),
+                'finished': finished
+            }
+    
+    def _ensure_task_queue_worker(self):
+        """Start the daemon thread that drains the pending task queue (call with the queue lock held)"""
+        worker = Exporter._task_queue_worker
+        if worker is not None and worker.is_alive():
+            return
+        
+        Exporter._task_queue_worker = threading.Thread(target=self._drain_task_queue, daemon=True)
+        Exporter._task_queue_worker.start()
+    
+    def _drain_task_queue(self):
+        """Start queued export tasks in FIFO order as slots free up"""
+        interval = self.task_poll_interval
+        while True:
+            with Exporter._task_queue_lock:
+                if not Exporter._pending_tasks:
+                    Exporter._task_queue_worker = None
+                    return
+            
+            finished = 0
+            try:
+                finished = self.poll_tasks()['finished']
+            except Exception as e:
+                print(f"Warning: Could not poll export tasks: {str(e)}")
+            
+            while Exporter._task_slots.acquire(blocking=False):
+                with Exporter._task_queue_lock:
+                    if not Exporter._pending_tasks:
+                        Exporter._task_slots.release()
+                        break
+                    export_task = Exporter._pending_tasks.popleft()
+                
+                try:
+                    self._start_task_with_backoff(export_task)
+                    with Exporter._task_queue_lock:
+                        Exporter._active_tasks[export_task.id] = export_task
+                except Exception as e:
+                    Exporter._task_slots.release()
+                    print(f"Warning: Could not start queued export task: {str(e)}")
+            
+            # Poll quickly after a slot freed up, back off while nothing changes
+            if finished:
+                interval = self.task_poll_interval
+            else:
+                interval = min(interval * self.task_poll_backoff, self.task_poll_max_interval)
+            time.sleep(interval)
+    
+    def _start_task_with_backoff(self, export_task: ee.batch.Task, max_retries: int = 3):
+        """
+        Start an Earth Engine export task, backing off while Earth Engine's queue is full
+        
+        Earth Engine rejects new tasks with a "too many tasks" error once the
+        account's concurrent task limit is reached; those starts are retried
+        with exponential backoff (2, 4, 8 s). Any other error is raised as is.
+        
+        Args:
+            export_task: Export task to start
+            max_retries: Number of retries after a "too many tasks" rejection
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                export_task.start()
+                return
+            except ee.EEException as e:
+                if 'too many' not in str(e).lower() or attempt == max_retries:
+                    raise
+                time.sleep(2 ** (attempt + 1))
+    
+    def _build_yearly_image_stack(self, panel_data: Dict[str, Any], start_year: int,
+                                  end_year: int) -> Tuple[Optional[ee.Image], Dict[str, int]]:
+        """
+        Stack the images of all years into one multi-band image (band 'b<year>')
+        
+        Years whose image expression is identical to an earlier year's (for
+        example when every year falls back to the same cached image) are only
+        included once, so no duplicate bands are rendered.
+        
+        Args:
+            panel_data: Data for the panel
+            start_year: First year
+            end_year: Last year
+            
+        Returns:
+            Tuple of (stacked image or None without data, counters with
+            'planned', 'deduped' and 'skipped' years)
+        """
+        counts = {'planned': 0, 'deduped': 0, 'skipped': 0}
+        
+        # With an analysis engine every year is computed in one server-side
+        # expression; the Python loop below is only needed for the cached-data
+        # fallback of _get_data_for_year
+        stack = self._build_yearly_image_stack_server_side(panel_data, start_year, end_year, counts)
+        if stack is not None or counts['planned']:
+            return stack, counts
+        
+        images = []
+        band_names = []
+        seen = set()
+        
+        for year in range(start_year, end_year + 1):
+            counts['planned'] += 1
+            
+            year_data = self._get_data_for_year(panel_data, year)
+            if not year_data:
+                counts['skipped'] += 1
+                continue
+            
+            key = hash(year_data.serialize())
+            if key in seen:
+                counts['deduped'] += 1
+                continue
+            
+            seen.add(key)
+            images.append(year_data)
+            band_names.append(f"b{year}")
+        
+        if not images:
+            return None, counts
+        
+        stack = ee.ImageCollection.fromImages(images).toBands().rename(band_names)
+        return stack, counts
+    
+    def _build_yearly_image_stack_server_side(self, panel_data: Dict[str, Any], start_year: int,
+                                              end_year: int, counts: Dict[str, int]) -> Optional[ee.Image]:
+        """
+        Stack the yearly images with ee.List mapping instead of a per-year Python loop
+        
+        Years that _prefetch_years_with_data found empty are left out. Every
+        year is a distinct computation here, so no years are deduplicated.
+        
+        Args:
+            panel_data: Data for the panel
+            start_year: First year
+            end_year: Last year
+            counts: Counters to fill in ('planned', 'deduped', 'skipped')
+            
+        Returns:
+            Stacked image, or None when not applicable (counters left at zero)
+            or no year has data
+        """
+        state = panel_data.get('state', {})
+        analysis_engine = panel_data.get('analysis_engine')
+        geometry = state.get('geometry')
+        if not analysis_engine or not all([geometry, state.get('dataset'), state.get('parameter'), state.get('index')]):
+            return None
+        
+        availability = self._year_availability_cache.get(self._geometry_cache_key(state), {})
+        years = [year for year in range(start_year, end_year + 1) if availability.get(year) is not False]
+        counts['planned'] = end_year - start_year + 1
+        counts['skipped'] = counts['planned'] - len(years)
+        if not years:
+            return None
+        
+        yearly = analysis_engine._calculate_yearly_index_collection(
+            geometry=geometry,
+            years=years,
+            dataset=state['dataset'],
+            index=state['index']
+        )
+        return yearly.toBands().rename([f"b{year}" for year in years])
+    
+    def _start_yearly_stack_drive_export(self, panel_data: Dict[str, Any], start_year: int, end_year: int,
+                                         export_name_base: str, drive_folder: str, file_format: str,
+                                         status_callback: Optional[callable] = None) -> Tuple[int, int]:
+        """
+        Start a single Drive export task for all years, stacked as bands
+        
+        Args:
+            panel_data: Data for the panel
+            start_year: First year
+            end_year: Last year
+            export_name_base: Base name for the export file
+            drive_folder: Google Drive folder
+            file_format: Earth Engine file format ('GeoTIFF' or 'NetCDF')
+            status_callback: Optional callback for status updates
+            
+        An earlier task for the same data and destination that is still queued,
+        running or completed is reused instead of exporting again.
+        
+        Returns:
+            Tuple of (number of tasks started or reused, number of yearly bands exported)
+        """
+        state = panel_data.get('state', {})
+        geometry_key = self._geometry_cache_key(state)
+        task_key = None
+        if geometry_key is not None:
+            task_key = geometry_key + (state.get('index'), start_year, end_year, file_format, drive_folder)
+        
+        reused = self._reusable_drive_task(task_key)
+        if reused is not None:
+            reused_task, band_count = reused
+            if status_callback:
+                task_label = f"task {reused_task.id}" if reused_task.id else "a queued task"
+                status_callback(
+                    f"Export tasks: 1 planned, 1 reused, 0 started, 0 failed "
+                    f"({task_label} already exports these years)."
+                )
+            return 1, band_count
+        
+        try:
+            stack, counts = self._build_yearly_image_stack(panel_data, start_year, end_year)
+            band_count = counts['planned'] - counts['deduped'] - counts['skipped']
+            
+            if status_callback:
+                status_callback(
+                    f"Planned {counts['planned']} years: {band_count} to export, "
+                    f"{counts['deduped']} duplicates and {counts['skipped']} without data skipped..."
+                )
+            
+            if stack is None:
+                return 0, 0
+            
+            export_task = self._drive_export_factory(drive_folder, file_format)(
+                image=stack,
+                description=export_name_base,
+                fileNamePrefix=export_name_base
+            )
+            started = self._start_drive_task(export_task)
+            if task_key is not None:
+                self._task_cache[task_key] = (export_task, band_count)
+            
+            if status_callback:
+                if started:
+                    status_callback("Export tasks: 1 planned, 0 reused, 1 started, 0 failed.")
+                else:
+                    status_callback("Export tasks: 1 planned, 0 reused, 0 started, 1 queued, 0 failed.")
+                    status_callback("Too many exports running; the task is queued and will start automatically...")
+            return 1, band_count
+        
+        except Exception as e:
+            if status_callback:
+                status_callback("Export tasks: 1 planned, 0 reused, 0 started, 1 failed.")
+                status_callback(f"Warning: Error exporting years {start_year}-{end_year}: {str(e)}")
+            return 0, 0
+    
+    def _reusable_drive_task(self, task_key: Optional[Tuple]) -> Optional[Tuple[ee.batch.Task, int]]:
+        """
+        Look up an earlier export task for the same data that need not be repeated
+        
+        Args:
+            task_key: Key into _task_cache, or None
+            
+        Returns:
+            Tuple of (task, band count) if the task is queued here or is
+            ready, running or completed on Earth Engine, otherwise None
+        """
+        cached = self._task_cache.get(task_key) if task_key is not None else None
+        if cached is None:
+            return None
+        
+        export_task = cached[0]
+        with Exporter._task_queue_lock:
+            if any(task is export_task for task in Exporter._pending_tasks):
+                return cached
+        
+        # Left the queue without starting (the start failed): export again
+        task_id = export_task.id
+        if task_id is None:
+            del self._task_cache[task_key]
+            return None
+        
+        try:
+            task_state = ee.data.getTaskStatus([task_id])[0].get('state')
+        except Exception as e:
+            print(f"Warning: Could not check export task {task_id}: {str(e)}")
+            return None
+        
+        if task_state in ('READY', 'RUNNING', 'COMPLETED'):
+            return cached
+        
+        # Failed, cancelled or unknown: export again
+        del self._task_cache[task_key]
+        return None
+    
+    def _get_data_for_year(self, panel_data: Dict[str, Any], year: int) -> Optional[ee.Image]:
+        """
+        Get data for a specific year with improved implementation
+        
+        Args:
+            panel_data: Data for the panel
+            year: Year to retrieve data for
+            
+        The image is built symbolically: nothing is evaluated on Earth Engine
+        until it is downloaded or exported. Years that _prefetch_years_with_data
+        found to be empty return None; other years without data fail at download.
+        
+        Returns:
+            Earth Engine image for the year or None if not available
+        """
+        try:
+            # Get state
+            state = panel_data.get('state', {})
+            if not state:
+                return None
+            
+            # Extract necessary parameters
             geometry = state.get('geometry')
             dataset = state.get('dataset')
             parameter = state.get('parameter')
@@ -1623,18 +2693,25 @@ class Exporter:
             # Get analysis engine from panel data if available
             analysis_engine = panel_data.get('analysis_engine')
             
+            # Year availability known from _prefetch_years_with_data, if any
+            has_data = self._year_availability_cache.get(self._geometry_cache_key(state), {}).get(year)
+            if has_data is False:
+                return None
+            
             if analysis_engine:
-                # Define date range for year
+                # Define date range for year (end date is exclusive)
                 start_date = f"{year}-01-01"
-                end_date = f"{year}-12-31"
+                end_date = f"{year + 1}-01-01"
                 
-                # Use analysis engine to calculate index for the year
+                # Use analysis engine to calculate index for the year, deferred:
+                # no blocking emptiness check, the export itself evaluates it
                 image = analysis_engine._calculate_index(
                     geometry=geometry,
                     start_date=start_date,
                     end_date=end_date,
                     dataset=dataset,
-                    index=index
+                    index=index,
+                    check_empty=False
                 )
                 
                 return image.clip(geometry)
@@ -1653,10 +2730,366 @@ class Exporter:
             print(f"Error getting data for year {year}: {str(e)}")
             return None
     
-    def create_status_widget(self) -> Tuple[widgets.HTML, callable]:
+    def _download_image(self, image: ee.Image, filename: str, scale: float,
+                        region: List[Any], crs: str) -> str:
+        """
+        Download an Earth Engine image as a GeoTIFF over the shared HTTP session
+        
+        Args:
+            image: Earth Engine image to download
+            filename: Local path for the GeoTIFF
+            scale: Export scale in meters
+            region: Region polygon coordinates
+            crs: Export CRS
+            
+        Returns:
+            Path of the downloaded file
+        """
+        url = self._get_download_url(image, scale, region, crs)
+        
+        try:
+            with self._http.get(url, stream=True, timeout=self.download_timeout) as response:
+                response.raise_for_status()
+                with open(filename, 'wb') as f:
+                    for block in response.iter_content(chunk_size=1024 * 1024):
+                        f.write(block)
+        except Exception:
+            # Don't leave a partial file behind that looks like a finished download
+            if os.path.exists(filename):
+                os.remove(filename)
+            raise
+        
+        return filename
+    
+    def _download_image_bytes(self, image: ee.Image, scale: float,
+                              region: List[Any], crs: str) -> bytes:
+        """
+        Download an Earth Engine image as GeoTIFF bytes, without a temp file
+        
+        Args:
+            image: Earth Engine image to download
+            scale: Export scale in meters
+            region: Region polygon coordinates
+            crs: Export CRS
+            
+        Returns:
+            Raw GeoTIFF bytes, suitable for rasterio's MemoryFile
+        """
+        url = self._get_download_url(image, scale, region, crs)
+        
+        response = self._http.get(url, timeout=self.download_timeout)
+        response.raise_for_status()
+        return response.content
+    
+    def _get_download_url(self, image: ee.Image, scale: float,
+                          region: List[Any], crs: str) -> str:
+        """Get the Earth Engine GeoTIFF download URL for an image"""
+        return image.getDownloadURL({
+            'scale': scale,
+            'region': {'type': 'Polygon', 'coordinates': region},
+            'crs': crs,
+            'format': 'GEO_TIFF',
+            'filePerBand': False
+        })
+    
+    def _get_export_region_and_crs(self, image: ee.Image,
+                                   state: Optional[Dict[str, Any]] = None) -> Tuple[List[Any], str]:
+        """
+        Get the export region coordinates and CRS for an image
+        
+        The panel state carries the area of interest ('aoi_coords') and target
+        CRS ('crs') chosen in the UI; Earth Engine is only queried for values
+        the state does not provide. Queried values are cached per geometry and
+        dataset, so exporting many years costs at most one round trip each.
+        
+        Args:
+            image: Earth Engine image to export
+            state: Optional analysis state of the panel
+            
+        Returns:
+            Tuple of (region coordinates, CRS string)
+        """
+        state = state or {}
+        
+        cache_key = self._geometry_cache_key(state)
+        cached_region, cached_crs = self._region_crs_cache.get(cache_key, (None, None))
+        
+        region = state.get('aoi_coords', cached_region)
+        if region is None:
+            region = image.geometry().bounds().getInfo()['coordinates']
+        
+        crs = state.get('crs', cached_crs)
+        if crs is None:
+            crs = image.projection().getInfo()['crs']
+        
+        if cache_key is not None:
+            self._region_crs_cache[cache_key] = (region, crs)
+        
+        return region, crs
+    
+    def _geometry_cache_key(self, state: Dict[str, Any]) -> Optional[Tuple[int, Any]]:
+        """
+        Key for per-geometry caches: (geometry hash, dataset), or None without a geometry
+        
+        serialize() is client-side, so building the key costs no round trip.
+        The hash is computed once per geometry object: an all-years export
+        looks the key up for every year, and serializing a detailed boundary
+        each time adds up.
+        """
+        geometry = state.get('geometry')
+        if not isinstance(geometry, ee.Geometry):
+            return None
+        
+        # Keyed by object id; the geometry is kept alive so the id is not reused
+        cached = self._geometry_hashes.get(id(geometry))
+        if cached is None or cached[0] is not geometry:
+            if len(self._geometry_hashes) >= 32:
+                self._geometry_hashes.clear()
+            cached = (geometry, hash(geometry.serialize()))
+            self._geometry_hashes[id(geometry)] = cached
+        
+        return (cached[1], state.get('dataset'))
+    
+    def _prefetch_years_with_data(self, panel_data: Dict[str, Any], start_year: int, end_year: int):
+        """
+        Find which years of an all-years export have data, in one Earth Engine call
+        
+        The per-year image count is computed server-side over the whole range,
+        replacing one emptiness check per year. _get_data_for_year then skips
+        empty years and builds the others without checking again. On failure
+        nothing is cached and the per-year checks are used as before.
+        
+        Args:
+            panel_data: Data for the panel
+            start_year: First year of the export
+            end_year: Last year of the export
+        """
+        state = panel_data.get('state', {})
+        cache_key = self._geometry_cache_key(state)
+        analysis_engine = panel_data.get('analysis_engine')
+        if cache_key is None or not analysis_engine:
+            return
+        
+        try:
+            config = analysis_engine.data_manager.get_dataset_config(state.get('dataset'))
+            collection = ee.ImageCollection(config.id) \
+                .filterDate(f"{start_year}-01-01", f"{end_year + 1}-01-01") \
+                .filterBounds(state['geometry'])
+            
+            counts = ee.List.sequence(start_year, end_year).map(
+                lambda y: collection.filter(ee.Filter.calendarRange(y, y, 'year')).size()
+            ).getInfo()
+            
+            availability = self._year_availability_cache.setdefault(cache_key, {})
+            for year, count in zip(range(start_year, end_year + 1), counts):
+                availability[year] = count > 0
+        except Exception as e:
+            print(f"Warning: Could not check data availability for {start_year}-{end_year}: {str(e)}")
+    
+    @staticmethod
+    def _image_digest(image: ee.Image) -> str:
+        """
+        Stable identifier of an image's computation (its date window included)
+        
+        Args:
+            image: Earth Engine image
+            
+        Returns:
+            Hex digest of the serialized image expression
+        """
+        # hashlib rather than hash(), whose string hashes change between
+        # interpreter runs
+        return hashlib.sha256(image.serialize().encode('utf-8')).hexdigest()
+    
+    def _find_cached_export(self, product: str, year: int, image: ee.Image, region: List[Any],
+                            crs: str, scale: float) -> Optional[str]:
+        """
+        Look up an earlier GeoTIFF download with identical parameters
+        
+        Args:
+            product: Dataset/index identifier (e.g. 'ERA5_Frost days')
+            year: Year of the image
+            image: Image to export; only a download of the same computation matches
+            region: Export region coordinates
+            crs: Export CRS
+            scale: Export scale in meters
+            
+        Returns:
+            Path of the cached file, or None if there is no valid entry
+        """
+        if pq is None or not os.path.exists(self.catalog_path):
+            return None
+        
+        try:
+            table = pq.read_table(
+                self.catalog_path,
+                filters=[
+                    ('product', '=', product),
+                    ('year', '=', int(year)),
+                    ('image', '=', self._image_digest(image)),
+                    ('region', '=', json.dumps(region)),
+                    ('crs', '=', crs),
+                    ('scale', '=', float(scale))
+                ]
+            )
+        except Exception as e:
+            print(f"Warning: Could not read export catalog: {str(e)}")
+            return None
+        
+        # Newest entries are appended last; only trust files that are unchanged on disk
+        for row in reversed(table.to_pylist()):
+            file_path = row['file_path']
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            if stat.st_size == row['file_size'] and stat.st_mtime_ns == row['mtime_ns']:
+                return file_path
+        
+        return None
+    
+    def _record_cached_export(self, product: str, year: int, image: ee.Image, region: List[Any],
+                              crs: str, scale: float, file_path: str) -> None:
+        """
+        Append a downloaded GeoTIFF to the local export catalog
+        
+        Args:
+            product: Dataset/index identifier (e.g. 'ERA5_Frost days')
+            year: Year of the image
+            image: Downloaded image
+            region: Export region coordinates
+            crs: Export CRS
+            scale: Export scale in meters
+            file_path: Path of the downloaded file
+        """
+        if pq is None:
+            return
+        
+        try:
+            stat = os.stat(file_path)
+            row = pa.Table.from_pylist([{
+                'product': product,
+                'year': int(year),
+                'image': self._image_digest(image),
+                'region': json.dumps(region),
+                'crs': crs,
+                'scale': float(scale),
+                'file_path': os.path.abspath(file_path),
+                'file_size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns
+            }], schema=CATALOG_SCHEMA)
+            
+            # Concurrent year downloads record from several threads
+            with self._catalog_lock:
+                table = row
+                if os.path.exists(self.catalog_path):
+                    table = pa.concat_tables([pq.read_table(self.catalog_path, schema=CATALOG_SCHEMA), row])
+                
+                # Write to a temporary file first so readers never see a partial catalog
+                temp_catalog = f"{self.catalog_path}.{os.getpid()}.tmp"
+                pq.write_table(table, temp_catalog)
+                os.replace(temp_catalog, self.catalog_path)
+        except Exception as e:
+            print(f"Warning: Could not update export catalog: {str(e)}")
+    
+    def _write_csv(self, df: pd.DataFrame, path: str):
+        """
+        Write a DataFrame to CSV, using pyarrow's column-at-a-time C writer when available
+        
+        pandas' to_csv formats values row by row in Python, which dominates
+        large temporal exports; it is kept as the fallback.
+        
+        Args:
+            df: Data to write (the index is not written)
+            path: Output CSV path
+        """
+        if pacsv is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(include_header=True))
+                return
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                # Column types pyarrow cannot write as CSV - use pandas instead
+                pass
+        
+        df.to_csv(path, index=False)
+    
+    def _write_csv_chunks(self, df: pd.DataFrame, chunk_size: int, chunk_files: List[str],
+                          status_callback: Optional[callable] = None):
+        """
+        Write consecutive row chunks of a DataFrame to CSV files on writer threads
+        
+        The calling thread only slices the frame; formatting and disk writes run
+        on a small pool of writer threads (pyarrow's CSV writer releases the
+        GIL), so several chunk files are written at once.
+        
+        Args:
+            df: Data to split
+            chunk_size: Rows per chunk
+            chunk_files: Output path of each chunk, in row order
+            status_callback: Optional callback for status updates
+        """
+        num_chunks = len(chunk_files)
+        with ThreadPoolExecutor(max_workers=self.max_csv_writers) as writers:
+            futures = [
+                writers.submit(self._write_csv, df.iloc[i * chunk_size:(i + 1) * chunk_size], path)
+                for i, path in enumerate(chunk_files)
+            ]
+            
+            for written, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                if status_callback and written % 5 == 1:  # Update status every 5 chunks
+                    status_callback(f"Exported chunk {written} of {num_chunks}...")
+    
+    def _temporal_to_dataframe(self, temporal_data: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Convert a list of temporal records to a DataFrame
+        
+        Uses pyarrow's columnar builder when available, which avoids pandas'
+        per-row type inference on large record lists. Without pyarrow, records
+        sharing the same keys are gathered into typed column arrays
+        (TEMPORAL_DTYPES) instead.
+        
+        Args:
+            temporal_data: List of dictionaries (e.g. with 'year' and 'value' keys)
+            
+        Returns:
+            DataFrame with one row per record
+        """
+        if pa is not None:
+            try:
+                table = pa.Table.from_pylist(temporal_data)
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+            except (pa.ArrowException, TypeError, ValueError):
+                # Mixed or unsupported types - let pandas infer them
+                pass
+        
+        columns = list(temporal_data[0]) if temporal_data else []
+        if columns and all(record.keys() == temporal_data[0].keys() for record in temporal_data):
+            try:
+                return pd.DataFrame({
+                    column: np.asarray([record[column] for record in temporal_data],
+                                       dtype=self.TEMPORAL_DTYPES.get(column))
+                    for column in columns
+                })
+            except (TypeError, ValueError):
+                # A value doesn't fit its column type - let pandas infer them
+                pass
+        
+        return pd.DataFrame.from_records(temporal_data, coerce_float=True)
+    
+    def create_status_widget(self, min_interval: float = 0.1) -> Tuple[widgets.HTML, callable]:
         """
         Create an enhanced widget for displaying export status
         
+        Updates are coalesced: the widget is redrawn at most once per
+        min_interval, always with the latest message, and a timer makes sure
+        the last message of a burst is shown. This keeps exports that report
+        from many threads from flooding the notebook with widget messages.
+        
+        Args:
+            min_interval: Minimum seconds between widget redraws
+        
         Returns:
             Tuple of (status widget, status update function)
         """
@@ -1667,37 +3100,57 @@ class Exporter:
                  "</div>"
         )
         
-        # Create status update function
-        def update_status(message: str):
-            # Determine if this is an error, warning, or success message
-            message_type = "info"
-            if any(error_word in message.lower() for error_word in ["error", "failed", "cannot", "could not"]):
-                message_type = "error"
-            elif any(warning_word in message.lower() for warning_word in ["warning", "caution", "partial"]):
-                message_type = "warning"
-            elif any(success_word in message.lower() for success_word in ["success", "complete", "saved"]):
-                message_type = "success"
-            
-            # Style based on message type
-            if message_type == "error":
-                color = "#f8d7da"
-                text_color = "#721c24"
-            elif message_type == "warning":
-                color = "#fff3cd"
-                text_color = "#856404"
-            elif message_type == "success":
-                color = "#d4edda"
-                text_color = "#155724"
-            else:  # info
-                color = "#f5f5f5"
-                text_color = "#000000"
-            
-            status_widget.value = (
+        # Build the styled HTML once per message type; updates only fill in the text
+        status_colors = {
+            "error": ("#f8d7da", "#721c24"),
+            "warning": ("#fff3cd", "#856404"),
+            "success": ("#d4edda", "#155724"),
+            "info": ("#f5f5f5", "#000000")
+        }
+        status_templates = {
+            message_type: (
                 f"<div style='padding: 10px; background: {color}; "
                 f"border-radius: 5px; color: {text_color};'>"
-                f"<p style='margin: 0;'><b>Export Status:</b> {message}</p>"
+                "<p style='margin: 0;'><b>Export Status:</b> {message}</p>"
                 "</div>"
             )
+            for message_type, (color, text_color) in status_colors.items()
+        }
+        
+        def render(message: str):
+            # Determine if this is an error, warning, or success message
+            # (one scan of the message; errors win over warnings over successes)
+            found_types = {STATUS_KEYWORD_TYPES[word.lower()] for word in STATUS_KEYWORD_RE.findall(message)}
+            message_type = next((t for t in ("error", "warning", "success") if t in found_types), "info")
+            
+            # Style based on message type
+            status_widget.value = status_templates[message_type].format(message=message)
+        
+        lock = threading.Lock()
+        pending = {'message': None, 'timer': None, 'last_flush': 0.0}
+        
+        def flush():
+            with lock:
+                message = pending['message']
+                pending['message'] = None
+                pending['timer'] = None
+                pending['last_flush'] = time.monotonic()
+            if message is not None:
+                render(message)
+        
+        # Create status update function
+        def update_status(message: str):
+            with lock:
+                pending['message'] = message
+                wait = pending['last_flush'] + min_interval - time.monotonic()
+                if wait > 0:
+                    # Redrawn recently: show the latest message when the interval is up
+                    if pending['timer'] is None:
+                        pending['timer'] = threading.Timer(wait, flush)
+                        pending['timer'].daemon = True
+                        pending['timer'].start()
+                    return
+            flush()
         
         return status_widget, update_status
     
@@ -1714,6 +3167,33 @@ class Exporter:
         Returns:
             Properly formatted file path
         """
+        local_folder = self._ensure_export_dir(format_type, folder_name)
+        
+        # Create full file path
+        file_path = os.path.normpath(os.path.join(local_folder, f"{export_name}.{extension}"))
+        
+        return file_path
+    
+    def _ensure_export_dir(self, format_type: str, folder_name: str) -> str:
+        """
+        Normalize an export folder and create it on disk
+        
+        Remembered for the rest of the export, so multi-year exports normalize
+        the folder and call os.makedirs once rather than once per year.
+        
+        Args:
+            format_type: Export format type ('GeoTIFF', 'CSV', 'NetCDF')
+            folder_name: Folder structure (e.g. 'ERA5/Temperature')
+            
+        Returns:
+            Local folder path
+        """
+        local_folder = self._export_dirs.get((format_type, folder_name))
+        if local_folder is not None:
+            return local_folder
+        
+        self._ensure_export_directories()
+        
         # Replace unknown values with better defaults
         parts = folder_name.split('/')
         
@@ -1766,8 +3246,6 @@ class Exporter:
         
         # Ensure directory exists
         os.makedirs(local_folder, exist_ok=True)
+        self._export_dirs[(format_type, folder_name)] = local_folder
         
-        # Create full file path
-        file_path = os.path.normpath(os.path.join(local_folder, f"{export_name}.{extension}"))
-        
-        return file_path
\ No newline at end of file
+        return local_folder
\ No newline at end of file
@@ -4,18 +4,47 @@ Handles geographic bounds and geometry operations
 """
 
 import ee
-import geemap
-import geopandas as gpd
 import os
+import hashlib
+import functools
+import numpy as np
 from ipywidgets import widgets, VBox, HBox, Layout
-from ipyleaflet import DrawControl
-from shapely.geometry import box, mapping
-from typing import Dict, Any, Optional, Tuple, Callable
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+from widget_utils import debounce
+
+# geemap, ipyleaflet, geopandas, pyproj and shapely are imported inside the
+# methods that use them: they take seconds to import, and many sessions (and
+# the CLI) never draw a map or read a shapefile
+
+# Shapefile extents cached by _read_shapefile_extent (the tool's own folder,
+# never the user's data directory)
+_SHAPEFILE_CACHE_DIR = os.path.expanduser("~/.climate_tool/cache/shapefile_extents")
+
+# Shapefile parts whose changes invalidate a cached extent (geometry, index,
+# attributes, projection and encoding)
+_SHAPEFILE_PARTS = ('.shp', '.shx', '.dbf', '.prj', '.cpg')
+
+# Info text shown for a drawn area (min lon, min lat, max lon, max lat)
+_SELECTED_AREA_HTML = (
+    "<p>Area selected:</p>"
+    "<ul>"
+    "<li>Min Lon: {:.4f}</li>"
+    "<li>Min Lat: {:.4f}</li>"
+    "<li>Max Lon: {:.4f}</li>"
+    "<li>Max Lat: {:.4f}</li>"
+    "</ul>"
+)
+
+@functools.lru_cache(maxsize=8)
+def _bounds_key(panel_id: str) -> str:
+    """Key of a panel's BoundsConfig in the GeometryManager.geometries view (built once per panel)"""
+    return f"{panel_id}_bounds"
+
+@dataclass(frozen=True)
 class BoundsConfig:
-    """Configuration for geographic bounds"""
+    """Configuration for geographic bounds (immutable and hashable)"""
     min_lon: float
     min_lat: float
     max_lon: float
@@ -25,6 +54,16 @@ class BoundsConfig:
         """Convert bounds to list format"""
         return [self.min_lon, self.min_lat, self.max_lon, self.max_lat]
     
+    def to_coordinates(self) -> list:
+        """Convert bounds to closed polygon ring coordinates (GeoJSON order)"""
+        return [[
+            [self.min_lon, self.min_lat],
+            [self.max_lon, self.min_lat],
+            [self.max_lon, self.max_lat],
+            [self.min_lon, self.max_lat],
+            [self.min_lon, self.min_lat]
+        ]]
+    
     @property
     def center(self) -> Tuple[float, float]:
         """Calculate center point of bounds"""
@@ -38,11 +77,29 @@ class GeometryManager:
     
     def __init__(self):
         """Initialize GeometryManager"""
-        self.geometries = {}
+        # Per panel: Earth Engine geometry and bounds, kept apart so neither
+        # needs string-key tricks (see the geometries property for the old view)
+        self._ee_geoms = {}  # panel_id -> ee.Geometry
+        self._bounds = {}  # panel_id -> BoundsConfig
         self.maps = {}
         self.draw_controls = {}
         self.current_method = {}
+        
+        # Earth Engine rectangles by (min_lon, min_lat, max_lon, max_lat)
+        self._ee_rect_cache = {}
 
+    @property
+    def geometries(self) -> Dict[str, Any]:
+        """
+        Read-only combined view of geometries and bounds, for older callers
+        
+        Maps panel_id to its Earth Engine geometry and '<panel_id>_bounds' to
+        its BoundsConfig. Built on access; changes to it are not stored.
+        """
+        combined = dict(self._ee_geoms)
+        combined.update((_bounds_key(panel_id), bounds) for panel_id, bounds in self._bounds.items())
+        return combined
+    
     def create_map_widget(self, panel_id: str) -> widgets.VBox:
         """
         Create a map widget for drawing regions
@@ -53,15 +110,17 @@ class GeometryManager:
         Returns:
             Widget containing the map
         """
-        # Clean up existing map
-        self._cleanup_map(panel_id)
+        import geemap
+        from ipyleaflet import DrawControl
         
-        # Create new map
-        self.maps[panel_id] = geemap.Map(
-            center=[0, 0],
-            zoom=2,
-            layout=Layout(width='100%', height='400px')
-        )
+        # Reset the existing map, or create one on first use
+        self._cleanup_map(panel_id)
+        if panel_id not in self.maps:
+            self.maps[panel_id] = geemap.Map(
+                center=[0, 0],
+                zoom=2,
+                layout=Layout(width='100%', height='400px')
+            )
         
         # Add draw control
         self.draw_controls[panel_id] = DrawControl(
@@ -73,6 +132,31 @@ class GeometryManager:
             marker={}
         )
         
+        # Select the drawn area; debounced so a burst of draw events only
+        # sets the bounds and redraws the info once, for the last shape
+        def select_area(ring):
+            # Get coordinates as an (n, 2) lon/lat array
+            coords = np.asarray(ring, dtype=np.float64)
+            
+            # Extract bounds in one pass over the ring
+            min_lon, min_lat = coords.min(axis=0).tolist()
+            max_lon, max_lat = coords.max(axis=0).tolist()
+            
+            # Nothing to update if the area's bounds did not change
+            if self._bounds.get(panel_id) == BoundsConfig(min_lon, min_lat, max_lon, max_lat):
+                return
+            
+            # Set bounds
+            self.set_bounds(panel_id, min_lon, min_lat, max_lon, max_lat)
+            
+            # Show bounds info
+            info_output.value = _SELECTED_AREA_HTML.format(min_lon, min_lat, max_lon, max_lat)
+        
+        def show_error(e):
+            info_output.value = f"<p style='color: red'>Error selecting area: {str(e)}</p>"
+        
+        select_area = debounce(select_area, on_error=show_error)
+        
         # Handle drawing events
         def handle_draw(target, action, geo_json):
             """Handle drawing events on the map"""
@@ -81,32 +165,7 @@ class GeometryManager:
                 geo_type = geo_json['geometry']['type']
                 
                 if geo_type == 'Polygon':
-                    # Get coordinates
-                    coords = geo_json['geometry']['coordinates'][0]
-                    
-                    # Extract bounds
-                    lons = [coord[0] for coord in coords]
-                    lats = [coord[1] for coord in coords]
-                    
-                    # Set bounds
-                    self.set_bounds(
-                        panel_id,
-                        min(lons),
-                        min(lats),
-                        max(lons),
-                        max(lats)
-                    )
-                    
-                    # Show bounds info
-                    info_output.value = f"""
-                    <p>Area selected:</p>
-                    <ul>
-                        <li>Min Lon: {min(lons):.4f}</li>
-                        <li>Min Lat: {min(lats):.4f}</li>
-                        <li>Max Lon: {max(lons):.4f}</li>
-                        <li>Max Lat: {max(lats):.4f}</li>
-                    </ul>
-                    """
+                    select_area(geo_json['geometry']['coordinates'][0])
         
         self.draw_controls[panel_id].on_draw(handle_draw)
         self.maps[panel_id].add_control(self.draw_controls[panel_id])
@@ -128,27 +187,20 @@ class GeometryManager:
             """Clear all drawings on the map"""
             try:
                 # Clear draw control features
-                if panel_id in self.draw_controls:
+                draw_control = self.draw_controls.get(panel_id)
+                if draw_control is not None:
                     # Access the native ipyleaflet object and clear all layers
-                    draw_control = self.draw_controls[panel_id]
                     if hasattr(draw_control, 'clear'):
                         draw_control.clear()
                     
                     # Clear all map layers except base layer
-                    if panel_id in self.maps:
-                        map_obj = self.maps[panel_id]
-                        layers_to_remove = [layer for layer in map_obj.layers[1:]]
-                        for layer in layers_to_remove:
-                            map_obj.remove_layer(layer)
+                    map_obj = self.maps.get(panel_id)
+                    if map_obj is not None:
+                        self._clear_overlays(map_obj)
                 
-                # Clear stored geometry
-                if panel_id in self.geometries:
-                    del self.geometries[panel_id]
-                    
-                # Also clear bounds
-                bounds_key = f"{panel_id}_bounds"
-                if bounds_key in self.geometries:
-                    del self.geometries[bounds_key]
+                # Clear stored geometry and bounds
+                self._ee_geoms.pop(panel_id, None)
+                self._bounds.pop(panel_id, None)
                 
                 info_output.value = "<p>Drawing cleared. Draw a new area on the map.</p>"
                 
@@ -207,6 +259,8 @@ class GeometryManager:
         # Handle upload button click
         def on_upload(b):
             """Process shapefile upload"""
+            import geemap
+            
             path = shapefile_input.value.strip()
             
             if not path:
@@ -232,10 +286,11 @@ class GeometryManager:
                         layout=Layout(width='100%', height='400px')
                     )
                 
-                # Display shape on map
-                bounds = self.geometries[panel_id + "_bounds"]
-                self.maps[panel_id].center = bounds.center
-                self.maps[panel_id].zoom = 4
+                # Display shape on map (center and zoom synced in one message)
+                bounds = self._bounds[panel_id]
+                with self.maps[panel_id].hold_sync():
+                    self.maps[panel_id].center = bounds.center
+                    self.maps[panel_id].zoom = 4
                 
                 # Add map to container
                 container.children = [
@@ -323,6 +378,8 @@ class GeometryManager:
         # Handle set button click
         def on_set(b):
             """Set bounds from inputs"""
+            import geemap
+            
             try:
                 self.set_bounds(
                     panel_id,
@@ -343,26 +400,25 @@ class GeometryManager:
                         layout=Layout(width='100%', height='400px')
                     )
                 
-                # Display bounds on map
-                bounds = self.geometries[panel_id + "_bounds"]
-                self.maps[panel_id].center = bounds.center
-                self.maps[panel_id].zoom = 4
-                
                 # Add rectangle to map
-                rect = ee.Geometry.Rectangle([
-                    min_lon.value, min_lat.value,
-                    max_lon.value, max_lat.value
-                ])
-                
-                # Clear previous layers
-                self.maps[panel_id].layers = self.maps[panel_id].layers[:1]
+                rect = self._rectangle(min_lon.value, min_lat.value, max_lon.value, max_lat.value)
                 
-                # Add new layer
-                self.maps[panel_id].addLayer(
-                    rect,
-                    {'color': '3388ff'},
-                    'Selected Area'
-                )
+                # Display bounds on map; the view and layer changes reach the
+                # browser as one message instead of one per attribute
+                bounds = self._bounds[panel_id]
+                with self.maps[panel_id].hold_sync():
+                    self.maps[panel_id].center = bounds.center
+                    self.maps[panel_id].zoom = 4
+                    
+                    # Clear previous layers
+                    self._clear_overlays(self.maps[panel_id])
+                    
+                    # Add new layer
+                    self.maps[panel_id].addLayer(
+                        rect,
+                        {'color': '3388ff'},
+                        'Selected Area'
+                    )
                 
                 # Add map to container
                 container.children = [
@@ -378,7 +434,11 @@ class GeometryManager:
             except ValueError as e:
                 info_output.value = f"<p style='color: red'>Error: {str(e)}</p>"
         
-        set_button.on_click(on_set)
+        def show_set_error(e):
+            info_output.value = f"<p style='color: red'>Error: {str(e)}</p>"
+        
+        # Debounced so repeated clicks only set the bounds and redraw the map once
+        set_button.on_click(debounce(on_set, on_error=show_set_error))
         
         # Set current method
         self.current_method[panel_id] = "bounds"
@@ -407,19 +467,7 @@ class GeometryManager:
             ValueError: If shapefile cannot be processed
         """
         try:
-            # Read shapefile
-            gdf = gpd.read_file(filepath)
-            
-            # Check projection
-            if gdf.crs is None:
-                raise ValueError("Shapefile has no CRS defined")
-            
-            # Convert to EPSG:4326 if needed
-            if gdf.crs.to_string() != "EPSG:4326":
-                gdf = gdf.to_crs(epsg=4326)
-            
-            # Get bounds
-            bounds = gdf.total_bounds
+            bounds, first_geom = self._read_shapefile_extent(filepath)
             
             # Set bounds
             self.set_bounds(
@@ -430,15 +478,136 @@ class GeometryManager:
                 bounds[3]
             )
             
-            # Store geometry
-            first_geom = gdf.geometry.iloc[0]
-            self.geometries[panel_id] = ee.Geometry.Polygon(
-                [[(p[0], p[1]) for p in list(first_geom.exterior.coords)]]
-            )
+            # Store geometry (exterior ring as one coordinate array, dropping any Z)
+            ring = np.asarray(first_geom.exterior.coords, dtype=np.float64)[:, :2]
+            self._ee_geoms[panel_id] = ee.Geometry.Polygon([ring.tolist()])
             
         except Exception as e:
             raise ValueError(f"Error processing shapefile: {str(e)}")
     
+    def _read_shapefile_extent(self, filepath: str) -> Tuple[Any, Any]:
+        """
+        Read a shapefile's bounds and first geometry in EPSG:4326, with a disk cache
+        
+        The result is kept as a one-row GeoParquet file in the tool's cache
+        folder, named after the shapefile's path and the size and modification
+        time of each of its parts (.shp, .shx, .dbf, .prj, .cpg). Processing
+        the same, unchanged file again skips parsing it, while editing any part
+        (e.g. the projection) reads it afresh. The cache is best effort:
+        without pyarrow or write access it is skipped.
+        
+        Args:
+            filepath: Path to shapefile
+            
+        Returns:
+            Tuple of (bounds as min_lon, min_lat, max_lon, max_lat, first geometry)
+        """
+        import geopandas as gpd
+        
+        base = os.path.splitext(os.path.abspath(filepath))[0]
+        signature = [base]
+        for part in _SHAPEFILE_PARTS:
+            for ext in (part, part.upper()):
+                try:
+                    stat = os.stat(base + ext)
+                except OSError:
+                    continue
+                signature.append(f"{ext}:{stat.st_size}:{stat.st_mtime_ns}")
+        digest = hashlib.sha256("|".join(signature).encode('utf-8')).hexdigest()
+        cache_path = os.path.join(_SHAPEFILE_CACHE_DIR, f"{digest}.parquet")
+        
+        try:
+            if os.path.exists(cache_path):
+                cached = gpd.read_parquet(cache_path)
+                row = cached.iloc[0]
+                bounds = (row['min_lon'], row['min_lat'], row['max_lon'], row['max_lat'])
+                return bounds, cached.geometry.iloc[0]
+        except Exception:
+            # No usable cache: read the shapefile
+            pass
+        
+        bounds, first_geom = self._load_shapefile_extent(filepath)
+        
+        try:
+            min_lon, min_lat, max_lon, max_lat = (float(value) for value in bounds)
+            os.makedirs(_SHAPEFILE_CACHE_DIR, exist_ok=True)
+            gpd.GeoDataFrame(
+                {'min_lon': [min_lon], 'min_lat': [min_lat], 'max_lon': [max_lon], 'max_lat': [max_lat]},
+                geometry=[first_geom],
+                crs="EPSG:4326"
+            ).to_parquet(cache_path)
+        except (ImportError, OSError):
+            # No pyarrow, or no write access to the cache folder: skip the cache
+            pass
+        except Exception as e:
+            print(f"Warning: Could not cache shapefile extent: {str(e)}")
+        
+        return bounds, first_geom
+    
+    def _load_shapefile_extent(self, filepath: str) -> Tuple[Any, Any]:
+        """
+        Read a shapefile's bounds and first geometry in EPSG:4326
+        
+        With pyogrio the bounds come from the layer header and only the first
+        feature is read; otherwise the whole file is loaded.
+        
+        Args:
+            filepath: Path to shapefile
+            
+        Returns:
+            Tuple of (bounds as min_lon, min_lat, max_lon, max_lat, first geometry)
+            
+        Raises:
+            ValueError: If the shapefile has no CRS
+        """
+        import geopandas as gpd
+        from pyproj import CRS, Transformer
+        from shapely.ops import transform as shapely_transform
+        
+        # Optional: pyogrio reads a layer's extent from its header and single
+        # rows, so large shapefiles need not be loaded in full
+        try:
+            import pyogrio
+        except ImportError:
+            pyogrio = None
+        
+        if pyogrio is None:
+            # Read shapefile
+            gdf = gpd.read_file(filepath)
+            
+            # Check projection
+            if gdf.crs is None:
+                raise ValueError("Shapefile has no CRS defined")
+            
+            bounds, first_geom = gdf.total_bounds, gdf.geometry.iloc[0]
+            
+            # Convert to EPSG:4326 if needed: only the bounds and the first
+            # geometry are used, so the rest of the layer is not reprojected
+            if gdf.crs.to_string() != "EPSG:4326":
+                transformer = Transformer.from_crs(gdf.crs, "EPSG:4326", always_xy=True)
+                bounds = transformer.transform_bounds(*bounds, densify_pts=21)
+                first_geom = shapely_transform(transformer.transform, first_geom)
+            
+            return bounds, first_geom
+        
+        info = pyogrio.read_info(filepath, force_total_bounds=True)
+        if info['crs'] is None:
+            raise ValueError("Shapefile has no CRS defined")
+        
+        bounds = tuple(info['total_bounds'])
+        crs = CRS.from_user_input(info['crs'])
+        if crs.to_string() != "EPSG:4326":
+            # Densified, so curved edges of the projected box are covered too
+            bounds = Transformer.from_crs(crs, "EPSG:4326", always_xy=True).transform_bounds(
+                *bounds, densify_pts=21
+            )
+        
+        first = gpd.read_file(filepath, rows=1, engine='pyogrio')
+        if first.crs.to_string() != "EPSG:4326":
+            first = first.to_crs(epsg=4326)
+        
+        return bounds, first.geometry.iloc[0]
+    
     def set_bounds(self, panel_id: str, min_lon: float, min_lat: float, 
                   max_lon: float, max_lat: float) -> None:
         """
@@ -468,11 +637,34 @@ class GeometryManager:
         bounds = BoundsConfig(min_lon, min_lat, max_lon, max_lat)
         
         # Store bounds
-        self.geometries[panel_id + "_bounds"] = bounds
+        self._bounds[panel_id] = bounds
         
         # Create EE geometry if not already created
-        if panel_id not in self.geometries:
-            self.geometries[panel_id] = ee.Geometry.Rectangle(bounds.to_list())
+        if panel_id not in self._ee_geoms:
+            self._ee_geoms[panel_id] = self._rectangle(*bounds.to_list())
+    
+    def _rectangle(self, min_lon: float, min_lat: float,
+                   max_lon: float, max_lat: float) -> ee.Geometry:
+        """
+        Get the Earth Engine rectangle for bounds, reusing it for unchanged bounds
+        
+        Returning the same object also lets per-geometry caches downstream
+        (e.g. the exporter's) recognize it without serializing it again.
+        
+        Args:
+            min_lon: Minimum longitude
+            min_lat: Minimum latitude
+            max_lon: Maximum longitude
+            max_lat: Maximum latitude
+            
+        Returns:
+            Earth Engine rectangle geometry
+        """
+        key = (float(min_lon), float(min_lat), float(max_lon), float(max_lat))
+        rect = self._ee_rect_cache.get(key)
+        if rect is None:
+            rect = self._ee_rect_cache[key] = ee.Geometry.Rectangle(list(key))
+        return rect
     
     def get_geometry(self, panel_id: str) -> ee.Geometry:
         """
@@ -487,10 +679,11 @@ class GeometryManager:
         Raises:
             ValueError: If no geometry is defined
         """
-        if panel_id not in self.geometries:
+        geometry = self._ee_geoms.get(panel_id)
+        if geometry is None:
             raise ValueError("No geometry defined for this panel")
         
-        return self.geometries[panel_id]
+        return geometry
     
     def get_bounds(self, panel_id: str) -> BoundsConfig:
         """
@@ -505,30 +698,48 @@ class GeometryManager:
         Raises:
             ValueError: If no bounds are defined
         """
-        bounds_key = panel_id + "_bounds"
-        
-        if bounds_key not in self.geometries:
+        bounds = self._bounds.get(panel_id)
+        if bounds is None:
             raise ValueError("No bounds defined for this panel")
         
-        return self.geometries[bounds_key]
+        return bounds
+    
+    @staticmethod
+    def _clear_overlays(map_obj) -> None:
+        """
+        Remove every layer but the base layer from a map
+        
+        One assignment of the layers tuple syncs to the browser in a single
+        message, instead of one message per remove_layer call.
+        
+        Args:
+            map_obj: Map widget
+        """
+        map_obj.layers = tuple(map_obj.layers[:1])
     
     def _cleanup_map(self, panel_id: str) -> None:
         """
-        Clean up map resources
+        Reset the panel's map for a new area selection method
+        
+        The map itself is kept and reused: creating a map is expensive (base
+        tiles, event handlers, frontend state), so only the draw control and
+        overlays are removed and the view is reset.
         
         Args:
             panel_id: Identifier for the panel ("left" or "right")
         """
-        if panel_id in self.maps:
+        map_obj = self.maps.get(panel_id)
+        if map_obj is not None:
             try:
-                # Remove draw control if it exists
-                if panel_id in self.draw_controls:
-                    self.maps[panel_id].remove_control(self.draw_controls[panel_id])
-                    del self.draw_controls[panel_id]
-                
-                # Close map
-                self.maps[panel_id].close()
-                del self.maps[panel_id]
+                with map_obj.hold_sync():
+                    # Remove draw control if it exists
+                    draw_control = self.draw_controls.pop(panel_id, None)
+                    if draw_control is not None:
+                        map_obj.remove_control(draw_control)
+                    
+                    self._clear_overlays(map_obj)
+                    map_obj.center = [0, 0]
+                    map_obj.zoom = 2
             except Exception as e:
                 print(f"Warning: Error during map cleanup - {str(e)}")
     
@@ -548,61 +759,48 @@ class GeometryManager:
             print(f"Source method: {source_method}, Target method: {target_method}")
             
             # Make sure we have geometry for the source panel
-            if source_panel not in self.geometries:
+            source_geom = self._ee_geoms.get(source_panel)
+            if source_geom is None:
                 print(f"No geometry found for {source_panel} panel")
                 return
             
-            # Deep copy the geometry to avoid reference issues
-            source_geom = self.geometries[source_panel]
-            if isinstance(source_geom, ee.Geometry):
-                # For Earth Engine geometry, serialize and deserialize
-                geom_json = source_geom.getInfo()
-                target_geom = ee.Geometry(geom_json)
-                self.geometries[target_panel] = target_geom
-            else:
-                # For other geometry types, use direct assignment
-                self.geometries[target_panel] = source_geom
+            # Earth Engine geometries are immutable client-side expressions, so
+            # both panels can share the object; no server round trip to copy it
+            self._ee_geoms[target_panel] = source_geom
             
             # Copy bounds if they exist
-            source_bounds_key = f"{source_panel}_bounds"
-            target_bounds_key = f"{target_panel}_bounds"
-            
-            if source_bounds_key in self.geometries:
-                # Copy bounds
-                source_bounds = self.geometries[source_bounds_key]
-                self.geometries[target_bounds_key] = source_bounds
+            source_bounds = self._bounds.get(source_panel)
+            if source_bounds is not None:
+                self._bounds[target_panel] = source_bounds
                 
                 # If working with bounds UI, update the UI elements
                 self._update_bounds_ui(target_panel, source_bounds)
                 
             # Copy method
             if source_panel in self.current_method:
-                self.current_method[target_panel] = self.current_method[source_panel]
+                self.current_method[target_panel] = source_method
             
             # Update map if it exists
-            if target_panel in self.maps and source_panel in self.maps:
+            source_map = self.maps.get(source_panel)
+            target_map = self.maps.get(target_panel)
+            if source_map is not None and target_map is not None:
                 try:
-                    # Get source map center and zoom
-                    source_map = self.maps[source_panel]
-                    target_map = self.maps[target_panel]
-                    
-                    # Set target map center and zoom
-                    target_map.center = source_map.center
-                    target_map.zoom = source_map.zoom
-                    
-                    # Add geometry to map for visualization
-                    if isinstance(source_geom, ee.Geometry):
-                        # Clear previous layers
-                        layers_to_remove = [layer for layer in target_map.layers[1:]]
-                        for layer in layers_to_remove:
-                            target_map.remove_layer(layer)
+                    with target_map.hold_sync():
+                        # Set target map center and zoom
+                        target_map.center = source_map.center
+                        target_map.zoom = source_map.zoom
                         
-                        # Add new layer
-                        target_map.addLayer(
-                            source_geom,
-                            {'color': '3388ff'},
-                            'Selected Area'
-                        )
+                        # Add geometry to map for visualization
+                        if isinstance(source_geom, ee.Geometry):
+                            # Clear previous layers
+                            self._clear_overlays(target_map)
+                            
+                            # Add new layer
+                            target_map.addLayer(
+                                source_geom,
+                                {'color': '3388ff'},
+                                'Selected Area'
+                            )
                 except Exception as e:
                     print(f"Error updating map: {str(e)}")
             
@@ -637,23 +835,22 @@ class GeometryManager:
                 
                 # In a real implementation, we'd find bounds widgets in the UI
                 # For this demo, we'll create a new bounds display
-                rect = ee.Geometry.Rectangle([min_lon, min_lat, max_lon, max_lat])
-                
-                # Clear previous layers
-                layers_to_remove = [layer for layer in map_widget.layers[1:]]
-                for layer in layers_to_remove:
-                    map_widget.remove_layer(layer)
-                
-                # Add new layer
-                map_widget.addLayer(
-                    rect,
-                    {'color': '3388ff'},
-                    'Selected Area'
-                )
+                rect = self._rectangle(min_lon, min_lat, max_lon, max_lat)
                 
-                # Center and zoom map to bounds
-                map_widget.center = bounds.center
-                map_widget.zoom = 4
+                with map_widget.hold_sync():
+                    # Clear previous layers
+                    self._clear_overlays(map_widget)
+                    
+                    # Add new layer
+                    map_widget.addLayer(
+                        rect,
+                        {'color': '3388ff'},
+                        'Selected Area'
+                    )
+                    
+                    # Center and zoom map to bounds
+                    map_widget.center = bounds.center
+                    map_widget.zoom = 4
                 
                 print(f"Updated bounds UI for {panel_id}: {min_lon}, {min_lat}, {max_lon}, {max_lat}")
         except Exception as e:
@@ -3,27 +3,262 @@ visualizer.py
 Handles visualization of climate data analysis results
 """
 
+from __future__ import annotations
+
 import ee
-import geemap
+import re
+import string
+import threading
+import functools
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
 import numpy as np
-import plotly.graph_objects as go
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Callable
 from ipywidgets import widgets, VBox, HBox, Layout, HTML
 from IPython.display import display
 
+from widget_utils import debounce
+
+logger = logging.getLogger(__name__)
+
+# geemap and plotly (and the optional plotly-resampler) are imported inside the
+# methods that use them: they take seconds to import, and summary statistics
+# and tables need neither
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+def _compact_html(html: str) -> str:
+    """Join the lines of an indented HTML skeleton without their indentation"""
+    return "".join(line.strip() for line in html.splitlines())
+
+# Status shown when applying visualization controls fails
+_APPLY_ERROR_TMPL = string.Template("<p style='color: red'>Error updating visualization: $error</p>")
+
+# HTML skeletons for the statistics widgets, parsed and compacted once at
+# import (the indentation would otherwise be sent to the browser every time)
+_CMP_TABLE_TMPL = string.Template(_compact_html("""
+        <table style="width:100%; border-collapse: collapse; margin: 20px 0;">
+            <thead>
+                <tr style="background-color: #f0f0f0;">
+                    <th style="padding: 8px; border: 1px solid #ddd;">Metric</th>
+                    <th style="padding: 8px; border: 1px solid #ddd;">$left_title</th>
+                    <th style="padding: 8px; border: 1px solid #ddd;">$right_title</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td style="padding: 8px; border: 1px solid #ddd;">Mean</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">$left_mean $left_units</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">$right_mean $right_units</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px; border: 1px solid #ddd;">Min</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">$left_min $left_units</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">$right_min $right_units</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px; border: 1px solid #ddd;">Max</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">$left_max $left_units</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">$right_max $right_units</td>
+                </tr>
+                <tr>
+                    <td style="padding: 8px; border: 1px solid #ddd;">Trend</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">$left_trend</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">$right_trend</td>
+                </tr>
+            </tbody>
+        </table>
+        """))
+
+_SUMMARY_STATS_TMPL = string.Template(_compact_html("""
+        <div style="padding: 10px; background: #f5f5f5; border-radius: 5px; margin: 10px 0;">
+            <h5 style="margin-top: 0;">Summary Statistics</h5>
+            <table style="width:100%;">
+                <tr><td>Mean:</td><td>$mean $units</td></tr>
+                <tr><td>Min:</td><td>$min $units</td></tr>
+                <tr><td>Max:</td><td>$max $units</td></tr>
+                <tr><td>Standard Deviation:</td><td>$std $units</td></tr>
+            </table>
+        </div>
+        """))
+
+def _fit_and_trend(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, np.ndarray]:
+    """
+    Least-squares line and its values at x, in one pass over the data
+    
+    Written for numba (see _jit_fit_and_trend); x is taken relative to its
+    first value so the running sums keep their precision.
+    
+    Args:
+        x: float64 X values
+        y: float64 Y values
+        
+    Returns:
+        Tuple of (slope, intercept, trend values); the slope is 0 if all x are equal
+    """
+    n = x.size
+    x0 = x[0]
+    sx = sy = sxx = sxy = 0.0
+    for i in range(n):
+        dx = x[i] - x0
+        sx += dx
+        sy += y[i]
+        sxx += dx * dx
+        sxy += dx * y[i]
+    
+    denominator = n * sxx - sx * sx
+    slope = (n * sxy - sx * sy) / denominator if denominator != 0 else 0.0
+    intercept = (sy - slope * sx) / n - slope * x0
+    
+    trend = np.empty(n)
+    for i in range(n):
+        trend[i] = intercept + slope * x[i]
+    return slope, intercept, trend
+
+@functools.lru_cache(maxsize=1)
+def _jit_fit_and_trend() -> Optional[Callable]:
+    """Numba-compiled _fit_and_trend, or None without numba (imported on first use)"""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True, fastmath=True)(_fit_and_trend)
+
+# Reducer output key: band name, then the statistic ('min', 'max' or 'p<n>')
+_STAT_KEY_RE = re.compile(r'^(?P<band>.+?)_(?P<stat>min|max|p\d+(?:_\d+)?)$')
+
+def _stats_by_band(stats: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Group flat reducer output by band, in one pass over the keys
+    
+    Args:
+        stats: Reducer output ('<band>_min', '<band>_p2', ...)
+        
+    Returns:
+        Statistics by band and statistic, e.g. {'NDVI': {'min': ..., 'p2': ...}}
+    """
+    by_band = {}
+    for key, value in stats.items():
+        match = _STAT_KEY_RE.match(key)
+        if match:
+            by_band.setdefault(match['band'], {})[match['stat']] = value
+    return by_band
+
+@functools.lru_cache(maxsize=1)
+def _stretch_reducer() -> ee.Reducer:
+    """
+    Combined reducer for stretch statistics: min, max and 2/5/95/98th percentiles
+    
+    Built on first use rather than at import, as Earth Engine must be
+    initialized first.
+    """
+    return ee.Reducer.minMax().combine(
+        ee.Reducer.percentile([2, 5, 95, 98]), sharedInputs=True
+    )
+
+class _InlineExecutor:
+    """Runs submitted work immediately, for environments without threads"""
+    
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
 class Visualizer:
     """
     Handles visualization of climate data analysis results
     """
     
-    def __init__(self):
-        """Initialize Visualizer"""
-        pass
+    # Temporal series longer than this are plotted through plotly-resampler, if
+    # installed, or else averaged into PLOT_MAX_POINTS bins (the plot is pixel
+    # limited anyway; statistics still use the full series)
+    RESAMPLE_MIN_POINTS = 1000
+    PLOT_MAX_POINTS = 500
+    
+    # Temporal series longer than this get their trend fitted by numba, if installed
+    JIT_MIN_POINTS = 1000
+    
+    # Number of map centers kept, by image footprint
+    CENTER_CACHE_SIZE = 128
+    
+    # Number of images whose stretch statistics are kept
+    STRETCH_STATS_CACHE_SIZE = 32
+    
+    # Number of per-year images each year selector keeps for revisited years
+    YEAR_IMAGE_CACHE_SIZE = 32
+    
+    # Year ranges longer than this get a slider instead of a dropdown
+    YEAR_DROPDOWN_MAX_OPTIONS = 200
+    
+    # Temporal series longer than this are drawn with WebGL (one canvas) instead
+    # of SVG (one DOM node per point). Short series stay SVG, as browsers only
+    # allow a limited number of WebGL contexts per page
+    WEBGL_MIN_POINTS = 500
+    
+    # Stretch statistics are computed at a scale chosen from the footprint area
+    # so that about STRETCH_TARGET_PIXELS pixels are reduced, never finer than
+    # STRETCH_MIN_SCALE metres, and over at most STRETCH_MAX_PIXELS pixels
+    # (bestEffort coarsens the scale further if needed)
+    STRETCH_TARGET_PIXELS = int(1e5)
+    STRETCH_MIN_SCALE = 30
+    STRETCH_TILE_SCALE = 4
+    STRETCH_MAX_PIXELS = int(1e6)
+    
+    # Earth Engine requests (centering, stretch statistics, year and stretch
+    # updates) run on up to this many worker threads at once. Requests are
+    # high-latency but the endpoint is high-throughput, so independent ones
+    # overlap; the pool size also caps in-flight requests against quota
+    EE_MAX_WORKERS = 4
+    
+    # Palettes offered by the visualization controls
+    PALETTE_OPTIONS = MappingProxyType({
+        'Blue-White-Red': ('blue', 'white', 'red'),
+        'Viridis': ('#440154', '#414487', '#2a788e', '#22a884', '#7ad151', '#fde725'),
+        'Plasma': ('#0d0887', '#5302a3', '#8b0aa5', '#b83289', '#db5c68', '#f48849', '#febc2a'),
+        'Blues': ('#f7fbff', '#deebf7', '#c6dbef', '#9ecae1', '#6baed6', '#4292c6', '#2171b5', '#084594'),
+        'Reds': ('#fff5f0', '#fee0d2', '#fcbba1', '#fc9272', '#fb6a4a', '#ef3b2c', '#cb181d', '#99000d'),
+        'Terrain': ('#008837', '#a4da87', '#ffffcc', '#e0c18a', '#b30000'),
+        'Spectral': ('#9e0142', '#d53e4f', '#f46d43', '#fdae61', '#fee08b', '#ffffbf', '#e6f598', '#abdda4', '#66c2a5', '#3288bd', '#5e4fa2')
+    })
+    PALETTE_NAMES = tuple(PALETTE_OPTIONS)
+    
+    # Contrast stretches offered by the visualization controls
+    STRETCH_OPTIONS = ('None', 'Min-Max', 'Percentile (2-98%)', 'Percentile (5-95%)', 'Data Range + 10%')
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize Visualizer
+        
+        Args:
+            max_workers: Worker threads for Earth Engine requests (defaults to
+                EE_MAX_WORKERS); 0 runs them inline, e.g. where threads are
+                unavailable (Pyodide)
+        """
+        # Worker threads for map updates that wait on Earth Engine (building a
+        # year's image and its tile URL), so the notebook stays responsive
+        if max_workers is None:
+            max_workers = self.EE_MAX_WORKERS
+        if max_workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='visualizer')
+        else:
+            self._executor = _InlineExecutor()
+        
+        # Map centers by image footprint hash and stretch statistics by image
+        # hash, least recently used first (filled from the worker threads)
+        self._center_cache = OrderedDict()
+        self._stretch_stats_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def create_map(self, image: ee.Image, vis_params: Dict[str, Any], 
                 title: str, center: Tuple[float, float] = None, 
                 zoom: int = 3, start_year: int = None, end_year: int = None,
-                year_callback: callable = None) -> widgets.VBox:
+                year_callback: callable = None, minimal: bool = False,
+                auto_center: bool = True) -> widgets.VBox:
         """
         Create a map visualization for Earth Engine image with proper year toggling
         
@@ -36,10 +271,16 @@ class Visualizer:
             start_year: Start year for time range
             end_year: End year for time range
             year_callback: Callback to get image for a specific year
+            minimal: Leave out the visualization controls (e.g. for the maps
+                of a side-by-side comparison)
+            auto_center: Without a center, center the map on the image
+                footprint in the background (disable when the caller does it)
             
         Returns:
             Widget containing the map
         """
+        import geemap
+        
         # Create map
         m = geemap.Map(layout=Layout(width='100%', height='500px'))
         
@@ -49,21 +290,16 @@ class Visualizer:
         # Set center and zoom if provided
         if center:
             m.center = center
-        else:
-            # Try to center on image bounds
-            try:
-                bounds = image.geometry().bounds().getInfo()
-                coords = bounds['coordinates'][0]
-                lon = (coords[0][0] + coords[2][0]) / 2
-                lat = (coords[0][1] + coords[2][1]) / 2
-                m.center = [lat, lon]
-            except:
-                pass
+        elif auto_center:
+            # Center on image footprint once it is known (geemap's centerObject
+            # would block here: it fetches the centroid with getInfo itself)
+            self._center_maps_async([image], [m])
         
         m.zoom = zoom
         
         # Add layer
         m.addLayer(image, vis_params, title)
+        self._track_ee_layer(m, vis_params)
         
         # Create title
         map_title = HTML(value=f"<h5>{title}</h5>")
@@ -78,62 +314,19 @@ class Visualizer:
             layout=Layout(width='120px')
         )
         
-        # Improved method to remove all legends from the map
-        def remove_all_legends(map_obj):
-            """Remove all legends from the map"""
-            try:
-                # First try using the built-in method if it exists
-                if hasattr(map_obj, 'remove_colorbar'):
-                    map_obj.remove_colorbar()
-                
-                # Additionally, find and remove any colorbar widgets
-                # Check if map has legend_widget attribute
-                if hasattr(map_obj, 'legend_widget') and map_obj.legend_widget is not None:
-                    map_obj.remove_control(map_obj.legend_widget)
-                    map_obj.legend_widget = None
-                
-                # Also check for colorbar attribute
-                if hasattr(map_obj, 'colorbar') and map_obj.colorbar is not None:
-                    map_obj.remove_control(map_obj.colorbar)
-                    map_obj.colorbar = None
-                    
-                # Also manually scan and remove widgets that might be legends
-                controls_to_remove = []
-                for control in map_obj.controls:
-                    if hasattr(control, 'name') and 'colorbar' in control.name.lower():
-                        controls_to_remove.append(control)
-                    elif hasattr(control, 'description') and 'legend' in str(control.description).lower():
-                        controls_to_remove.append(control)
-                
-                for control in controls_to_remove:
-                    map_obj.remove_control(control)
-                    
-                # Update the legend state
-                map_obj.legend_visible = False
-            except Exception as e:
-                print(f"Error removing legends: {str(e)}")
-        
         # Handle legend toggle
         def on_legend_toggle(change):
             try:
                 if change['new']:  # Button is toggled on
-                    # First remove any existing legends to prevent duplicates
-                    remove_all_legends(m)
-                    
-                    # Then add the colorbar
-                    m.add_colorbar(
-                        vis_params['palette'],
-                        vis_params['min'],
-                        vis_params['max'],
-                        title,
-                        position='bottomright'
-                    )
-                    
-                    # Update the legend state
-                    m.legend_visible = True
+                    with m.hold_sync():
+                        # First remove any existing legends to prevent duplicates
+                        self._remove_all_legends(m)
+                        
+                        # Then add the colorbar
+                        self._add_colorbar(m, vis_params, title)
                 else:  # Button is toggled off
                     # Remove all legends
-                    remove_all_legends(m)
+                    self._remove_all_legends(m)
             except Exception as e:
                 print(f"Error toggling legend: {str(e)}")
         
@@ -151,7 +344,8 @@ class Visualizer:
                 start_year, 
                 end_year,
                 map_widget,  # Pass the map_widget for updates
-                year_callback
+                year_callback,
+                original_title=title
             )
             
             # Update map widget to include year selector and legend toggle
@@ -168,6 +362,9 @@ class Visualizer:
                 widgets.HBox([legend_btn])
             ])
         
+        if minimal:
+            return map_widget
+        
         # Create visualization controls - pass the legend toggle button to coordinate them
         vis_controls = self.create_visualization_controls(image, vis_params, map_widget, title, legend_btn)
         
@@ -177,6 +374,50 @@ class Visualizer:
             vis_controls
         ])
     
+    def _center_maps_async(self, images: List[ee.Image], maps: List[Any]) -> None:
+        """
+        Center maps on their images' footprints without blocking the caller
+        
+        Centers are cached by footprint. Missing ones are fetched together, in
+        one Earth Engine call on a worker thread, and applied when they arrive.
+        
+        Args:
+            images: Earth Engine images
+            maps: geemap Maps to center, one per image
+        """
+        pending = []
+        with self._cache_lock:
+            for image, m in zip(images, maps):
+                key = hash(image.geometry().serialize())
+                center = self._center_cache.get(key)
+                if center is None:
+                    pending.append((image, m, key))
+                else:
+                    self._center_cache.move_to_end(key)
+                    m.center = list(center)
+        
+        if not pending:
+            return
+        
+        def fetch_centers():
+            try:
+                centroids = ee.List([
+                    image.geometry().centroid(maxError=1000).coordinates()
+                    for image, _, _ in pending
+                ]).getInfo()
+            except Exception as e:
+                print(f"Warning: Could not center map: {str(e)}")
+                return
+            
+            with self._cache_lock:
+                for (_, m, key), (lon, lat) in zip(pending, centroids):
+                    self._center_cache[key] = (lat, lon)
+                    m.center = [lat, lon]
+                while len(self._center_cache) > self.CENTER_CACHE_SIZE:
+                    self._center_cache.popitem(last=False)
+        
+        self._executor.submit(fetch_centers)
+    
     def create_temporal_plot(self, data: List[Dict[str, Any]], 
                            title: str, y_label: str) -> go.FigureWidget:
         """
@@ -194,41 +435,65 @@ class Visualizer:
         if not data:
             return HTML(value="<p style='color: orange'>No temporal data available for plotting</p>")
         
+        import plotly.graph_objects as go
+        
         # Extract years and values
-        years = [d['year'] for d in data]
-        values = [d['value'] for d in data]
+        years, values = self._to_arrays(data)
         
-        # Calculate trend line
-        z = np.polyfit(years, values, 1)
-        p = np.poly1d(z)
-        trend_values = p(years)
+        # Calculate trend line (compiled for long series, if numba is installed)
+        fit = _jit_fit_and_trend() if len(years) > self.JIT_MIN_POINTS else None
+        if fit is not None:
+            slope, intercept, trend_values = fit(years.astype(np.float64), values)
+        else:
+            slope, intercept = self._linreg(years, values)
+            trend_values = intercept + slope * years
+        
+        # Long series: the resampler (optional dependency) keeps the full data
+        # in Python and only ships the points needed for the current view to
+        # the browser
+        FigureWidgetResampler = None
+        if len(years) > self.RESAMPLE_MIN_POINTS:
+            try:
+                from plotly_resampler import FigureWidgetResampler
+            except ImportError:
+                pass
+        resample = FigureWidgetResampler is not None
         
         # Create figure
-        fig = go.Figure()
+        fig = FigureWidgetResampler(go.Figure()) if resample else go.Figure()
+        scatter = go.Scattergl if len(years) > self.WEBGL_MIN_POINTS else go.Scatter
         
         # Add data trace
-        fig.add_trace(
-            go.Scatter(
-                x=years,
-                y=values,
-                mode='lines+markers',
-                name='Observed',
-                line=dict(color='#2166ac', width=2),
-                marker=dict(size=8)
-            )
+        observed = scatter(
+            mode='lines+markers',
+            name='Observed',
+            line=dict(color='#2166ac', width=2),
+            marker=dict(size=8)
         )
         
         # Add trend line
-        fig.add_trace(
-            go.Scatter(
-                x=years,
-                y=trend_values,
-                mode='lines',
-                name='Trend',
-                line=dict(color='#b2182b', width=2, dash='dash')
-            )
+        trend = scatter(
+            mode='lines',
+            name='Trend',
+            line=dict(color='#b2182b', width=2, dash='dash')
         )
         
+        if resample:
+            fig.add_trace(observed, hf_x=years, hf_y=values)
+            fig.add_trace(trend, hf_x=years, hf_y=trend_values)
+        else:
+            if len(years) > self.RESAMPLE_MIN_POINTS:
+                # Mean of each bin, plotted at the bin's first year
+                edges = np.linspace(0, len(values), self.PLOT_MAX_POINTS + 1, dtype=int)[:-1]
+                values = np.add.reduceat(values, edges) / np.diff(edges, append=len(values))
+                years = years[edges]
+                trend_values = trend_values[edges]
+            
+            observed.update(x=years, y=values)
+            trend.update(x=years, y=trend_values)
+            fig.add_trace(observed)
+            fig.add_trace(trend)
+        
         # Update layout
         fig.update_layout(
             title=dict(
@@ -251,6 +516,7 @@ class Visualizer:
                 zerolinecolor='grey'
             ),
             plot_bgcolor='white',
+            hovermode='x',  # hover by year, instead of nearest-point picking over every point
             width=800,
             height=400,
             margin=dict(l=50, r=50, t=70, b=50),
@@ -264,13 +530,223 @@ class Visualizer:
             )
         )
         
-        # Create widget
+        # Create widget (the resampler figure already is one)
+        if resample:
+            return fig
         plot_widget = go.FigureWidget(fig)
         
         return plot_widget
     
+    def update_temporal_plot(self, fig, data: List[Dict[str, Any]], 
+                           title: str = None, y_label: str = None) -> bool:
+        """
+        Show new temporal data on a plot made by create_temporal_plot
+        
+        The data and trend traces (and optionally the titles) are updated in
+        one batch, instead of building a new figure widget.
+        
+        Args:
+            fig: Figure widget returned by create_temporal_plot
+            data: List of dictionaries with 'year' and 'value' keys
+            title: Optional new plot title
+            y_label: Optional new y-axis label
+            
+        Returns:
+            True if the plot was updated, False if a new one has to be created
+            (no data, not a plain figure widget, or a different trace type)
+        """
+        if not data or len(data) > self.RESAMPLE_MIN_POINTS:
+            return False
+        if not hasattr(fig, 'batch_update') or hasattr(fig, 'hf_data') or len(fig.data) != 2:
+            return False
+        
+        webgl = len(data) > self.WEBGL_MIN_POINTS
+        if (fig.data[0].type == 'scattergl') != webgl:
+            return False
+        
+        years, values = self._to_arrays(data)
+        slope, intercept = self._linreg(years, values)
+        
+        with fig.batch_update():
+            fig.data[0].x = years
+            fig.data[0].y = values
+            fig.data[1].x = years
+            fig.data[1].y = intercept + slope * years
+            if title is not None:
+                fig.layout.title.text = title
+            if y_label is not None:
+                fig.layout.yaxis.title.text = y_label
+        
+        return True
+    
+    @staticmethod
+    def _swap_ee_layer(layer, image: ee.Image, vis_params: Dict[str, Any], name: str) -> bool:
+        """
+        Show a different image or styling on an existing Earth Engine tile layer
+        
+        Only the layer's tile URL (and name and opacity) change, so the map
+        keeps the layer and the browser just loads the new tiles, instead of
+        the layer being removed and rebuilt.
+        
+        Args:
+            layer: Tile layer previously added with addLayer
+            image: Earth Engine image to show
+            vis_params: Visualization parameters (with optional 'opacity')
+            name: New layer name
+            
+        Returns:
+            True if the layer was updated, False if it has to be rebuilt instead
+        """
+        try:
+            ee_vis_params = dict(vis_params)
+            opacity = ee_vis_params.pop('opacity', None)
+            map_id = image.getMapId(ee_vis_params)
+            
+            with layer.hold_sync():
+                layer.url = map_id['tile_fetcher'].url_format
+                layer.name = name
+                if opacity is not None:
+                    layer.opacity = opacity
+            return True
+        except Exception as e:
+            print(f"Warning: Could not update layer in place: {str(e)}")
+            return False
+    
+    @staticmethod
+    def _track_ee_layer(m, vis_params: Dict[str, Any]) -> None:
+        """
+        Record the data layer just added to a map, and its visualization parameters
+        
+        The year selector and visualization controls update this layer directly
+        instead of searching the map's layers for it.
+        
+        Args:
+            m: geemap Map the layer was added to (as its last layer)
+            vis_params: Visualization parameters of the layer
+        """
+        m._ee_layer_ref = m.layers[-1]
+        m._current_vis_params = vis_params
+    
+    @staticmethod
+    def _add_colorbar(m, vis_params: Dict[str, Any], label: str) -> None:
+        """
+        Add a colorbar legend to a map, remembering its controls for removal
+        
+        Args:
+            m: geemap Map
+            vis_params: Visualization parameters ('palette', 'min' and 'max')
+            label: Legend label
+        """
+        n_controls = len(m.controls)
+        m.add_colorbar(
+            vis_params['palette'],
+            vis_params['min'],
+            vis_params['max'],
+            label,
+            position='bottomright'
+        )
+        
+        # Controls are appended, so the new ones are the legend
+        m._legend_controls = m.controls[n_controls:]
+        m.legend_visible = True
+        m._colorbar_key = Visualizer._colorbar_key(vis_params, label)
+    
+    @staticmethod
+    def _remove_all_legends(m) -> None:
+        """
+        Remove all legends added with _add_colorbar from a map
+        
+        The legend controls were recorded when added, so the map's controls
+        need not be searched for anything that looks like a legend.
+        
+        Args:
+            m: geemap Map
+        """
+        try:
+            # First try using the built-in method if it exists
+            if hasattr(m, 'remove_colorbar'):
+                m.remove_colorbar()
+            
+            # Remove the recorded controls geemap left in place, in one update
+            legend_controls = getattr(m, '_legend_controls', ())
+            if legend_controls:
+                m.controls = tuple(control for control in m.controls if control not in legend_controls)
+        except Exception as e:
+            print(f"Error removing legends: {str(e)}")
+        
+        # Update the legend state
+        m._legend_controls = ()
+        m.legend_visible = False
+        m._colorbar_key = None
+    
+    @staticmethod
+    def _colorbar_key(vis_params: Dict[str, Any], label: str) -> Tuple:
+        """
+        Identify what a map legend shows, to skip rebuilding an identical one
+        
+        Args:
+            vis_params: Visualization parameters of the legend
+            label: Legend label
+            
+        Returns:
+            Hashable (palette, min, max, label) tuple
+        """
+        return (tuple(vis_params['palette']), vis_params['min'], vis_params['max'], label)
+    
+    @staticmethod
+    def _to_arrays(data: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert temporal records to year and value arrays in one pass each
+        
+        Args:
+            data: List of dictionaries with 'year' and 'value' keys
+            
+        Returns:
+            Tuple of (int32 years, float64 values)
+        """
+        years = np.fromiter((d['year'] for d in data), dtype=np.int32, count=len(data))
+        return years, Visualizer._to_values(data)
+    
+    @staticmethod
+    def _to_values(data: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Convert temporal records to a value array in one pass (years skipped)
+        
+        Args:
+            data: List of dictionaries with 'year' and 'value' keys
+            
+        Returns:
+            float64 values
+        """
+        return np.fromiter((d['value'] for d in data), dtype=np.float64, count=len(data))
+    
+    @staticmethod
+    def _linreg(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+        """
+        Least-squares line through the points, in closed form
+        
+        Same fit as np.polyfit(x, y, 1) without its general solver, which is
+        most of the cost for the short series plotted here.
+        
+        Args:
+            x: X values
+            y: Y values
+            
+        Returns:
+            Tuple of (slope, intercept); the slope is 0 if all x are equal
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        x_mean = x.mean()
+        y_mean = y.mean()
+        dx = x - x_mean
+        denominator = (dx * dx).sum()
+        slope = (dx * (y - y_mean)).sum() / denominator if denominator else 0.0
+        return slope, y_mean - slope * x_mean
+    
     def create_year_selector(self, start_year: int, end_year: int, 
-                        map_widget, image_callback) -> widgets.Dropdown:
+                        map_widget, image_callback,
+                        original_title: str = None) -> widgets.ValueWidget:
         """
         Create year selection dropdown with proper callback
         
@@ -279,25 +755,58 @@ class Visualizer:
             end_year: Last year in range
             map_widget: Map widget to update
             image_callback: Function to get image for a specific year
+            original_title: Layer title (used for the layer name and legend);
+                read from the map widget's heading if not given
             
         Returns:
-            Year selection dropdown
+            Year selection dropdown (a slider for more than
+            YEAR_DROPDOWN_MAX_OPTIONS years)
         """
+        # Title of the layer, resolved once rather than on every year change
+        title = original_title
+        if title is None:
+            title = "Annual maximum temperature"  # Default title
+            try:
+                # Try to get original title from map_widget
+                if hasattr(map_widget, 'children') and len(map_widget.children) > 0:
+                    if isinstance(map_widget.children[0], HTML):
+                        title_match = re.search(r'<h5>(.*?)</h5>', map_widget.children[0].value)
+                        if title_match:
+                            title = title_match.group(1)
+            except:
+                pass
+        
         # Default years if not provided
         if start_year is None:
             start_year = 2020
         if end_year is None:
             end_year = 2020
         
-        # Create dropdown with all years
-        year_dropdown = widgets.Dropdown(
-            options=list(range(start_year, end_year + 1)),
-            value=end_year,
-            description='Year:',
-            style={'description_width': 'initial'},
-            layout=Layout(width='150px'),
-            disabled=start_year == end_year
-        )
+        # Create dropdown with all years, or a slider for very long ranges
+        if end_year - start_year + 1 > self.YEAR_DROPDOWN_MAX_OPTIONS:
+            year_dropdown = widgets.IntSlider(
+                min=start_year,
+                max=end_year,
+                value=end_year,
+                description='Year:',
+                continuous_update=False,
+                style={'description_width': 'initial'},
+                layout=Layout(width='300px')
+            )
+        else:
+            year_dropdown = widgets.Dropdown(
+                options=tuple(range(start_year, end_year + 1)),
+                value=end_year,
+                description='Year:',
+                style={'description_width': 'initial'},
+                layout=Layout(width='150px'),
+                disabled=start_year == end_year
+            )
+        
+        # Images recently built for this selector, by year (least recently
+        # used first), so revisiting a year does not rebuild its image
+        images_by_year = OrderedDict()
+        images_lock = threading.Lock()
         
         # Create update function that actually updates the map
         def update_map_for_year(change):
@@ -311,7 +820,21 @@ class Visualizer:
                 print(f"Updating map for year: {new_year}")
                 
                 # Get image for the new year
-                new_image = image_callback(new_year)
+                with images_lock:
+                    new_image = images_by_year.get(new_year)
+                    if new_image is not None:
+                        images_by_year.move_to_end(new_year)
+                if new_image is None:
+                    new_image = image_callback(new_year)
+                    if new_image is not None:
+                        with images_lock:
+                            images_by_year[new_year] = new_image
+                            if len(images_by_year) > self.YEAR_IMAGE_CACHE_SIZE:
+                                images_by_year.popitem(last=False)
+                
+                # Another year was selected while this one was loading
+                if new_year != year_dropdown.value:
+                    return
                 
                 if new_image and map_widget:
                     # Get map from widget (second child is the map)
@@ -326,111 +849,77 @@ class Visualizer:
                     if hasattr(m, 'legend_visible'):
                         legend_visible = m.legend_visible
                     
-                    # Get current visualization parameters (try to maintain them)
-                    # Default visualization parameters
-                    vis_params = {
+                    # Keep the current visualization parameters (recorded on
+                    # the map with its data layer), or use the defaults
+                    vis_params = getattr(m, '_current_vis_params', None) or {
                         'min': 0,
                         'max': 100,
                         'palette': ['blue', 'white', 'red']
                     }
                     
-                    # Try to extract vis_params from existing layers
-                    try:
-                        for layer in m.layers:
-                            if hasattr(layer, 'vis_params'):
-                                vis_params = layer.vis_params
-                                break
-                            if hasattr(layer, 'name') and 'ee_layer' in str(layer.name).lower():
-                                if hasattr(layer, 'vis_params'):
-                                    vis_params = layer.vis_params
-                                    break
-                    except Exception as e:
-                        print(f"Error getting vis_params: {e}")
+                    # Point the existing data layer at the new year's tiles
+                    # when possible, instead of rebuilding the layer
+                    ee_layer = getattr(m, '_ee_layer_ref', None)
+                    swapped = ee_layer is not None and \
+                        self._swap_ee_layer(ee_layer, new_image, vis_params, f"{title} ({new_year})")
                     
-                    # Clear previous layers
-                    try:
-                        # Try to get only the first layer (usually the base map)
-                        base_layers = [m.layers[0]] if len(m.layers) > 0 else []
-                        
-                        # Replace all layers with just the base layer
-                        m.layers = base_layers
-                    except Exception as e:
-                        print(f"Error clearing layers: {e}")
-                        # Alternative approach if the above fails
-                        try:
-                            # Try to clear all earth engine layers
-                            layers_to_remove = []
-                            for i, layer in enumerate(m.layers):
-                                if i > 0:  # Keep base layer
-                                    layers_to_remove.append(layer)
-                            
-                            for layer in layers_to_remove:
-                                m.remove_layer(layer)
-                        except Exception as e2:
-                            print(f"Error with alternative layer removal: {e2}")
+                    # Remove legends, unless the visible one already shows this
+                    # palette, range and label. The legend is labelled without
+                    # the year (the selector shows it), so it normally stays
+                    colorbar_key = self._colorbar_key(vis_params, title)
+                    keep_legend = legend_visible and getattr(m, '_colorbar_key', None) == colorbar_key
                     
-                    # Function to remove all legends
-                    def remove_all_legends(map_obj):
-                        try:
-                            if hasattr(map_obj, 'remove_colorbar'):
-                                map_obj.remove_colorbar()
-                            
-                            if hasattr(map_obj, 'legend_widget') and map_obj.legend_widget is not None:
-                                map_obj.remove_control(map_obj.legend_widget)
-                                map_obj.legend_widget = None
+                    # Layer and legend changes reach the browser as one update
+                    with m.hold_sync():
+                        if not swapped:
+                            # Clear previous layers, keeping only the first layer
+                            # (usually the base map)
+                            m.layers = tuple(m.layers[:1])
+                        
+                        if not keep_legend:
+                            self._remove_all_legends(m)
+                        
+                        if not swapped:
+                            # Add the new layer with the image for the selected year
+                            m.addLayer(new_image, vis_params, f"{title} ({new_year})")
+                            self._track_ee_layer(m, vis_params)
                             
-                            if hasattr(map_obj, 'colorbar') and map_obj.colorbar is not None:
-                                map_obj.remove_control(map_obj.colorbar)
-                                map_obj.colorbar = None
-                        except Exception as e:
-                            print(f"Error removing legends: {e}")
-                    
-                    # Remove legends
-                    remove_all_legends(m)
-                    
-                    # Add the new layer
-                    title = "Annual maximum temperature"  # Default title
-                    try:
-                        # Try to get original title from map_widget
-                        if hasattr(map_widget, 'children') and len(map_widget.children) > 0:
-                            if isinstance(map_widget.children[0], HTML):
-                                title_html = map_widget.children[0].value
-                                import re
-                                title_match = re.search(r'<h5>(.*?)</h5>', title_html)
-                                if title_match:
-                                    title = title_match.group(1)
-                    except:
-                        pass
-                    
-                    # Add the new layer with the image for the selected year
-                    m.addLayer(new_image, vis_params, f"{title} ({new_year})")
-                    
-                    # Restore view
-                    m.center = center
-                    m.zoom = zoom
-                    
-                    # Restore legend if it was visible
-                    if legend_visible:
-                        m.add_colorbar(
-                            vis_params['palette'],
-                            vis_params['min'],
-                            vis_params['max'],
-                            f"{title} ({new_year})",
-                            position='bottomright'
-                        )
-                        m.legend_visible = True
+                            # Restore view
+                            m.center = center
+                            m.zoom = zoom
+                        
+                        # Restore legend if it was visible
+                        if legend_visible and not keep_legend:
+                            self._add_colorbar(m, vis_params, title)
                     
                     print(f"Map updated for year {new_year}")
                 else:
                     print("Could not update map: image or map_widget is None")
                     
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
-                print(f"Error updating map for year {change.get('new', 'unknown')}: {str(e)}")
+            except Exception:
+                # The stack trace is only formatted if the logger emits it
+                logger.exception("Error updating map for year %s", change.get('new', 'unknown'))
         
-        # Set callback for year change
-        year_dropdown.observe(update_map_for_year, names='value')
+        # Run the update on a worker thread, flagging the selector meanwhile
+        def update_in_background(change):
+            year_dropdown.description = 'Year (loading):'
+            future = self._executor.submit(update_map_for_year, change)
+            
+            def on_done(f):
+                if year_dropdown.value == change['new']:
+                    year_dropdown.description = 'Year:'
+            
+            future.add_done_callback(on_done)
+        
+        # Set callback for year change; debounced, so scrolling through the
+        # years only loads the map layer of the year the user stops on
+        debounced_update = debounce(update_in_background)
+        
+        def on_year_change(change):
+            if change['new'] != change['old']:
+                debounced_update(change)
+        
+        year_dropdown.observe(on_year_change, names='value')
         
         return year_dropdown
     
@@ -453,14 +942,25 @@ class Visualizer:
         left_map = self.create_map(
             left_results["data"],
             left_results["vis_params"],
-            f"{left_results['index']} ({left_results['dataset']})"
+            f"{left_results['index']} ({left_results['dataset']})",
+            minimal=True,
+            auto_center=False
         )
         
         # Create right map
         right_map = self.create_map(
             right_results["data"],
             right_results["vis_params"],
-            f"{right_results['index']} ({right_results['dataset']})"
+            f"{right_results['index']} ({right_results['dataset']})",
+            minimal=True,
+            auto_center=False
+        )
+        
+        # Center both maps, fetching their centers in one round trip
+        # (second child of a minimal map widget is the map)
+        self._center_maps_async(
+            [left_results["data"], right_results["data"]],
+            [left_map.children[1], right_map.children[1]]
         )
         
         # Create comparison table
@@ -488,55 +988,29 @@ class Visualizer:
             HTML widget with comparison table
         """
         # Calculate statistics
-        left_values = [d['value'] for d in left_results.get('temporal_data', [])]
-        right_values = [d['value'] for d in right_results.get('temporal_data', [])]
-        
-        left_mean = np.mean(left_values) if left_values else "N/A"
-        right_mean = np.mean(right_values) if right_values else "N/A"
-        
-        left_min = np.min(left_values) if left_values else "N/A"
-        right_min = np.min(right_values) if right_values else "N/A"
-        
-        left_max = np.max(left_values) if left_values else "N/A"
-        right_max = np.max(right_values) if right_values else "N/A"
+        left_values = self._to_values(left_results.get('temporal_data', ()))
+        right_values = self._to_values(right_results.get('temporal_data', ()))
         
-        left_trend = "Increasing" if left_values and len(left_values) > 1 and np.polyfit(range(len(left_values)), left_values, 1)[0] > 0 else "Decreasing"
-        right_trend = "Increasing" if right_values and len(right_values) > 1 and np.polyfit(range(len(right_values)), right_values, 1)[0] > 0 else "Decreasing"
+        fields = {
+            'left_title': f"{left_results['index']} ({left_results['dataset']})",
+            'right_title': f"{right_results['index']} ({right_results['dataset']})",
+            'left_units': left_results['units'],
+            'right_units': right_results['units']
+        }
+        for side, values in (('left', left_values), ('right', right_values)):
+            if values.size:
+                stats = np.array([values.mean(), values.min(), values.max()])
+                fields[f'{side}_mean'], fields[f'{side}_min'], fields[f'{side}_max'] = \
+                    np.char.mod('%.2f', stats).tolist()
+            else:
+                fields[f'{side}_mean'] = fields[f'{side}_min'] = fields[f'{side}_max'] = "N/A"
+            
+            increasing = values.size > 1 and \
+                self._linreg(np.arange(values.size, dtype=np.float64), values)[0] > 0
+            fields[f'{side}_trend'] = "Increasing" if increasing else "Decreasing"
         
         # Create table
-        table_html = f"""
-        <table style="width:100%; border-collapse: collapse; margin: 20px 0;">
-            <thead>
-                <tr style="background-color: #f0f0f0;">
-                    <th style="padding: 8px; border: 1px solid #ddd;">Metric</th>
-                    <th style="padding: 8px; border: 1px solid #ddd;">{left_results['index']} ({left_results['dataset']})</th>
-                    <th style="padding: 8px; border: 1px solid #ddd;">{right_results['index']} ({right_results['dataset']})</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td style="padding: 8px; border: 1px solid #ddd;">Mean</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{left_mean} {left_results['units']}</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{right_mean} {right_results['units']}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px; border: 1px solid #ddd;">Min</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{left_min} {left_results['units']}</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{right_min} {right_results['units']}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px; border: 1px solid #ddd;">Max</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{left_max} {left_results['units']}</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{right_max} {right_results['units']}</td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px; border: 1px solid #ddd;">Trend</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{left_trend}</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{right_trend}</td>
-                </tr>
-            </tbody>
-        </table>
-        """
+        table_html = _CMP_TABLE_TMPL.substitute(fields)
         
         return HTML(value=table_html)
     
@@ -551,32 +1025,94 @@ class Visualizer:
             HTML widget with summary statistics
         """
         # Extract values
-        values = [d['value'] for d in results.get('temporal_data', [])]
+        values = self._to_values(results.get('temporal_data', ()))
         
-        if not values:
+        if not values.size:
             return HTML(value="<p>No data available for statistics</p>")
         
-        # Calculate statistics
-        mean_val = np.mean(values)
-        min_val = np.min(values)
-        max_val = np.max(values)
-        std_val = np.std(values)
+        # Format all statistics in one call
+        stats = np.array([values.mean(), values.min(), values.max(), values.std()])
+        mean_str, min_str, max_str, std_str = np.char.mod('%.2f', stats).tolist()
         
         # Create HTML
-        stats_html = f"""
-        <div style="padding: 10px; background: #f5f5f5; border-radius: 5px; margin: 10px 0;">
-            <h5 style="margin-top: 0;">Summary Statistics</h5>
-            <table style="width:100%;">
-                <tr><td>Mean:</td><td>{mean_val:.2f} {results['units']}</td></tr>
-                <tr><td>Min:</td><td>{min_val:.2f} {results['units']}</td></tr>
-                <tr><td>Max:</td><td>{max_val:.2f} {results['units']}</td></tr>
-                <tr><td>Standard Deviation:</td><td>{std_val:.2f} {results['units']}</td></tr>
-            </table>
-        </div>
-        """
+        stats_html = _SUMMARY_STATS_TMPL.substitute(
+            mean=mean_str,
+            min=min_str,
+            max=max_str,
+            std=std_str,
+            units=results['units']
+        )
         
         return HTML(value=stats_html)
     
+    def _batch_stats(self, images: List[ee.Image]) -> List[Dict[str, Any]]:
+        """
+        Compute stretch statistics for several images in one Earth Engine call
+        
+        The first band of each image (the only one the stretch uses) is
+        reduced (min, max and the 2/5/95/98th percentiles) over its
+        own footprint, at the scale giving about STRETCH_TARGET_PIXELS pixels
+        but at least STRETCH_MIN_SCALE. The scale is derived server-side from
+        the footprint area, so the whole batch is a single round trip. Results are cached by image, and
+        cached images are left out of the request. Images that already carry
+        the statistics of their first band as properties ('<band>_min',
+        '<band>_max', '<band>_p2', '<band>_p5', '<band>_p95' and '<band>_p98',
+        e.g. precomputed on an asset) return those instead of being reduced.
+        
+        Args:
+            images: Earth Engine images
+            
+        Returns:
+            One statistics dictionary per image ('<band>_min', '<band>_p2', ...)
+        """
+        keys = [hash(image.serialize()) for image in images]
+        with self._cache_lock:
+            stats = [self._stretch_stats_cache.get(key) for key in keys]
+        
+        missing = [i for i, image_stats in enumerate(stats) if image_stats is None]
+        if missing:
+            computed = ee.List([self._stretch_stats(images[i]) for i in missing]).getInfo()
+            
+            with self._cache_lock:
+                for i, image_stats in zip(missing, computed):
+                    stats[i] = self._stretch_stats_cache[keys[i]] = image_stats
+                while len(self._stretch_stats_cache) > self.STRETCH_STATS_CACHE_SIZE:
+                    self._stretch_stats_cache.popitem(last=False)
+        
+        return stats
+    
+    def _stretch_stats(self, image: ee.Image) -> ee.Dictionary:
+        """
+        Server-side stretch statistics of an image, from its properties if stored
+        
+        Args:
+            image: Earth Engine image
+            
+        Returns:
+            Dictionary of statistics ('<band>_min', '<band>_p2', ...), not yet fetched
+        """
+        band = ee.String(image.bandNames().get(0))
+        stored_keys = ee.List(['_min', '_max', '_p2', '_p5', '_p95', '_p98']).map(
+            lambda suffix: band.cat(suffix)
+        )
+        
+        # If is evaluated lazily on the server, so images carrying their
+        # statistics are never reduced
+        return ee.Dictionary(ee.Algorithms.If(
+            image.propertyNames().containsAll(stored_keys),
+            image.toDictionary(stored_keys),
+            # Only the first band is reduced, as only it is stretched
+            image.select(0).reduceRegion(
+                reducer=_stretch_reducer(),
+                geometry=image.geometry(),
+                scale=image.geometry().area(maxError=1000)
+                    .divide(self.STRETCH_TARGET_PIXELS).sqrt().max(self.STRETCH_MIN_SCALE),
+                maxPixels=self.STRETCH_MAX_PIXELS,
+                bestEffort=True,
+                tileScale=self.STRETCH_TILE_SCALE
+            )
+        ))
+    
     def create_visualization_controls(self, image, vis_params, map_widget, title, legend_btn=None):
         """
         Create controls for adjusting visualization parameters
@@ -596,6 +1132,10 @@ class Visualizer:
         current_max = vis_params.get('max', 100)
         current_palette = vis_params.get('palette', ['blue', 'white', 'red'])
         
+        # One layout shared by the sliders and dropdowns: a Layout is a widget
+        # of its own, with its own comm, so sharing it saves three per panel
+        control_layout = Layout(width='250px')
+        
         # Create min/max sliders
         min_slider = widgets.FloatSlider(
             value=current_min,
@@ -604,7 +1144,7 @@ class Visualizer:
             step=(current_max - current_min) / 100 if current_max > current_min else 1,
             description='Min:',
             style={'description_width': 'initial'},
-            layout=Layout(width='250px')
+            layout=control_layout
         )
         
         max_slider = widgets.FloatSlider(
@@ -614,36 +1154,25 @@ class Visualizer:
             step=(current_max - current_min) / 100 if current_max > current_min else 1,
             description='Max:',
             style={'description_width': 'initial'},
-            layout=Layout(width='250px')
+            layout=control_layout
         )
         
         # Create palette selector
-        palette_options = {
-            'Blue-White-Red': ['blue', 'white', 'red'],
-            'Viridis': ['#440154', '#414487', '#2a788e', '#22a884', '#7ad151', '#fde725'],
-            'Plasma': ['#0d0887', '#5302a3', '#8b0aa5', '#b83289', '#db5c68', '#f48849', '#febc2a'],
-            'Blues': ['#f7fbff', '#deebf7', '#c6dbef', '#9ecae1', '#6baed6', '#4292c6', '#2171b5', '#084594'],
-            'Reds': ['#fff5f0', '#fee0d2', '#fcbba1', '#fc9272', '#fb6a4a', '#ef3b2c', '#cb181d', '#99000d'],
-            'Terrain': ['#008837', '#a4da87', '#ffffcc', '#e0c18a', '#b30000'],
-            'Spectral': ['#9e0142', '#d53e4f', '#f46d43', '#fdae61', '#fee08b', '#ffffbf', '#e6f598', '#abdda4', '#66c2a5', '#3288bd', '#5e4fa2']
-        }
-        
         palette_dropdown = widgets.Dropdown(
-            options=list(palette_options.keys()),
+            options=self.PALETTE_NAMES,
             value='Blue-White-Red',
             description='Palette:',
             style={'description_width': 'initial'},
-            layout=Layout(width='250px')
+            layout=control_layout
         )
         
         # Create stretch type selector with better options
-        stretch_options = ['None', 'Min-Max', 'Percentile (2-98%)', 'Percentile (5-95%)', 'Data Range + 10%']
         stretch_dropdown = widgets.Dropdown(
-            options=stretch_options,
+            options=self.STRETCH_OPTIONS,
             value='None',
             description='Stretch:',
             style={'description_width': 'initial'},
-            layout=Layout(width='250px')
+            layout=control_layout
         )
         
         # Create apply button
@@ -656,138 +1185,112 @@ class Visualizer:
         # Status message
         status_message = widgets.HTML(value="")
         
-        # Helper function to remove all legends
-        def remove_all_legends(m):
-            """Remove all legends from the map"""
-            try:
-                # First try using the built-in method if it exists
-                if hasattr(m, 'remove_colorbar'):
-                    m.remove_colorbar()
-                
-                # Additionally, find and remove any colorbar widgets
-                # Check if map has legend_widget attribute
-                if hasattr(m, 'legend_widget') and m.legend_widget is not None:
-                    m.remove_control(m.legend_widget)
-                    m.legend_widget = None
-                
-                # Also check for colorbar attribute
-                if hasattr(m, 'colorbar') and m.colorbar is not None:
-                    m.remove_control(m.colorbar)
-                    m.colorbar = None
-                    
-                # Also manually scan and remove widgets that might be legends
-                controls_to_remove = []
-                for control in m.controls:
-                    if hasattr(control, 'name') and 'colorbar' in control.name.lower():
-                        controls_to_remove.append(control)
-                    elif hasattr(control, 'description') and 'legend' in str(control.description).lower():
-                        controls_to_remove.append(control)
-                
-                for control in controls_to_remove:
-                    m.remove_control(control)
-            except Exception as e:
-                print(f"Error removing legends: {str(e)}")
+        # Visualization parameters that do not depend on the stretch, kept
+        # up to date by the palette observer so applying only adds min/max
+        static_vis = {
+            'palette': list(self.PALETTE_OPTIONS[palette_dropdown.value]),
+            'opacity': vis_params.get('opacity', 0.8)
+        }
         
-        # Apply button handler
-        def on_apply(b):
+        def on_palette_change(change):
+            static_vis['palette'] = list(self.PALETTE_OPTIONS[change['new']])
+        
+        palette_dropdown.observe(on_palette_change, names='value')
+        
+        # Statistics for every stretch option, computed by a single combined
+        # reducer in the background as soon as the controls are built, so
+        # applying a stretch is only a dictionary lookup. Only the displayed
+        # band is reduced: the one vis_params names, or else the first
+        bands = vis_params.get('bands')
+        if isinstance(bands, str):
+            bands = bands.split(',')
+        stats_image = image.select([bands[0].strip()]) if bands else image
+        
+        def compute_stretch_stats():
+            return _stats_by_band(self._batch_stats([stats_image])[0])
+        
+        computing_message = "<p>Computing stretches...</p>"
+        status_message.value = computing_message
+        stretch_future = self._executor.submit(compute_stretch_stats)
+        
+        def on_stretch_stats_ready(future):
+            if status_message.value == computing_message:
+                status_message.value = "" if future.exception() is None else \
+                    "<p style='color: orange'>Stretch statistics unavailable</p>"
+        
+        stretch_future.add_done_callback(on_stretch_stats_ready)
+        
+        def get_stretch_stats():
+            # Retry a failed background computation; this already runs on a
+            # worker thread (see on_apply), so retry here rather than queue
+            if stretch_future.done() and stretch_future.exception() is not None:
+                return compute_stretch_stats()
+            return stretch_future.result()
+        
+        # Apply the chosen parameters (runs on a worker thread)
+        def apply_changes():
             try:
                 # Get current values
                 min_val = min_slider.value
                 max_val = max_slider.value
-                palette_name = palette_dropdown.value
                 stretch_type = stretch_dropdown.value
                 
                 # Update status
                 status_message.value = "<p>Updating visualization...</p>"
                 
-                # Get palette
-                palette = palette_options[palette_name]
-                
                 # Apply stretch if selected
                 if stretch_type != 'None':
                     try:
-                        if stretch_type == 'Min-Max':
-                            # Calculate min/max for the region
-                            stats = image.reduceRegion(
-                                reducer=ee.Reducer.minMax(),
-                                geometry=image.geometry(),
-                                scale=1000,
-                                maxPixels=1e9
-                            ).getInfo()
-                            
-                            # Extract min/max values (use first band's values)
-                            band_keys = [k for k in stats.keys() if k.endswith('_min') or k.endswith('_max')]
-                            if band_keys:
-                                min_key = [k for k in band_keys if k.endswith('_min')][0]
-                                max_key = [k for k in band_keys if k.endswith('_max')][0]
-                                min_val = stats[min_key]
-                                max_val = stats[max_key]
+                        stats = get_stretch_stats()
                         
-                        elif stretch_type.startswith('Percentile'):
-                            # Extract percentile values
-                            if '2-98%' in stretch_type:
-                                low_pct = 2
-                                high_pct = 98
-                            else:  # 5-95%
-                                low_pct = 5
-                                high_pct = 95
-                            
-                            # Calculate percentiles
-                            percentiles = image.reduceRegion(
-                                reducer=ee.Reducer.percentile([low_pct, high_pct]),
-                                geometry=image.geometry(),
-                                scale=1000,
-                                maxPixels=1e9
-                            ).getInfo()
+                        # Use the first band's values
+                        band_stats = next(iter(stats.values()), None)
+                        if band_stats is not None:
+                            if stretch_type == 'Min-Max':
+                                min_val = band_stats['min']
+                                max_val = band_stats['max']
                             
-                            # Extract percentile values (use first band's values)
-                            band_keys = list(percentiles.keys())
-                            if band_keys:
-                                first_band = band_keys[0].split('_')[0]
-                                min_val = percentiles.get(f"{first_band}_{low_pct}", min_val)
-                                max_val = percentiles.get(f"{first_band}_{high_pct}", max_val)
-                        
-                        elif stretch_type == 'Data Range + 10%':
-                            # Calculate min/max for the region
-                            stats = image.reduceRegion(
-                                reducer=ee.Reducer.minMax(),
-                                geometry=image.geometry(),
-                                scale=1000,
-                                maxPixels=1e9
-                            ).getInfo()
+                            elif stretch_type.startswith('Percentile'):
+                                # Extract percentile values
+                                if '2-98%' in stretch_type:
+                                    low_pct = 2
+                                    high_pct = 98
+                                else:  # 5-95%
+                                    low_pct = 5
+                                    high_pct = 95
+                                
+                                min_val = band_stats.get(f"p{low_pct}", min_val)
+                                max_val = band_stats.get(f"p{high_pct}", max_val)
                             
-                            # Extract min/max values (use first band's values)
-                            band_keys = [k for k in stats.keys() if k.endswith('_min') or k.endswith('_max')]
-                            if band_keys:
-                                min_key = [k for k in band_keys if k.endswith('_min')][0]
-                                max_key = [k for k in band_keys if k.endswith('_max')][0]
-                                data_min = stats[min_key]
-                                data_max = stats[max_key]
+                            elif stretch_type == 'Data Range + 10%':
+                                data_min = band_stats['min']
+                                data_max = band_stats['max']
                                 
                                 # Add 10% padding
                                 range_val = data_max - data_min
                                 min_val = data_min - (range_val * 0.1)
                                 max_val = data_max + (range_val * 0.1)
                         
-                        # Update sliders with new values
-                        min_slider.min = min_val * 0.8 if min_val != 0 else -10
-                        min_slider.max = max_val
-                        min_slider.value = min_val
+                        # Update sliders with new values, each in one message to
+                        # the browser and validated only once all bounds are set
+                        step = (max_val - min_val) / 100 if max_val > min_val else 1
+                        with min_slider.hold_sync(), min_slider.hold_trait_notifications():
+                            min_slider.min = min_val * 0.8 if min_val != 0 else -10
+                            min_slider.max = max_val
+                            min_slider.value = min_val
+                            min_slider.step = step
                         
-                        max_slider.min = min_val
-                        max_slider.max = max_val * 1.2 if max_val != 0 else 100
-                        max_slider.value = max_val
+                        with max_slider.hold_sync(), max_slider.hold_trait_notifications():
+                            max_slider.min = min_val
+                            max_slider.max = max_val * 1.2 if max_val != 0 else 100
+                            max_slider.value = max_val
+                            max_slider.step = step
                         
                     except Exception as e:
                         status_message.value = f"<p style='color: orange'>Warning: Could not compute stretch values: {str(e)}</p>"
                 
                 # Create new visualization parameters
-                new_vis_params = {
-                    'min': min_val,
-                    'max': max_val,
-                    'palette': palette,
-                    'opacity': vis_params.get('opacity', 0.8)
-                }
+                new_vis_params = {**static_vis, 'min': min_val, 'max': max_val}
                 
                 # Access the map object
                 m = map_widget.children[1]
@@ -797,84 +1300,67 @@ class Visualizer:
                 if hasattr(m, 'legend_visible'):
                     legend_was_visible = m.legend_visible
                 
-                # Find the layer to update - FIX HERE
-                layer_name = title
-                try:
-                    # Check if layers is a dictionary or attribute object
-                    if hasattr(m, 'layers'):
-                        if hasattr(m.layers, 'keys'):
-                            # Dictionary-like access
-                            for layer_key in m.layers.keys():
-                                if layer_key.startswith('ee_layer_') and hasattr(m.layers[layer_key], 'name'):
-                                    if m.layers[layer_key].name == title:
-                                        layer_name = m.layers[layer_key].name
-                                        break
-                        elif isinstance(m.layers, (list, tuple)):
-                            # List or tuple access
-                            for layer in m.layers:
-                                if hasattr(layer, 'name') and layer.name == title:
-                                    layer_name = layer.name
-                                    break
-                except Exception as e:
-                    print(f"Warning: Error finding layer: {str(e)}")
+                # Nothing to redraw if the layer already has these parameters;
+                # otherwise re-style the existing layer in place when possible:
+                # only its tile URL changes, so the map is not rebuilt
+                ee_layer = getattr(m, '_ee_layer_ref', None)
+                swapped = ee_layer is not None and (
+                    getattr(m, '_current_vis_params', None) == new_vis_params or
+                    self._swap_ee_layer(ee_layer, image, new_vis_params, title)
+                )
                 
-                # Try a more direct approach if needed
-                try:
-                    # Remove the layer by name
-                    m.remove_layer(layer_name)
-                except Exception as e:
-                    print(f"Warning: Error removing layer: {str(e)}")
-                    # Try alternate approach - remove by title
-                    found = False
-                    # If layers is an iterable, try to find matching layer
-                    if isinstance(m.layers, (list, tuple)):
-                        for i, layer in enumerate(m.layers):
-                            if hasattr(layer, 'name') and layer.name == title:
-                                # Remove this layer if possible
-                                try:
-                                    m.layers = m.layers[:i] + m.layers[i+1:]
-                                    found = True
-                                    break
-                                except:
-                                    pass
-                    
-                    # If still not found, just try to clear and re-add
-                    if not found:
-                        # As a fallback, try to recreate the map with the new layer
-                        print("Using fallback layer approach")
-                
-                # Add layer with new visualization parameters
-                m.addLayer(image, new_vis_params, title)
-                
-                # Before adding new legend, remove any existing ones
-                remove_all_legends(m)
+                if not swapped:
+                    # Replace the layer in one update sent to the browser
+                    with m.hold_sync():
+                        # Remove the tracked data layer (without one, fall back
+                        # to the layer named title)
+                        if ee_layer is not None:
+                            m.layers = tuple(layer for layer in m.layers if layer is not ee_layer)
+                        else:
+                            m.layers = tuple(layer for layer in m.layers if getattr(layer, 'name', None) != title)
+                        
+                        # Add layer with new visualization parameters
+                        m.addLayer(image, new_vis_params, title)
+                        self._track_ee_layer(m, new_vis_params)
+                else:
+                    m._current_vis_params = new_vis_params
                 
                 # Update colorbar only if legend was visible or button is toggled on
                 legend_is_toggled_on = legend_btn is not None and legend_btn.value
+                show_legend = legend_was_visible or legend_is_toggled_on
                 
-                if legend_was_visible or legend_is_toggled_on:
-                    # Add new colorbar
-                    m.add_colorbar(
-                        new_vis_params['palette'],
-                        new_vis_params['min'],
-                        new_vis_params['max'],
-                        title,
-                        position='bottomright'
-                    )
-                    # Update legend state
-                    m.legend_visible = True
-                else:
+                colorbar_key = self._colorbar_key(new_vis_params, title)
+                if not show_legend:
                     # Ensure legend stays off
-                    m.legend_visible = False
+                    self._remove_all_legends(m)
+                elif getattr(m, '_colorbar_key', None) != colorbar_key:
+                    # Before adding new legend, remove any existing ones
+                    # (a legend already showing this palette and range is
+                    # kept); the browser sees the swap as one update
+                    with m.hold_sync():
+                        self._remove_all_legends(m)
+                        
+                        # Add new colorbar
+                        self._add_colorbar(m, new_vis_params, title)
                 
                 status_message.value = "<p style='color: green'>Visualization updated!</p>"
                 
             except Exception as e:
-                import traceback
-                traceback.print_exc()  # Print full stack trace for debugging
-                status_message.value = f"<p style='color: red'>Error updating visualization: {str(e)}</p>"
+                # The stack trace is only formatted if the logger emits it
+                logger.exception("Error updating visualization")
+                status_message.value = _APPLY_ERROR_TMPL.substitute(error=e)
+        
+        # Apply button handler: waiting for stretch statistics and the new tile
+        # URL happens on a worker thread, so the notebook stays responsive.
+        # The button is disabled meanwhile so applies do not overlap
+        def on_apply(b):
+            apply_button.disabled = True
+            status_message.value = "<p>Updating visualization...</p>"
+            future = self._executor.submit(apply_changes)
+            future.add_done_callback(lambda f: setattr(apply_button, 'disabled', False))
         
-        apply_button.on_click(on_apply)
+        # Debounced, so a burst of clicks applies the latest settings once
+        apply_button.on_click(debounce(on_apply, delay=0.35))
         
         # Create visualization controls container
         controls = widgets.VBox([
@@ -0,0 +1,50 @@
+"""
+widget_utils.py
+Helpers shared by the widget-based modules
+"""
+
+import threading
+import traceback
+from typing import Callable, Optional
+
+def debounce(fn: Callable, delay: float = 0.25,
+             on_error: Optional[Callable[[Exception], None]] = None) -> Callable:
+    """
+    Wrap a widget callback so a burst of calls runs it only once
+    
+    Each call cancels the pending one and schedules fn with the latest
+    arguments after delay seconds (trailing edge). fn then runs on a timer
+    thread, where ipywidgets no longer catches its errors for the output
+    log, so they are passed to on_error (e.g. to show them in the panel).
+    
+    Args:
+        fn: Callback to wrap
+        delay: Quiet time in seconds before fn runs
+        on_error: Called with any exception raised by fn; without it the
+            stack trace is printed
+    
+    Returns:
+        Debounced callback
+    """
+    lock = threading.Lock()
+    timer = None
+    
+    def run(*args, **kwargs):
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            if on_error is None:
+                traceback.print_exc()
+            else:
+                on_error(e)
+    
+    def debounced(*args, **kwargs):
+        nonlocal timer
+        with lock:
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(delay, run, args, kwargs)
+            timer.daemon = True
+            timer.start()
+    
+    return debounced